@@ -13,6 +13,7 @@ from robocorp_ls_core.protocols import (
 )
 from typing import Any, Union, Optional, List, Callable, Dict
 from robocorp_ls_core.callbacks import Callback
+from robocorp_ls_core.jsonrpc.json_codec import RawJson
 
 log = get_logger(__name__)
 
@@ -20,11 +21,28 @@ log = get_logger(__name__)
 class _MessageMatcher(object):
     def __init__(self):
         self.event = threading.Event()
-        self.msg = None
+        self.raw_msg = None
+
+    @property
+    def msg(self):
+        """
+        The message received (if its "result" wasn't decoded yet it's decoded
+        when it's first accessed).
+        """
+        msg = self.raw_msg
+        if msg is not None:
+            result = msg.get("result")
+            if result.__class__ is RawJson:
+                msg["result"] = result.loads()
+        return msg
+
+    @msg.setter
+    def msg(self, msg):
+        self.raw_msg = msg
 
     def notify(self, msg):
         # msg can be None if the communication was finished in the meanwhile.
-        self.msg = msg
+        self.raw_msg = msg
         self.event.set()
 
 
@@ -206,7 +224,7 @@ class _ReaderThread(threading.Thread):
         from robocorp_ls_core.options import Setup
 
         notify_matchers = []
-        log.debug("Will handle read message: %s" % (msg,))
+        log.debug("Will handle read message: %s", msg)
         with self._lock:
             for message_matcher in self._pattern_message_matchers.values():
                 if message_matcher.matches(msg):
@@ -14,7 +14,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import json
+from robocorp_ls_core.jsonrpc import json_codec
 import itertools
 from functools import partial
 from robocorp_ls_core.robotframework_log import get_logger
@@ -33,7 +33,7 @@ class BaseSchema(object):
         BaseSchema._next_dap_id = partial(next, itertools.count(1))
 
     def to_json(self, update_ids_to_dap=False):
-        return json.dumps(self.to_dict(update_ids_to_dap=update_ids_to_dap))
+        return json_codec.dumps(self.to_dict(update_ids_to_dap=update_ids_to_dap))
 
     def to_dict(self, update_ids_to_dap=False) -> dict:
         raise NotImplementedError("Must be overridden.")
@@ -139,10 +139,7 @@ def from_dict(dct, update_ids_from_dap=False, cls=None):
 
 
 def from_json(json_msg, update_ids_from_dap=False, on_dict_loaded=lambda dct: None):
-    if isinstance(json_msg, bytes):
-        json_msg = json_msg.decode("utf-8")
-
-    as_dict = json.loads(json_msg)
+    as_dict = json_codec.loads(json_msg)
     on_dict_loaded(as_dict)
     try:
         return from_dict(as_dict, update_ids_from_dap=update_ids_from_dap)
@@ -14364,6 +14364,316 @@ class EndSuiteEvent(BaseSchema):
         return dct
 
 
+@register_event('testProgress')
+@register
+class TestProgressEvent(BaseSchema):
+    """
+    Aggregated progress of the Robot Framework tests (sent instead of the startTest/endTest events when
+    the test results are written to a file).
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number (also known as message ID). For protocol messages of type 'request' this ID can be used to cancel the request."
+        },
+        "type": {
+            "type": "string",
+            "enum": [
+                "event"
+            ]
+        },
+        "event": {
+            "type": "string",
+            "enum": [
+                "testProgress"
+            ]
+        },
+        "body": {
+            "type": "object",
+            "properties": {
+                "passed": {
+                    "type": "integer",
+                    "description": "Number of tests which passed so far."
+                },
+                "failed": {
+                    "type": "integer",
+                    "description": "Number of tests which failed so far."
+                },
+                "skipped": {
+                    "type": "integer",
+                    "description": "Number of tests which were skipped so far."
+                },
+                "resultsFile": {
+                    "type": "string",
+                    "description": "The file with the test results (newline-delimited json)."
+                },
+                "resultsOffset": {
+                    "type": "integer",
+                    "description": "The number of bytes already written to the results file (contents up to this offset are complete lines)."
+                }
+            },
+            "required": [
+                "passed",
+                "failed",
+                "skipped",
+                "resultsFile",
+                "resultsOffset"
+            ]
+        }
+    }
+    __refs__ = set(['body'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, body, seq=-1, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string type: 
+        :param string event: 
+        :param TestProgressEventBody body: 
+        :param integer seq: Sequence number (also known as message ID). For protocol messages of type 'request' this ID can be used to cancel the request.
+        """
+        self.type = 'event'
+        self.event = 'testProgress'
+        if body is None:
+            self.body = TestProgressEventBody()
+        else:
+            self.body = TestProgressEventBody(update_ids_from_dap=update_ids_from_dap, **body) if body.__class__ !=  TestProgressEventBody else body
+        self.seq = seq
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        type = self.type  # noqa (assign to builtin)
+        event = self.event
+        body = self.body
+        seq = self.seq
+        dct = {
+            'type': type,
+            'event': event,
+            'body': body.to_dict(update_ids_to_dap=update_ids_to_dap),
+            'seq': seq,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register_request('testFailureDetails')
+@register
+class TestFailureDetailsRequest(BaseSchema):
+    """
+    Provides the details on a test failure referenced in the test results file.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number (also known as message ID). For protocol messages of type 'request' this ID can be used to cancel the request."
+        },
+        "type": {
+            "type": "string",
+            "enum": [
+                "request"
+            ]
+        },
+        "command": {
+            "type": "string",
+            "enum": [
+                "testFailureDetails"
+            ]
+        },
+        "arguments": {
+            "type": "TestFailureDetailsArguments"
+        }
+    }
+    __refs__ = set(['arguments'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string type: 
+        :param string command: 
+        :param TestFailureDetailsArguments arguments: 
+        :param integer seq: Sequence number (also known as message ID). For protocol messages of type 'request' this ID can be used to cancel the request.
+        """
+        self.type = 'request'
+        self.command = 'testFailureDetails'
+        if arguments is None:
+            self.arguments = TestFailureDetailsArguments()
+        else:
+            self.arguments = TestFailureDetailsArguments(update_ids_from_dap=update_ids_from_dap, **arguments) if arguments.__class__ !=  TestFailureDetailsArguments else arguments
+        self.seq = seq
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        type = self.type  # noqa (assign to builtin)
+        command = self.command
+        arguments = self.arguments
+        seq = self.seq
+        dct = {
+            'type': type,
+            'command': command,
+            'arguments': arguments.to_dict(update_ids_to_dap=update_ids_to_dap),
+            'seq': seq,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class TestFailureDetailsArguments(BaseSchema):
+    """
+    Arguments for 'testFailureDetails' request.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "failure": {
+            "type": "string",
+            "description": "The failure id (as referenced in the test results file)."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, failure, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string failure: The failure id (as referenced in the test results file).
+        """
+        self.failure = failure
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        failure = self.failure
+        dct = {
+            'failure': failure,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register_response('testFailureDetails')
+@register
+class TestFailureDetailsResponse(BaseSchema):
+    """
+    Response to 'testFailureDetails' request.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number (also known as message ID). For protocol messages of type 'request' this ID can be used to cancel the request."
+        },
+        "type": {
+            "type": "string",
+            "enum": [
+                "response"
+            ]
+        },
+        "request_seq": {
+            "type": "integer",
+            "description": "Sequence number of the corresponding request."
+        },
+        "success": {
+            "type": "boolean",
+            "description": "Outcome of the request.\nIf true, the request was successful and the 'body' attribute may contain the result of the request.\nIf the value is false, the attribute 'message' contains the error in short form and the 'body' may contain additional information (see 'ErrorResponse.body.error')."
+        },
+        "command": {
+            "type": "string",
+            "description": "The command requested."
+        },
+        "message": {
+            "type": "string",
+            "description": "Contains the raw error in short form if 'success' is false.\nThis raw error might be interpreted by the frontend and is not shown in the UI.\nSome predefined values exist.",
+            "_enum": [
+                "cancelled"
+            ],
+            "enumDescriptions": [
+                "request was cancelled."
+            ]
+        },
+        "body": {
+            "type": "object",
+            "properties": {
+                "message": {
+                    "type": "string",
+                    "description": "Status message of the failed test."
+                },
+                "failed_keywords": {
+                    "type": "array",
+                    "items": {
+                        "type": "string"
+                    },
+                    "description": "List of failed keywords."
+                }
+            },
+            "required": []
+        }
+    }
+    __refs__ = set(['body'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string type: 
+        :param integer request_seq: Sequence number of the corresponding request.
+        :param boolean success: Outcome of the request.
+        If true, the request was successful and the 'body' attribute may contain the result of the request.
+        If the value is false, the attribute 'message' contains the error in short form and the 'body' may contain additional information (see 'ErrorResponse.body.error').
+        :param string command: The command requested.
+        :param TestFailureDetailsResponseBody body: 
+        :param integer seq: Sequence number (also known as message ID). For protocol messages of type 'request' this ID can be used to cancel the request.
+        :param string message: Contains the raw error in short form if 'success' is false.
+        This raw error might be interpreted by the frontend and is not shown in the UI.
+        Some predefined values exist.
+        """
+        self.type = 'response'
+        self.request_seq = request_seq
+        self.success = success
+        self.command = command
+        if body is None:
+            self.body = TestFailureDetailsResponseBody()
+        else:
+            self.body = TestFailureDetailsResponseBody(update_ids_from_dap=update_ids_from_dap, **body) if body.__class__ !=  TestFailureDetailsResponseBody else body
+        self.seq = seq
+        self.message = message
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        type = self.type  # noqa (assign to builtin)
+        request_seq = self.request_seq
+        success = self.success
+        command = self.command
+        body = self.body
+        seq = self.seq
+        message = self.message
+        dct = {
+            'type': type,
+            'request_seq': request_seq,
+            'success': success,
+            'command': command,
+            'body': body.to_dict(update_ids_to_dap=update_ids_to_dap),
+            'seq': seq,
+        }
+        if message is not None:
+            dct['message'] = message
+        dct.update(self.kwargs)
+        return dct
+
+
 @register_request('setDebuggerProperty')
 @register
 class SetDebuggerPropertyRequest(BaseSchema):
@@ -18079,6 +18389,123 @@ class EndSuiteEventBody(BaseSchema):
         return dct
 
 
+@register
+class TestProgressEventBody(BaseSchema):
+    """
+    "body" of TestProgressEvent
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "passed": {
+            "type": "integer",
+            "description": "Number of tests which passed so far."
+        },
+        "failed": {
+            "type": "integer",
+            "description": "Number of tests which failed so far."
+        },
+        "skipped": {
+            "type": "integer",
+            "description": "Number of tests which were skipped so far."
+        },
+        "resultsFile": {
+            "type": "string",
+            "description": "The file with the test results (newline-delimited json)."
+        },
+        "resultsOffset": {
+            "type": "integer",
+            "description": "The number of bytes already written to the results file (contents up to this offset are complete lines)."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, passed, failed, skipped, resultsFile, resultsOffset, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param integer passed: Number of tests which passed so far.
+        :param integer failed: Number of tests which failed so far.
+        :param integer skipped: Number of tests which were skipped so far.
+        :param string resultsFile: The file with the test results (newline-delimited json).
+        :param integer resultsOffset: The number of bytes already written to the results file (contents up to this offset are complete lines).
+        """
+        self.passed = passed
+        self.failed = failed
+        self.skipped = skipped
+        self.resultsFile = resultsFile
+        self.resultsOffset = resultsOffset
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        passed = self.passed
+        failed = self.failed
+        skipped = self.skipped
+        resultsFile = self.resultsFile
+        resultsOffset = self.resultsOffset
+        dct = {
+            'passed': passed,
+            'failed': failed,
+            'skipped': skipped,
+            'resultsFile': resultsFile,
+            'resultsOffset': resultsOffset,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class TestFailureDetailsResponseBody(BaseSchema):
+    """
+    "body" of TestFailureDetailsResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "message": {
+            "type": "string",
+            "description": "Status message of the failed test."
+        },
+        "failed_keywords": {
+            "type": "array",
+            "items": {
+                "type": "string"
+            },
+            "description": "List of failed keywords."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, message=None, failed_keywords=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string message: Status message of the failed test.
+        :param array failed_keywords: List of failed keywords.
+        """
+        self.message = message
+        self.failed_keywords = failed_keywords
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        message = self.message
+        failed_keywords = self.failed_keywords
+        if failed_keywords and hasattr(failed_keywords[0], "to_dict"):
+            failed_keywords = [x.to_dict() for x in failed_keywords]
+        dct = {
+        }
+        if message is not None:
+            dct['message'] = message
+        if failed_keywords is not None:
+            dct['failed_keywords'] = failed_keywords
+        dct.update(self.kwargs)
+        return dct
+
+
 @register
 class PydevdSystemInfoResponseBody(BaseSchema):
     """
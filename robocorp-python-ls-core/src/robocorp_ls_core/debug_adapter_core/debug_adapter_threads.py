@@ -26,7 +26,7 @@ writer_thread just keeps on sending any message posted to the queue it receives.
 from functools import partial
 import itertools
 from robocorp_ls_core.robotframework_log import get_logger, get_log_level
-import json
+from robocorp_ls_core.jsonrpc import json_codec
 from typing import Optional, Dict
 
 
@@ -85,7 +85,7 @@ def read(stream, debug_prefix=b"read") -> Optional[Dict]:
         log.debug((debug_prefix + b": %s" % (body,)).decode("utf-8", "replace"))
 
     try:
-        return json.loads(body.decode("utf-8"))
+        return json_codec.loads(body)
     except:
         raise RuntimeError(f"Error reading: {body!r}")
 
@@ -183,7 +183,7 @@ def writer_thread_no_auto_seq(
             if isinstance(to_write, dict):
                 assert "seq" in to_write
                 try:
-                    to_write = json.dumps(to_write)
+                    to_write = json_codec.dumps_bytes(to_write)
                 except:
                     log.exception("Error serializing %s to json.", to_write)
                     continue
@@ -199,14 +199,14 @@ def writer_thread_no_auto_seq(
                         log.exception("Error serializing %s to json.", to_write)
                         continue
 
-            if get_log_level() > 1:
-                log.debug(debug_prefix + ": %s\n", to_write)
-
             if to_write.__class__ == bytes:
                 as_bytes = to_write
             else:
                 as_bytes = to_write.encode("utf-8")
 
+            if get_log_level() > 1:
+                log.debug(debug_prefix + ": %s\n", as_bytes.decode("utf-8", "replace"))
+
             stream.write(
                 ("Content-Length: %s\r\n\r\n" % (len(as_bytes))).encode("ascii")
             )
@@ -235,7 +235,7 @@ def writer_thread(stream, queue, debug_prefix="write", update_ids_to_dap=False):
             if isinstance(to_write, dict):
                 to_write["seq"] = _next_seq()
                 try:
-                    to_write = json.dumps(to_write)
+                    to_write = json_codec.dumps_bytes(to_write)
                 except:
                     log.exception("Error serializing %s to json.", to_write)
                     continue
@@ -251,14 +251,14 @@ def writer_thread(stream, queue, debug_prefix="write", update_ids_to_dap=False):
                         log.exception("Error serializing %s to json.", to_write)
                         continue
 
-            if get_log_level() > 1:
-                log.debug(debug_prefix + ": %s\n", to_write)
-
             if to_write.__class__ == bytes:
                 as_bytes = to_write
             else:
                 as_bytes = to_write.encode("utf-8")
 
+            if get_log_level() > 1:
+                log.debug(debug_prefix + ": %s\n", as_bytes.decode("utf-8", "replace"))
+
             stream.write(
                 ("Content-Length: %s\r\n\r\n" % (len(as_bytes))).encode("ascii")
             )
@@ -0,0 +1,201 @@
+"""
+The json encoder/decoder used by the language server/debug adapter transports.
+
+An accelerated library (orjson or ujson) is used if it's importable and the
+stdlib `json` otherwise. The codec may be forced with the
+`ROBOCORP_LS_JSON_CODEC` environment variable (`orjson`, `ujson` or `json`).
+
+Note: whenever the accelerated library can't deal with some message (i.e.:
+integers bigger than 64 bits, NaN/Infinity or invalid json accepted by the
+stdlib), the stdlib `json` is used for that message, so, the results for the
+objects accepted by the stdlib are the same ones which the stdlib would provide
+(the only difference being that non-ascii chars are not escaped when encoding
+with an accelerated library). Objects which the stdlib rejects may still be
+accepted by an accelerated library (i.e.: orjson writes the value of `Enum`
+members).
+"""
+
+import json
+import math
+import os
+from typing import Any, Union
+
+from robocorp_ls_core.robotframework_log import get_logger
+
+log = get_logger(__name__)
+
+ENV_JSON_CODEC = "ROBOCORP_LS_JSON_CODEC"
+
+
+def _json_loads(data):
+    if data.__class__ is not str:
+        data = str(data, "utf-8")
+    return json.loads(data)
+
+
+def _json_dumps(obj, sort_keys=False) -> str:
+    return json.dumps(obj, sort_keys=sort_keys)
+
+
+def _json_dumps_bytes(obj, sort_keys=False) -> bytes:
+    return json.dumps(obj, sort_keys=sort_keys).encode("utf-8")
+
+
+def _has_non_finite_float(obj) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite_float(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite_float(v) for v in obj)
+    return False
+
+
+def _create_orjson_codec():
+    import orjson  # type: ignore
+
+    # Datetimes and dataclasses would be converted by orjson (but they're not
+    # accepted by the stdlib, so, keep the same behavior).
+    option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    option_sort_keys = option | orjson.OPT_SORT_KEYS
+    orjson_dumps = orjson.dumps
+    orjson_loads = orjson.loads
+
+    def loads(data):
+        try:
+            # Note: orjson accepts str, bytes, bytearray and memoryview (so,
+            # it's possible to decode directly from a buffer).
+            return orjson_loads(data)
+        except ValueError:
+            # i.e.: NaN/Infinity, which the stdlib accepts.
+            return _json_loads(data)
+
+    def dumps_bytes(obj, sort_keys=False) -> bytes:
+        try:
+            ret = orjson_dumps(obj, option=option_sort_keys if sort_keys else option)
+        except TypeError:
+            # i.e.: integers bigger than 64 bits or non-str keys.
+            return _json_dumps_bytes(obj, sort_keys=sort_keys)
+
+        if b"null" in ret and _has_non_finite_float(obj):
+            # orjson writes NaN/Infinity as null.
+            return _json_dumps_bytes(obj, sort_keys=sort_keys)
+        return ret
+
+    def dumps(obj, sort_keys=False) -> str:
+        return dumps_bytes(obj, sort_keys=sort_keys).decode("utf-8")
+
+    return loads, dumps, dumps_bytes
+
+
+def _create_ujson_codec():
+    import ujson  # type: ignore
+
+    ujson_dumps = ujson.dumps
+    ujson_loads = ujson.loads
+
+    def loads(data):
+        if data.__class__ is memoryview:
+            data = data.tobytes()
+        try:
+            return ujson_loads(data)
+        except ValueError:
+            return _json_loads(data)
+
+    def dumps(obj, sort_keys=False) -> str:
+        try:
+            return ujson_dumps(
+                obj,
+                ensure_ascii=False,
+                escape_forward_slashes=False,
+                sort_keys=sort_keys,
+                reject_bytes=True,
+            )
+        except (TypeError, OverflowError, ValueError):
+            return _json_dumps(obj, sort_keys=sort_keys)
+
+    def dumps_bytes(obj, sort_keys=False) -> bytes:
+        return dumps(obj, sort_keys=sort_keys).encode("utf-8")
+
+    return loads, dumps, dumps_bytes
+
+
+_CODEC_NAME_TO_FACTORY = {
+    "orjson": _create_orjson_codec,
+    "ujson": _create_ujson_codec,
+}
+
+
+def _select_codec():
+    requested = os.environ.get(ENV_JSON_CODEC, "").strip().lower()
+    if requested in ("json", "stdlib"):
+        return "json", (_json_loads, _json_dumps, _json_dumps_bytes)
+
+    if requested:
+        if requested in _CODEC_NAME_TO_FACTORY:
+            names = [requested]
+        else:
+            log.info("Unexpected json codec requested: %s", requested)
+            names = list(_CODEC_NAME_TO_FACTORY)
+    else:
+        names = list(_CODEC_NAME_TO_FACTORY)
+
+    for name in names:
+        try:
+            return name, _CODEC_NAME_TO_FACTORY[name]()
+        except ImportError:
+            pass
+        except Exception:
+            log.exception("Error creating json codec: %s", name)
+
+    return "json", (_json_loads, _json_dumps, _json_dumps_bytes)
+
+
+CODEC_NAME: str
+CODEC_NAME, (_loads, _dumps, _dumps_bytes) = _select_codec()
+
+
+class RawJson(object):
+    """
+    Some json contents which were already serialized (i.e.: the "params" or
+    "result" of a message which is forwarded as is between processes).
+
+    JsonRpcStreamWriter writes the contents as is when a RawJson is the
+    "params" or the "result" of a message.
+    """
+
+    __slots__ = ["data"]
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    @classmethod
+    def from_obj(cls, obj: Any) -> "RawJson":
+        return RawJson(dumps_bytes(obj))
+
+    def loads(self) -> Any:
+        return loads(self.data)
+
+    def __repr__(self):
+        return "RawJson(%s)" % (self.data.decode("utf-8", "replace"),)
+
+    __str__ = __repr__
+
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """
+    :param data:
+        The json contents (if not a str it must be utf-8 encoded).
+    """
+    return _loads(data)
+
+
+def dumps(obj: Any, sort_keys: bool = False) -> str:
+    return _dumps(obj, sort_keys=sort_keys)
+
+
+def dumps_bytes(obj: Any, sort_keys: bool = False) -> bytes:
+    """
+    :return: the json for the given object encoded as utf-8.
+    """
+    return _dumps_bytes(obj, sort_keys=sort_keys)
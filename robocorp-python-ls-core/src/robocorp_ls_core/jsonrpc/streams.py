@@ -14,11 +14,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import json
+import re
 import threading
-from robocorp_ls_core.robotframework_log import get_logger
+from functools import partial
+from robocorp_ls_core.robotframework_log import get_logger, get_log_level
 from typing import Optional
-import json
 from robocorp_ls_core.options import BaseOptions
+from robocorp_ls_core.jsonrpc import json_codec
 
 log = get_logger(__name__)
 
@@ -81,9 +84,206 @@ def _read_len(stream, content_length) -> bytes:
         # len(buf) < content_length (just keep on going).
 
 
+# The initial size of the buffer used to read messages.
+_INITIAL_BUFFER_SIZE = 64 * 1024
+
+# After a message bigger than this is read, the buffer is shrunk back to the
+# initial size (so that a single multi-MB message doesn't keep a multi-MB buffer
+# alive for the whole session).
+_MAX_RETAINED_BUFFER_SIZE = 1024 * 1024
+
+# The maximum size for the headers of a message.
+_MAX_HEADERS_SIZE = 64 * 1024
+
+
+def _parse_content_length(headers: bytes) -> int:
+    content_length = None
+    for line in headers.split(b"\r\n"):
+        name, sep, value = line.partition(b":")
+        if not sep:
+            raise RuntimeError(
+                "Invalid header line: {}.".format(line.decode("ascii", "replace"))
+            )
+        if name.strip().lower() == b"content-length":
+            content_length = int(value.strip())
+
+    if content_length is None:
+        raise RuntimeError(
+            "Content-Length not found in headers: {}.".format(
+                headers.decode("ascii", "replace")
+            )
+        )
+    return content_length
+
+
+class _MessageReader(object):
+    """
+    Reads the messages from a stream into a bytearray which is reused among
+    messages (the stream is read with `readinto1`/`readinto`, so, it doesn't
+    need to be buffered).
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+
+        readinto = getattr(stream, "readinto1", None)
+        if readinto is None:
+            readinto = getattr(stream, "readinto", None)
+        if readinto is None:
+            readinto = self._readinto_from_read
+        self._readinto = readinto
+
+        self._buf = bytearray(_INITIAL_BUFFER_SIZE)
+        self._view = memoryview(self._buf)
+
+        # The contents not consumed are at self._buf[self._start:self._end].
+        self._start = 0
+        self._end = 0
+
+    def _readinto_from_read(self, view) -> int:
+        stream = self._stream
+        read = getattr(stream, "read1", None) or stream.readline
+        data = read(len(view))
+        view[: len(data)] = data
+        return len(data)
+
+    def _set_capacity(self, capacity: int) -> None:
+        pending = self._end - self._start
+        buf = bytearray(capacity)
+        buf[:pending] = self._view[self._start : self._end]
+        self._buf = buf
+        self._view = memoryview(buf)
+        self._start = 0
+        self._end = pending
+
+    def _reserve(self, size: int) -> None:
+        """
+        Makes sure that `size` bytes starting at `self._start` fit in the buffer.
+        """
+        if self._start + size <= len(self._buf):
+            return
+
+        if size <= len(self._buf):
+            # Just move the contents to the start of the buffer.
+            # Note: copied to a new object first as the ranges may overlap.
+            pending = self._end - self._start
+            self._buf[:pending] = bytes(self._view[self._start : self._end])
+            self._start = 0
+            self._end = pending
+        else:
+            self._set_capacity(max(size, len(self._buf) * 2))
+
+    def _read_more(self) -> bool:
+        """
+        :return: False if the stream reached EOF and True otherwise.
+        """
+        if self._end == len(self._buf):
+            self._reserve(self._end - self._start + _INITIAL_BUFFER_SIZE)
+
+        read = self._readinto(self._view[self._end :])
+        if not read:
+            return False
+        self._end += read
+        return True
+
+    def read_message(self) -> Optional[memoryview]:
+        """
+        :return: the contents of the next message or None if EOF was reached.
+
+        :note: the memoryview returned is only valid until the next call to
+            `read_message` (the buffer is reused).
+        """
+        if self._start == self._end:
+            self._start = self._end = 0
+            if len(self._buf) > _MAX_RETAINED_BUFFER_SIZE:
+                self._set_capacity(_INITIAL_BUFFER_SIZE)
+
+        search_from = self._start
+        while True:
+            headers_end = self._buf.find(b"\r\n\r\n", search_from, self._end)
+            if headers_end != -1:
+                break
+
+            if self._end - self._start > _MAX_HEADERS_SIZE:
+                raise RuntimeError(
+                    "Headers bigger than %s bytes found." % (_MAX_HEADERS_SIZE,)
+                )
+            # The separator may have been partially read already.
+            search_from = max(self._start, self._end - 3)
+            if not self._read_more():
+                return None  # EOF
+
+        if headers_end == self._start:
+            raise RuntimeError("Got message without headers.")
+
+        content_length = _parse_content_length(
+            bytes(self._view[self._start : headers_end])
+        )
+        self._start = headers_end + 4
+
+        if self._end - self._start < content_length:
+            self._reserve(content_length)
+            while self._end - self._start < content_length:
+                if not self._read_more():
+                    return None  # EOF
+
+        body = self._view[self._start : self._start + content_length]
+        self._start += content_length
+        return body
+
+
+# Matches the start of a response with a "result" (note: the "result" must be
+# the last key, which is always the case for messages written by the
+# JsonRpcStreamWriter for the Endpoint: the "result" is added last and is also
+# the last one when the keys are sorted).
+_RESPONSE_WITH_RESULT_PREFIX = re.compile(
+    rb'\{\s*(?:"jsonrpc"\s*:\s*"2\.0"\s*,\s*"id"\s*:\s*(-?\d+)'
+    rb'|"id"\s*:\s*(-?\d+)\s*,\s*"jsonrpc"\s*:\s*"2\.0")'
+    rb'\s*,\s*"result"\s*:'
+)
+
+_JSON_WHITESPACE = b" \t\r\n"
+
+
+def _parse_response_with_raw_result(body) -> Optional[dict]:
+    """
+    :return: the response message with the "result" as a RawJson (without
+    decoding it) or None if the body isn't a response with a result.
+    """
+    match = _RESPONSE_WITH_RESULT_PREFIX.match(body)
+    if match is None:
+        return None
+
+    start = match.end()
+    end = len(body) - 1
+    while end > start and body[end] in _JSON_WHITESPACE:
+        end -= 1
+
+    if body[end] != ord("}"):
+        return None
+
+    data = bytes(body[start:end]).strip(_JSON_WHITESPACE)
+    if not data:
+        return None
+
+    msg_id = match.group(1) or match.group(2)
+    return {
+        "jsonrpc": "2.0",
+        "id": int(msg_id),
+        "result": json_codec.RawJson(data),
+    }
+
+
 class JsonRpcStreamReader(object):
-    def __init__(self, rfile):
+    def __init__(self, rfile, raw_results=False):
+        """
+        :param raw_results:
+            If True, the "result" of responses is not decoded (it's passed as a
+            RawJson in the message given to the consumer). This is used when the
+            result is just forwarded to another process.
+        """
         self._rfile = rfile
+        self._raw_results = raw_results
 
     def close(self):
         self._rfile.close()
@@ -95,28 +295,44 @@ class JsonRpcStreamReader(object):
             message_consumer (fn): function that is passed each message as it is read off the socket.
         """
         try:
+            message_reader = _MessageReader(self._rfile)
             while not self._rfile.closed:
-                data = read(self._rfile)
-                if data is None:
-                    log.debug("Read: %s", data)
+                body = message_reader.read_message()
+                if body is None:
+                    log.debug("Read: %s", None)
                     return
 
-                try:
-                    msg = json.loads(data)
-                except:
-                    log.exception("Failed to parse JSON message %s", data)
-                    continue
+                # Note: decode directly from the buffer (without an intermediary
+                # bytes object). The buffer is only valid until the next read,
+                # so, the contents are only kept as a str if needed for logging.
+                msg = None
+                if self._raw_results:
+                    msg = _parse_response_with_raw_result(body)
 
-                if isinstance(msg, dict):
-                    if msg.get("command") not in BaseOptions.HIDE_COMMAND_MESSAGES:
-                        log.debug("Read: %s", data)
-                else:
-                    log.debug("Read (non dict data): %s", data)
+                if msg is None:
+                    try:
+                        msg = json_codec.loads(body)
+                    except:
+                        log.exception(
+                            "Failed to parse JSON message %s",
+                            str(body, "utf-8", "replace"),
+                        )
+                        continue
+
+                data = None
+                if get_log_level() >= 2:
+                    data = str(body, "utf-8")
+                    if isinstance(msg, dict):
+                        if msg.get("command") not in BaseOptions.HIDE_COMMAND_MESSAGES:
+                            log.debug("Read: %s", data)
+                    else:
+                        log.debug("Read (non dict data): %s", data)
+                del body
 
                 try:
                     message_consumer(msg)
                 except:
-                    log.exception("Error processing JSON message %s", data)
+                    log.exception("Error processing JSON message %s", data or msg)
                     continue
         except ConnectionResetError:
             pass  # Just ignore this one (connection was closed)
@@ -132,6 +348,39 @@ class JsonRpcStreamWriter(object):
         self._wfile = wfile
         self._wfile_lock = threading.Lock()
         self._json_dumps_args = json_dumps_args
+        if set(json_dumps_args) - {"sort_keys"}:
+            # Some argument only the stdlib json is able to handle.
+            self._dumps_bytes = self._stdlib_dumps_bytes
+        else:
+            self._dumps_bytes = partial(
+                json_codec.dumps_bytes,
+                sort_keys=bool(json_dumps_args.get("sort_keys")),
+            )
+
+    def _dumps_message(self, message) -> bytes:
+        if message.__class__ is dict:
+            for key in ("result", "params"):
+                raw = message.get(key)
+                if raw.__class__ is json_codec.RawJson:
+                    # Already serialized: just add it to the envelope.
+                    message = message.copy()
+                    del message[key]
+                    envelope = self._dumps_bytes(message)
+                    assert envelope.endswith(b"}")
+                    return b"".join(
+                        (
+                            envelope[:-1],
+                            b"," if len(message) > 0 else b"",
+                            b'"%s":' % (key.encode("ascii"),),
+                            raw.data,
+                            b"}",
+                        )
+                    )
+
+        return self._dumps_bytes(message)
+
+    def _stdlib_dumps_bytes(self, message) -> bytes:
+        return json.dumps(message, **self._json_dumps_args).encode("utf-8")
 
     def close(self):
         log.debug("Will close writer")
@@ -144,15 +393,22 @@ class JsonRpcStreamWriter(object):
                 log.debug("Unable to write %s (file already closed).", (message,))
                 return False
             try:
-                if isinstance(message, dict):
-                    if message.get("command") not in BaseOptions.HIDE_COMMAND_MESSAGES:
-                        log.debug("Writing: %s", message)
-                else:
-                    log.debug("Writing (non dict message): %s", message)
+                as_bytes = self._dumps_message(message)
 
-                body = json.dumps(message, **self._json_dumps_args)
+                if get_log_level() >= 2:
+                    # Note: log the body already serialized (the message may be
+                    # big and it's not worth formatting it again).
+                    if isinstance(message, dict):
+                        if (
+                            message.get("command")
+                            not in BaseOptions.HIDE_COMMAND_MESSAGES
+                        ):
+                            log.debug("Writing: %s", as_bytes.decode("utf-8"))
+                    else:
+                        log.debug(
+                            "Writing (non dict message): %s", as_bytes.decode("utf-8")
+                        )
 
-                as_bytes = body.encode("utf-8")
                 stream = self._wfile
                 content_len_as_str = "Content-Length: %s\r\n\r\n" % len(as_bytes)
                 content_len_bytes = content_len_as_str.encode("ascii")
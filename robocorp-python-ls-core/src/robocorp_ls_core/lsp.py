@@ -733,6 +733,34 @@ class FoldingRangeTypedDict(TypedDict, total=False):
     kind: Optional[str]
 
 
+class SemanticTokensTypedDict(TypedDict, total=False):
+    # An optional result id. If provided and clients support delta updating
+    # the client will include the result id in the next semantic token request.
+    resultId: Optional[str]
+
+    # The actual tokens (5 integers per token: deltaLine, deltaStartChar,
+    # length, tokenType, tokenModifiers).
+    data: List[int]
+
+
+class SemanticTokensEditTypedDict(TypedDict, total=False):
+    # The start offset of the edit (in the integers array).
+    start: int
+
+    # The count of elements to remove.
+    deleteCount: int
+
+    # The elements to insert.
+    data: List[int]
+
+
+class SemanticTokensDeltaTypedDict(TypedDict, total=False):
+    resultId: Optional[str]
+
+    # The semantic token edits to transform a previous result into a new result.
+    edits: List[SemanticTokensEditTypedDict]
+
+
 class Location(_Base):
     def __init__(self, uri, range):
         """
@@ -165,6 +165,10 @@ class IIdMessageMatcher(Generic[T], Protocol):
     event: threading.Event
     msg: T
 
+    # The message as received (if the reader was created with raw_results=True
+    # the "result" may still be a RawJson).
+    raw_msg: Any
+
 
 COMMUNICATION_DROPPED = CommunicationDropped()
 
@@ -279,6 +283,13 @@ class IRobotFrameworkApiClient(ILanguageServerClientBase, Protocol):
     def request_lint(self, doc_uri: str) -> Optional[IIdMessageMatcher]:
         pass
 
+    def request_lint_workspace(
+        self, max_workers: Optional[int] = None
+    ) -> Optional[IIdMessageMatcher]:
+        """
+        :Note: async complete.
+        """
+
     def request_semantic_tokens_full(
         self, text_document: "TextDocumentTypedDict"
     ) -> Optional[IIdMessageMatcher]:
@@ -336,6 +347,13 @@ class IRobotFrameworkApiClient(ILanguageServerClientBase, Protocol):
         :Note: async complete.
         """
 
+    def request_range_source_format(
+        self, text_document, range, options
+    ) -> Optional[IIdMessageMatcher]:
+        """
+        :Note: async complete.
+        """
+
     def request_signature_help(
         self, doc_uri: str, line: int, col: int
     ) -> Optional[IIdMessageMatcher]:
@@ -1,7 +1,9 @@
+from collections import OrderedDict
 import os.path
 from pathlib import Path
 import sys
-from typing import List, Dict
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from robocorp_ls_core.robotframework_log import get_logger
 
@@ -25,25 +27,141 @@ def _import_robocop():
     log.info("Robocop module: %s", robocop)
 
 
+# The names of the files Robocop uses to load its configuration.
+_CONFIG_FILE_NAMES = (".robocop", "pyproject.toml")
+
+# The maximum number of roots for which a runner is kept.
+_MAX_CACHED_RUNNERS = 20
+
+
+def _find_file_in_project_root(root: Path, config_name: str) -> Path:
+    # Note: mimics `robocop.config.Config.find_file_in_project_root`.
+    for parent in (root, *root.parents):
+        if (parent / ".git").exists() or (parent / config_name).is_file():
+            return parent / config_name
+    return parent / config_name
+
+
+def _get_config_files_key(root: Path) -> tuple:
+    """
+    :return: a key with the configuration files which Robocop would load for
+        the given root (along with their mtime/size), so, if it changes the
+        configuration must be loaded again.
+    """
+    ret: List[Tuple[str, Optional[float], Optional[int]]] = []
+    for config_name in _CONFIG_FILE_NAMES:
+        config_path = _find_file_in_project_root(root, config_name)
+        try:
+            stat = config_path.stat()
+        except OSError:
+            ret.append((str(config_path), None, None))
+        else:
+            ret.append((str(config_path), stat.st_mtime, stat.st_size))
+    return tuple(ret)
+
+
+class RobocopRunner(object):
+    """
+    Keeps a `robocop.Robocop` with the configuration and checkers loaded for
+    a given root (which may be used to check many files).
+    """
+
+    def __init__(self, root: Path):
+        _import_robocop()
+
+        import robocop
+        from robocop.config import Config
+
+        self.root = root
+        # Note: get the key before loading the config (so that a change while
+        # loading it makes the runner be recreated).
+        self.config_files_key = _get_config_files_key(root)
+        self._lock = threading.Lock()
+
+        config = Config(root=root)
+        self._robocop_runner = robocop.Robocop(config=config)
+        self._robocop_runner.reload_config()
+
+    def is_valid(self) -> bool:
+        return self.config_files_key == _get_config_files_key(self.root)
+
+    def run_check(self, ast_model, filename: str, source: str) -> List[Dict]:
+        """
+        :return: the issues found as LSP diagnostics.
+        """
+        from robocop.utils import issues_to_lsp_diagnostic
+
+        # The runner (and its checkers) keep the state of the file being
+        # checked, so, only one file may be checked at a time.
+        with self._lock:
+            issues = self._robocop_runner.run_check(ast_model, filename, source)
+        return issues_to_lsp_diagnostic(issues)
+
+
+_runners_lock = threading.Lock()
+_root_to_runner: "OrderedDict[str, RobocopRunner]" = OrderedDict()
+
+
+def _get_root(project_root: Path, filename: str) -> Path:
+    filename_parent = Path(filename).parent
+    if filename_parent.exists():
+        return filename_parent
+    # Unsaved files.
+    return Path(project_root)
+
+
+def get_robocop_runner(project_root: Path, filename: str) -> RobocopRunner:
+    """
+    :return: the (cached) runner to check the given file (the runner is only
+        recreated if the Robocop configuration files which apply to it change).
+    """
+    root = _get_root(project_root, filename)
+    key = str(root)
+    with _runners_lock:
+        runner = _root_to_runner.get(key)
+        if runner is not None:
+            _root_to_runner.move_to_end(key)
+
+    if runner is not None and runner.is_valid():
+        return runner
+
+    runner = RobocopRunner(root)
+    with _runners_lock:
+        _root_to_runner[key] = runner
+        _root_to_runner.move_to_end(key)
+        while len(_root_to_runner) > _MAX_CACHED_RUNNERS:
+            _root_to_runner.popitem(last=False)
+    return runner
+
+
+def clear_robocop_runners_cache() -> None:
+    with _runners_lock:
+        _root_to_runner.clear()
+
+
 def collect_robocop_diagnostics(
     project_root: Path, ast_model, filename: str, source: str
 ) -> List[Dict]:
+    runner = get_robocop_runner(project_root, filename)
+    return runner.run_check(ast_model, filename, source)
 
-    _import_robocop()
 
-    import robocop
-    from robocop.config import Config
-    from robocop.utils import issues_to_lsp_diagnostic
+def collect_robocop_diagnostics_batch(
+    project_root: Path, files: Sequence[Tuple[Any, str, str]]
+) -> List[List[Dict]]:
+    """
+    :param files:
+        A sequence with tuple(ast_model, filename, source) for the files to be
+        checked (the ast_model is the already-parsed model of the file).
 
-    filename_parent = Path(filename).parent
-    if filename_parent.exists():
-        config = Config(root=filename_parent)
-    else:
-        # Unsaved files.
-        config = Config(root=project_root)
-    robocop_runner = robocop.Robocop(config=config)
-    robocop_runner.reload_config()
-
-    issues = robocop_runner.run_check(ast_model, filename, source)
-    diag_issues = issues_to_lsp_diagnostic(issues)
-    return diag_issues
+    :return: the diagnostics for each file (in the same order as `files`).
+    """
+    root_to_runner: Dict[str, RobocopRunner] = {}
+    ret = []
+    for ast_model, filename, source in files:
+        key = str(_get_root(project_root, filename))
+        runner = root_to_runner.get(key)
+        if runner is None:
+            runner = root_to_runner[key] = get_robocop_runner(project_root, filename)
+        ret.append(runner.run_check(ast_model, filename, source))
+    return ret
@@ -45,6 +45,14 @@ except:
     pass
 
 
+def _trim_arg(arg):
+    if isinstance(arg, str) and len(arg) > MAX_LOG_MSG_SIZE:
+        return (
+            f"{arg[:MAX_LOG_MSG_SIZE]} ... <trimmed {len(arg)} chars> ... {arg[-200:]}"
+        )
+    return arg
+
+
 class _LogConfig(object):
 
     __slots__ = ["_lock", "__stream", "prefix", "log_level", "_log_file", "pid"]
@@ -178,6 +186,10 @@ class _Logger(object):
         msg = _as_str(msg)
         if args:
             args = tuple(_as_str(arg) for arg in args)
+            if trim:
+                # Trim big strings before formatting (the message would be
+                # trimmed afterwards anyways).
+                args = tuple(_trim_arg(arg) for arg in args)
             try:
                 message = msg % args
             except:
@@ -491,7 +491,8 @@ class Workspace(object):
 
         # Note: don't mutate an existing doc, always create a new one based on it
         # (so, existing references won't have racing conditions).
-        new_doc = self._create_document(doc_uri, doc.source, text_doc["version"])
+        new_doc = self._create_document(doc_uri, "", text_doc["version"])
+        new_doc._set_contents_from(doc)
         new_doc.apply_change(change)
         self._docs[doc_uri] = new_doc
         return new_doc
@@ -553,8 +554,10 @@ class Document(object):
         self.version = version
         self.path = uris.to_fs_path(uri)  # Note: may be None.
 
+        self.__source: Optional[str] = None
+        self.__lines: Optional[Tuple[str, ...]] = None
+        self.__line_start_offsets: Optional[List[int]] = None
         self._source = source
-        self.__line_start_offsets = None
 
         # Only set when the source is read from disk.
         self._source_mtime = -1
@@ -592,11 +595,18 @@ class Document(object):
         return DocumentSelection(self, line, col)
 
     @property
-    def _source(self) -> str:
-        return self.__source
+    def _source(self) -> Optional[str]:
+        source = self.__source
+        if source is None:
+            # After an incremental change only the lines are available (the
+            # source is only joined when actually requested).
+            lines = self.__lines
+            if lines is not None:
+                source = self.__source = "".join(lines)
+        return source
 
     @_source.setter
-    def _source(self, source: str) -> None:
+    def _source(self, source: Optional[str]) -> None:
         # i.e.: when the source is set, reset the lines.
         self._check_in_mutate_thread()
         if self.immutable:
@@ -606,6 +616,42 @@ class Document(object):
         self.__source = source
         self._clear_caches()
 
+    def _set_lines(self, lines: Tuple[str, ...], first_changed_line: int) -> None:
+        """
+        Sets the contents of the document based on its lines.
+
+        :param first_changed_line:
+            The lines before this line are unchanged (so, the line start
+            offsets computed for those are kept).
+        """
+        self._check_in_mutate_thread()
+        if self.immutable:
+            raise RuntimeError(
+                "This document is immutable, so, its source cannot be changed."
+            )
+        line_start_offsets = self.__line_start_offsets
+
+        self.__source = None
+        self._clear_caches()
+        self.__lines = lines
+        if line_start_offsets is not None:
+            self.__line_start_offsets = line_start_offsets[: first_changed_line + 1]
+
+    def _set_contents_from(self, doc: "Document") -> None:
+        """
+        Shares the contents (and computed lines/offsets) of another document.
+
+        Note: it's Ok to share those because they're never mutated in-place.
+        """
+        self._check_in_mutate_thread()
+        self.__source = doc.__source
+        self._clear_caches()
+        self.__lines = doc.__lines
+        self.__line_start_offsets = doc.__line_start_offsets
+        if self.__source is None and self.__lines is None:
+            # The other document didn't load its contents (load it now).
+            self.__source = doc.source
+
     def _clear_caches(self):
         self._check_in_mutate_thread()
         self.__lines = None
@@ -635,14 +681,32 @@ class Document(object):
             yield ""
 
     def _compute_line_start_offsets(self):
+        lines = self._lines
+        expected_len = len(lines)
+        if not lines or lines[-1].endswith(("\r", "\n")):
+            # iter_lines() yields the final empty line.
+            expected_len += 1
+
         line_start_offset_to_info = self.__line_start_offsets
         if line_start_offset_to_info is None:
-
             line_start_offset_to_info = []
-            offset = 0
-            for line in self.iter_lines():
+
+        # After an incremental change the offsets of the lines before the
+        # change are kept (so, only the offsets afterwards are computed).
+        computed_len = len(line_start_offset_to_info)
+        if computed_len < expected_len:
+            # Note: create a new list (it may be shared with other documents).
+            line_start_offset_to_info = line_start_offset_to_info[:]
+            if computed_len == 0:
+                offset = 0
+                line_start_offset_to_info.append(offset)
+                computed_len = 1
+            else:
+                offset = line_start_offset_to_info[-1]
+
+            for i in range(computed_len - 1, expected_len - 1):
+                offset += len(lines[i])
                 line_start_offset_to_info.append(offset)
-                offset += len(line)
 
         self.__line_start_offsets = line_start_offset_to_info
         return line_start_offset_to_info
@@ -772,34 +836,70 @@ class Document(object):
         end_line = change_range["end"]["line"]
         end_col = change_range["end"]["character"]
 
-        # Check for an edit occurring at the very end of the file
-        if start_line == len(self._lines):
-
-            self._source = self.source + text
-            return
-
-        new = io.StringIO()
-
-        # Iterate over the existing document until we hit the edit range,
-        # at which point we write the new text, then loop until we hit
-        # the end of the range and continue writing.
-        for i, line in enumerate(self._lines):
-            if i < start_line:
-                new.write(line)
-                continue
-
-            if i > end_line:
-                new.write(line)
-                continue
+        # Only the lines touched by the change are split again (the other
+        # lines are reused from the existing tuple of lines).
+        lines = self._lines
+        lines_len = len(lines)
+
+        if start_line >= lines_len:
+            # Edit occurring at the very end of the file
+            replace_from = replace_to = lines_len
+            new_text = text
+            if lines and not lines[-1].endswith(("\r", "\n")):
+                # i.e.: the last line continues with the new text.
+                replace_from -= 1
+                new_text = lines[replace_from] + new_text
+        else:
+            replace_from = start_line
+            replace_to = min(end_line + 1, lines_len)
+            new_text = lines[start_line][:start_col] + text
+            if end_line < lines_len:
+                new_text += lines[end_line][end_col:]
+
+        if replace_to < lines_len and not new_text.endswith(("\r", "\n")):
+            # The contents now continue in the next line.
+            new_text += lines[replace_to]
+            replace_to += 1
+
+        # Make sure that "\r\n" isn't broken in the boundaries.
+        if (
+            replace_from > 0
+            and new_text.startswith("\n")
+            and lines[replace_from - 1].endswith("\r")
+        ):
+            replace_from -= 1
+            new_text = lines[replace_from] + new_text
 
-            if i == start_line:
-                new.write(line[:start_col])
-                new.write(text)
+        if (
+            replace_to < lines_len
+            and new_text.endswith("\r")
+            and lines[replace_to].startswith("\n")
+        ):
+            new_text += lines[replace_to]
+            replace_to += 1
 
-            if i == end_line:
-                new.write(line[end_col:])
+        new_lines = tuple(new_text.splitlines(True))
+        self._set_lines(
+            lines[:replace_from] + new_lines + lines[replace_to:],
+            replace_from,
+        )
+        self._on_lines_replaced(replace_from, replace_to, len(new_lines))
 
-        self._source = new.getvalue()
+    def _on_lines_replaced(
+        self, replace_from: int, replace_to: int, new_lines_count: int
+    ) -> None:
+        """
+        Called after an incremental change is applied (subclasses may override
+        to update information computed for the previous contents).
+
+        :param replace_from:
+            The first line replaced (0-based).
+        :param replace_to:
+            The line (0-based, exclusive) in the previous contents up to which
+            lines were replaced.
+        :param new_lines_count:
+            The number of lines which replaced the previous lines.
+        """
 
     def apply_text_edits(self, text_edits):
         self._check_in_mutate_thread()
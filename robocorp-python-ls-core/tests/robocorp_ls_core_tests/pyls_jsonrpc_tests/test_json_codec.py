@@ -0,0 +1,112 @@
+import dataclasses
+import datetime
+import enum
+import json
+
+import pytest
+
+
+def _create_codecs():
+    from robocorp_ls_core.jsonrpc import json_codec
+
+    codecs = [
+        (
+            "json",
+            (
+                json_codec._json_loads,
+                json_codec._json_dumps,
+                json_codec._json_dumps_bytes,
+            ),
+        )
+    ]
+    for name, factory in json_codec._CODEC_NAME_TO_FACTORY.items():
+        try:
+            codecs.append((name, factory()))
+        except ImportError:
+            pass
+    return codecs
+
+
+@pytest.fixture(params=_create_codecs(), ids=lambda codec: codec[0])
+def codec(request):
+    return request.param[1]
+
+
+_MESSAGES = [
+    {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {"a": [1, 2.5]}},
+    {"b": None, "a": True, "text": 'ação ☃ "quoted" \\ / \n'},
+    {"big": 2 ** 70, "neg": -(2 ** 70)},
+    [1, "two", {"three": [3]}],
+]
+
+
+@pytest.mark.parametrize("msg", _MESSAGES)
+def test_json_codec_round_trip(codec, msg):
+    loads, dumps, dumps_bytes = codec
+
+    as_bytes = dumps_bytes(msg)
+    assert as_bytes.__class__ is bytes
+    assert json.loads(as_bytes.decode("utf-8")) == msg
+
+    as_str = dumps(msg)
+    assert as_str.__class__ is str
+    assert json.loads(as_str) == msg
+
+    assert loads(as_str) == msg
+    assert loads(as_bytes) == msg
+    assert loads(bytearray(as_bytes)) == msg
+    assert loads(memoryview(as_bytes)) == msg
+
+
+def test_json_codec_sort_keys(codec):
+    _loads, dumps, dumps_bytes = codec
+    msg = {"b": 1, "a": {"d": 2, "c": 3}}
+    expected = json.dumps(msg, sort_keys=True).replace(" ", "")
+    assert dumps(msg, sort_keys=True).replace(" ", "") == expected
+    assert dumps_bytes(msg, sort_keys=True).decode("utf-8").replace(" ", "") == expected
+
+
+def test_json_codec_same_errors_as_stdlib(codec):
+    loads, dumps, dumps_bytes = codec
+
+    with pytest.raises(TypeError):
+        dumps({"date": datetime.datetime.now()})
+
+    with pytest.raises(TypeError):
+        dumps_bytes({"obj": object()})
+
+    @dataclasses.dataclass
+    class Data:
+        a: int
+
+    with pytest.raises(TypeError):
+        dumps({"data": Data(1)})
+
+    with pytest.raises(ValueError):
+        loads(b"{invalid")
+
+    # Accepted by the stdlib.
+    assert str(loads("[NaN]")) == "[nan]"
+
+
+def test_json_codec_dumps_non_finite_floats(codec):
+    _loads, dumps, dumps_bytes = codec
+    msg = {"values": [float("nan"), float("inf"), -float("inf"), 1.5], "none": None}
+    expected = json.dumps(msg).replace(" ", "")
+    assert dumps(msg).replace(" ", "") == expected
+    assert dumps_bytes(msg).decode("utf-8").replace(" ", "") == expected
+
+
+def test_json_codec_dumps_enum(codec):
+    _loads, dumps, dumps_bytes = codec
+
+    class IntValue(enum.IntEnum):
+        A = 1
+
+    class StrValue(str, enum.Enum):
+        B = "b"
+
+    msg = {"int": IntValue.A, "str": [StrValue.B]}
+    expected = json.dumps(msg).replace(" ", "")
+    assert dumps(msg).replace(" ", "") == expected
+    assert dumps_bytes(msg).decode("utf-8").replace(" ", "") == expected
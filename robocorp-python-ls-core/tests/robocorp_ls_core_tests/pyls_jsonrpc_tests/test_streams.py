@@ -105,3 +105,102 @@ def test_writer_bad_message(wfile, writer):
     )
 
     assert wfile.getvalue() in (b"", (b"Content-Length: 10\r\n" b"\r\n" b"1546304461"))
+
+
+class _ChunkedStream(object):
+    """
+    Provides the contents in small chunks (as a pipe would).
+    """
+
+    closed = False
+
+    def __init__(self, contents, chunk_size):
+        self._contents = contents
+        self._chunk_size = chunk_size
+
+    def readinto(self, view):
+        size = min(len(view), self._chunk_size, len(self._contents))
+        view[:size] = self._contents[:size]
+        self._contents = self._contents[size:]
+        return size
+
+
+def _create_message(msg):
+    import json
+
+    body = json.dumps(msg).encode("utf-8")
+    return b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024 * 1024])
+def test_reader_chunked(chunk_size):
+    messages = [
+        {"id": 1, "method": "method", "params": {"text": "áéíóú"}},
+        {"id": 2, "method": "method", "params": {"text": "a" * 200000}},
+        {"id": 3, "method": "method", "params": {}},
+    ]
+    contents = b"".join(_create_message(msg) for msg in messages)
+    # Header names are case-insensitive.
+    contents += b"content-length: 2\r\nContent-Type: foo\r\n\r\n{}"
+
+    found = []
+    reader = JsonRpcStreamReader(_ChunkedStream(contents, chunk_size))
+    reader.listen(found.append)
+    assert found == messages + [{}]
+
+
+def test_reader_shrinks_buffer():
+    from robocorp_ls_core.jsonrpc import streams
+
+    message_reader = streams._MessageReader(
+        BytesIO(
+            _create_message({"text": "a" * (streams._MAX_RETAINED_BUFFER_SIZE * 2)})
+            + _create_message({})
+        )
+    )
+    assert len(message_reader.read_message()) > streams._MAX_RETAINED_BUFFER_SIZE
+    assert len(message_reader._buf) > streams._MAX_RETAINED_BUFFER_SIZE
+
+    assert bytes(message_reader.read_message()) == b"{}"
+    assert len(message_reader._buf) == streams._INITIAL_BUFFER_SIZE
+    assert message_reader.read_message() is None
+
+
+def test_raw_results_forwarded():
+    import json
+    from robocorp_ls_core.jsonrpc.json_codec import RawJson
+
+    result = {"data": list(range(20)), "text": "áéíóú"}
+    contents = b"".join(
+        _create_message(msg)
+        for msg in [
+            {"jsonrpc": "2.0", "id": 1, "result": result},
+            {"id": 2, "jsonrpc": "2.0", "result": None},
+            {"jsonrpc": "2.0", "id": 3, "error": {"code": 1, "message": "err"}},
+            {"jsonrpc": "2.0", "method": "method", "params": {"a": 1}},
+        ]
+    )
+    found = []
+    reader = JsonRpcStreamReader(BytesIO(contents), raw_results=True)
+    reader.listen(found.append)
+
+    assert [msg["id"] for msg in found[:3]] == [1, 2, 3]
+    assert found[0]["result"].__class__ is RawJson
+    assert found[0]["result"].loads() == result
+    assert found[1]["result"].data == b"null"
+    assert found[2]["error"] == {"code": 1, "message": "err"}
+    assert found[3] == {"jsonrpc": "2.0", "method": "method", "params": {"a": 1}}
+
+    # The result is written back as is (just the envelope is new).
+    wfile = BytesIO()
+    writer = JsonRpcStreamWriter(wfile, sort_keys=True)
+    writer.write({"jsonrpc": "2.0", "id": 22, "result": found[0]["result"]})
+    writer.write({"jsonrpc": "2.0", "method": "m", "params": RawJson.from_obj([1])})
+
+    found_written = []
+    JsonRpcStreamReader(BytesIO(wfile.getvalue())).listen(found_written.append)
+    assert found_written == [
+        {"jsonrpc": "2.0", "id": 22, "result": result},
+        {"jsonrpc": "2.0", "method": "m", "params": [1]},
+    ]
+    assert json.dumps(result).encode("utf-8") in wfile.getvalue()
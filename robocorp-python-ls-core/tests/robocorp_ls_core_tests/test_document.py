@@ -80,6 +80,55 @@ def test_document_multiline_edit():
     assert doc.get_internal_lines() == ("def hello(a, b):\n", "    print a, b\n")
 
 
+def test_document_multiline_edit_keeps_other_lines():
+    old = ["line 1\n", "line 2\n", "line 3\n", "line 4"]
+    doc = Document("file:///uri", "".join(old))
+    initial_lines = doc.get_internal_lines()
+    change = TextDocumentContentChangeEvent(
+        Range(Position(1, 4), Position(2, 4)), 0, "\nnew\n"
+    )
+    doc.apply_change(change)
+
+    new_lines = doc.get_internal_lines()
+    assert new_lines == ("line 1\n", "line\n", "new\n", " 3\n", "line 4")
+    # Lines outside of the range are reused.
+    assert new_lines[0] is initial_lines[0]
+    assert new_lines[-1] is initial_lines[-1]
+    assert doc.source == "line 1\nline\nnew\n 3\nline 4"
+
+
+def test_document_edit_crlf_boundary():
+    doc = Document("file:///uri", "a\rb")
+    change = TextDocumentContentChangeEvent(
+        Range(Position(1, 0), Position(1, 0)), 0, "\n"
+    )
+    doc.apply_change(change)
+    assert doc.get_internal_lines() == ("a\r\n", "b")
+
+    doc = Document("file:///uri", "a\n")
+    change = TextDocumentContentChangeEvent(
+        Range(Position(1, 0), Position(1, 0)), 0, "b"
+    )
+    doc.apply_change(change)
+    doc.apply_change(change)
+    assert doc.get_internal_lines() == ("a\n", "bb")
+
+
+def test_document_line_start_offsets_after_edit():
+    doc = Document("file:///uri", "aa\nbb\ncc\ndd\n")
+    assert doc.offset_to_line_col(10) == (3, 1)
+
+    change = TextDocumentContentChangeEvent(
+        Range(Position(1, 1), Position(2, 1)), 0, "xxx\nyyy\nz"
+    )
+    doc.apply_change(change)
+    assert doc.source == "aa\nbxxx\nyyy\nzc\ndd\n"
+
+    expected = Document("file:///uri", doc.source)
+    for offset in range(len(doc.source) + 2):
+        assert doc.offset_to_line_col(offset) == expected.offset_to_line_col(offset)
+
+
 def test_document_props(doc):
     assert doc.uri == DOC_URI
     assert doc.source == DOC
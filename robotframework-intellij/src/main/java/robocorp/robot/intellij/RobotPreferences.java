@@ -36,6 +36,7 @@ class RobotState {
     public String robotCompletionsSectionHeadersForm = "";
     public String robotCompletionsKeywordsFormat = "";
     public String robotWorkspaceSymbolsOnlyForOpenDocs = "";
+    public String robotMaxApiProcesses = "";
 }
 
 // IMPORTANT: Autogenerated. Don't change manually. Run codegen.py to regenerate.
@@ -62,6 +63,7 @@ public class RobotPreferences implements PersistentStateComponent<RobotState> {
     public static final String ROBOT_COMPLETIONS_SECTION_HEADERS_FORM = "robot.completions.section_headers.form";
     public static final String ROBOT_COMPLETIONS_KEYWORDS_FORMAT = "robot.completions.keywords.format";
     public static final String ROBOT_WORKSPACE_SYMBOLS_ONLY_FOR_OPEN_DOCS = "robot.workspaceSymbolsOnlyForOpenDocs";
+    public static final String ROBOT_MAX_API_PROCESSES = "robot.maxApiProcesses";
 
     private static final Logger LOG = Logger.getInstance(RobotPreferences.class);
 
@@ -90,6 +92,7 @@ public class RobotPreferences implements PersistentStateComponent<RobotState> {
         robotState.robotCompletionsSectionHeadersForm = getRobotCompletionsSectionHeadersForm();
         robotState.robotCompletionsKeywordsFormat = getRobotCompletionsKeywordsFormat();
         robotState.robotWorkspaceSymbolsOnlyForOpenDocs = getRobotWorkspaceSymbolsOnlyForOpenDocs();
+        robotState.robotMaxApiProcesses = getRobotMaxApiProcesses();
         return robotState;
     }
 
@@ -116,6 +119,7 @@ public class RobotPreferences implements PersistentStateComponent<RobotState> {
         setRobotCompletionsSectionHeadersForm(robotState.robotCompletionsSectionHeadersForm);
         setRobotCompletionsKeywordsFormat(robotState.robotCompletionsKeywordsFormat);
         setRobotWorkspaceSymbolsOnlyForOpenDocs(robotState.robotWorkspaceSymbolsOnlyForOpenDocs);
+        setRobotMaxApiProcesses(robotState.robotMaxApiProcesses);
     }
 
     // IMPORTANT: Autogenerated. Don't change manually. Run codegen.py to regenerate.
@@ -275,6 +279,14 @@ public class RobotPreferences implements PersistentStateComponent<RobotState> {
             }
         }
         
+        if(!robotMaxApiProcesses.isEmpty()){
+            try {
+                jsonObject.add(ROBOT_MAX_API_PROCESSES, new JsonPrimitive(Integer.parseInt(robotMaxApiProcesses)));
+            } catch(Exception e) {
+                LOG.error(e);
+            }
+        }
+        
         return jsonObject;
     }
 
@@ -1123,6 +1135,49 @@ public class RobotPreferences implements PersistentStateComponent<RobotState> {
         }
     }
     
+    private String robotMaxApiProcesses = "";
+
+    public @NotNull String getRobotMaxApiProcesses() {
+        return robotMaxApiProcesses;
+    }
+
+    public @Nullable JsonPrimitive getRobotMaxApiProcessesAsJson() {
+        if(robotMaxApiProcesses.isEmpty()){
+            return null;
+        }
+        Gson g = new Gson();
+        return new JsonPrimitive(Integer.parseInt(robotMaxApiProcesses));
+    }
+
+    public @NotNull String validateRobotMaxApiProcesses(String robotMaxApiProcesses) {
+        if(robotMaxApiProcesses.isEmpty()) {
+            return "";
+        }
+        try {
+            Gson g = new Gson();
+            new JsonPrimitive(Integer.parseInt(robotMaxApiProcesses));
+            
+            return "";
+            
+        } catch(Exception e) {
+            return e.toString();
+        }
+    }
+
+    public void setRobotMaxApiProcesses(String s) {
+        if (s == null) {
+            s = "";
+        }
+        if (s.equals(robotMaxApiProcesses)) {
+            return;
+        }
+        String old = robotMaxApiProcesses;
+        robotMaxApiProcesses = s;
+        for (LanguageServerDefinition.IPreferencesListener listener : listeners) {
+            listener.onChanged(ROBOT_MAX_API_PROCESSES, old, s);
+        }
+    }
+    
 
     private Collection<LanguageServerDefinition.IPreferencesListener> listeners = new CopyOnWriteArraySet<>();
 
@@ -39,6 +39,7 @@ class RobotPreferencesComponent {
     private final JBTextField robotCompletionsSectionHeadersForm = new JBTextField();
     private final JBTextField robotCompletionsKeywordsFormat = new JBTextField();
     private final JBTextField robotWorkspaceSymbolsOnlyForOpenDocs = new JBTextField();
+    private final JBTextField robotMaxApiProcesses = new JBTextField();
 
     public RobotPreferencesComponent() {
         panel = FormBuilder.createFormBuilder()
@@ -80,6 +81,8 @@ class RobotPreferencesComponent {
                 .addComponent(createJTextArea("Defines how keyword completions should be applied.\nOne of: First upper, Title Case, ALL UPPER, all lower.\n"))
                 .addLabeledComponent(new JBLabel("Workspace Symbols Only For Open Docs"), robotWorkspaceSymbolsOnlyForOpenDocs, 1, false)
                 .addComponent(createJTextArea("Collecting workspace symbols can be resource intensive on big projects and may slow down code-\ncompletion, in this case, it's possible collect info only for open files on big projects.\nNote: expected 'true' or 'false'\n"))
+                .addLabeledComponent(new JBLabel("Max Api Processes"), robotMaxApiProcesses, 1, false)
+                .addComponent(createJTextArea("The maximum number of processes used to serve the different python interpreters\n(each interpreter uses 3 processes). When the limit is reached, the processes of the least recently\nused interpreters are stopped\n(and restarted when needed). Use 0 for no limit.\n"))
                 
                 .addComponentFillVertically(new JPanel(), 0)
                 .getPanel();
@@ -275,6 +278,15 @@ class RobotPreferencesComponent {
         robotWorkspaceSymbolsOnlyForOpenDocs.setText(newText);
     }
     
+    @NotNull
+    public String getRobotMaxApiProcesses() {
+        return robotMaxApiProcesses.getText();
+    }
+
+    public void setRobotMaxApiProcesses (@NotNull String newText) {
+        robotMaxApiProcesses.setText(newText);
+    }
+    
 
 }
 
@@ -379,6 +391,10 @@ public class RobotPreferencesPage implements Configurable {
             return true;
         }
         
+        if(!settings.getRobotMaxApiProcesses().equals(component.getRobotMaxApiProcesses())){
+            return true;
+        }
+        
         return false;
     }
 
@@ -405,6 +421,7 @@ public class RobotPreferencesPage implements Configurable {
         component.setRobotCompletionsSectionHeadersForm(settings.getRobotCompletionsSectionHeadersForm());
         component.setRobotCompletionsKeywordsFormat(settings.getRobotCompletionsKeywordsFormat());
         component.setRobotWorkspaceSymbolsOnlyForOpenDocs(settings.getRobotWorkspaceSymbolsOnlyForOpenDocs());
+        component.setRobotMaxApiProcesses(settings.getRobotMaxApiProcesses());
     }
 
     @Override
@@ -488,6 +505,10 @@ public class RobotPreferencesPage implements Configurable {
         if(!s.isEmpty()) {
             throw new ConfigurationException("Error in Workspace Symbols Only For Open Docs:\n" + s);
         }
+        s = settings.validateRobotMaxApiProcesses(component.getRobotMaxApiProcesses());
+        if(!s.isEmpty()) {
+            throw new ConfigurationException("Error in Max Api Processes:\n" + s);
+        }
         
         settings.setRobotLanguageServerPython(component.getRobotLanguageServerPython());
         settings.setRobotLanguageServerArgs(component.getRobotLanguageServerArgs());
@@ -508,5 +529,6 @@ public class RobotPreferencesPage implements Configurable {
         settings.setRobotCompletionsSectionHeadersForm(component.getRobotCompletionsSectionHeadersForm());
         settings.setRobotCompletionsKeywordsFormat(component.getRobotCompletionsKeywordsFormat());
         settings.setRobotWorkspaceSymbolsOnlyForOpenDocs(component.getRobotWorkspaceSymbolsOnlyForOpenDocs());
+        settings.setRobotMaxApiProcesses(component.getRobotMaxApiProcesses());
     }
 }
\ No newline at end of file
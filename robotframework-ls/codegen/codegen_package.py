@@ -203,6 +203,11 @@ def get_json_contents():
                         "default": False,
                         "description": "Collecting workspace symbols can be resource intensive on big projects and may slow down code-completion, in this case, it's possible collect info only for open files on big projects.",
                     },
+                    "robot.maxApiProcesses": {
+                        "type": "number",
+                        "default": 30,
+                        "description": "The maximum number of processes used to serve the different python interpreters (each interpreter uses 3 processes). When the limit is reached, the processes of the least recently used interpreters are stopped (and restarted when needed). Use 0 for no limit.",
+                    },
                     "robot.editor.4spacesTab": {
                         "type": "boolean",
                         "default": True,
@@ -269,11 +274,21 @@ def get_json_contents():
                                     "description": "If specified, creates a suite from suiteTarget or cwd and applies filtering based on the target (to automatically load __init__.robot).",
                                     "default": True,
                                 },
+                                "parallelWorkers": {
+                                    "type": "integer",
+                                    "description": "If specified (and greater than 1), the tests are split among the given number of parallel worker processes (only used when running without debugging).",
+                                    "default": 1,
+                                },
                                 "suiteTarget": {
                                     "type": ["string", "array"],
                                     "description": "If specified, a suite will be created from the given target (by default, if not specified, it will be created from cwd).",
                                     "default": "",
                                 },
+                                "testResultsFile": {
+                                    "type": "string",
+                                    "description": "If specified, the test results are written to the given file (as newline-delimited json) and only the aggregated progress is sent to the client instead of the events for each test (used with the EventsListenerV2 listener).",
+                                    "default": "",
+                                },
                                 "terminal": {
                                     "type": "string",
                                     "enum": ["none", "integrated", "external"],
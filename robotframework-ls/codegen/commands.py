@@ -134,6 +134,11 @@ COMMANDS: List[Command] = [
         server_handled=True,
         hide_from_command_palette=True,
     ),
+    Command(
+        "robot.lintWorkspace",
+        "Lint all .robot/.resource files in the workspace",
+        server_handled=True,
+    ),
 ]
 
 
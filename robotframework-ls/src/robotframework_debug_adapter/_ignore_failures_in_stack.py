@@ -1,4 +1,4 @@
-from typing import Set
+from typing import Set, Any
 import os
 from robocorp_ls_core.robotframework_log import get_logger
 from robotframework_ls.impl.text_utilities import normalize_robot_name
@@ -75,12 +75,13 @@ class IgnoreFailuresInStack:
 
     def ignore(self) -> bool:
         for name in self._stack:
-            normalized = normalize_robot_name(name)
+            # Note: the name may be computed lazily (so, str() is needed).
+            normalized = normalize_robot_name(str(name))
             if normalized in self.ignore_failures_inside:
                 return True
         return False
 
-    def push(self, name: str):
+    def push(self, name: Any):
         self._stack.append(name)
 
     def pop(self):
@@ -0,0 +1,154 @@
+"""
+Coalesces the `logMessage` events sent from the robot process to the debug
+adapter.
+
+Consecutive log messages with the same level/source/test are joined in a
+single `LogMessageEvent` while the writer thread hasn't serialized it yet
+(so, when the debug adapter is keeping up, messages are sent right away and
+when the channel is congested they're accumulated in a single event).
+
+Writing never blocks the robot thread: if too many log messages are pending
+(i.e.: the debug adapter isn't reading them fast enough), new log messages
+are dropped (FAIL/ERROR messages are always kept) and a note with the number
+of dropped messages is sent afterwards.
+"""
+import threading
+from typing import Any, Callable, List, Optional, Tuple
+
+from robocorp_ls_core.debug_adapter_core.dap.dap_schema import (
+    LogMessageEvent,
+    LogMessageEventBody,
+)
+
+# Max number of chars joined in a single logMessage event.
+MAX_BATCH_CHARS = 64 * 1024
+
+# Max number of chars in log messages waiting to be written.
+MAX_PENDING_CHARS = 8 * 1024 * 1024
+
+_ALWAYS_SEND_LEVELS = frozenset(("FAIL", "ERROR"))
+
+
+class _LogMessagesBatch(object):
+    """
+    Put in the write queue in place of a `LogMessageEvent`. The actual event is
+    only created when the writer thread serializes it (messages may still be
+    added to it up to that point).
+    """
+
+    def __init__(
+        self,
+        batcher: "LogMessagesBatcher",
+        key: Tuple[Optional[str], Optional[str], Optional[str]],
+        lineno: Optional[int],
+    ) -> None:
+        self.seq = -1
+        self.key = key
+        self.lineno = lineno
+        self.messages: List[str] = []
+        self.chars = 0
+        self._batcher = batcher
+
+    def append(self, message: str) -> None:
+        self.messages.append(message)
+        self.chars += len(message)
+
+    def to_json(self, update_ids_to_dap=False):
+        messages = self._batcher._take(self)
+        level, source, test_name = self.key
+        event = LogMessageEvent(
+            LogMessageEventBody(
+                message="\n".join(messages),
+                source=source,
+                testName=test_name,
+                lineno=self.lineno,
+                level=level,
+            ),
+            seq=self.seq,
+        )
+        return event.to_json(update_ids_to_dap=update_ids_to_dap)
+
+    def __str__(self):
+        return "_LogMessagesBatch(%s, %s messages)" % (self.key, len(self.messages))
+
+    __repr__ = __str__
+
+
+class LogMessagesBatcher(object):
+    def __init__(
+        self,
+        put_in_queue: Callable[[Any], None],
+        max_batch_chars: int = MAX_BATCH_CHARS,
+        max_pending_chars: int = MAX_PENDING_CHARS,
+    ) -> None:
+        """
+        :param put_in_queue:
+            Used to put messages in the write queue (must not block).
+        """
+        self._put_in_queue = put_in_queue
+        self._max_batch_chars = max_batch_chars
+        self._max_pending_chars = max_pending_chars
+
+        self._lock = threading.Lock()
+        self._current_batch: Optional[_LogMessagesBatch] = None
+        self._pending_chars = 0
+        self._dropped = 0
+
+    def write_message(self, msg: Any) -> None:
+        with self._lock:
+            if msg.__class__ is not LogMessageEvent:
+                # Some other message: anything logged afterwards must be
+                # in a new batch to keep the ordering.
+                self._current_batch = None
+                if self._dropped:
+                    self._put_dropped_note()
+                self._put_in_queue(msg)
+                return
+
+            body = msg.body
+            message = body.message or ""
+            level = body.level
+            if (
+                self._pending_chars >= self._max_pending_chars
+                and level not in _ALWAYS_SEND_LEVELS
+            ):
+                self._dropped += 1
+                return
+
+            key = (level, body.source, body.testName)
+            batch = self._current_batch
+            if (
+                batch is None
+                or batch.key != key
+                or batch.chars >= self._max_batch_chars
+            ):
+                if self._dropped:
+                    self._put_dropped_note()
+                batch = self._current_batch = _LogMessagesBatch(self, key, body.lineno)
+                self._put_in_queue(batch)
+
+            batch.append(message)
+            self._pending_chars += len(message)
+
+    def _put_dropped_note(self) -> None:
+        # Note: called with the lock held.
+        note = _LogMessagesBatch(self, ("WARN", None, None), None)
+        note.append(
+            "%s log message(s) not shown (the debug channel was congested)."
+            % (self._dropped,)
+        )
+        self._pending_chars += note.chars
+        self._dropped = 0
+        self._current_batch = None
+        self._put_in_queue(note)
+
+    def _take(self, batch: _LogMessagesBatch) -> List[str]:
+        """
+        Called from the writer thread when the batch is about to be written (no
+        more messages can be added to it afterwards).
+        """
+        with self._lock:
+            if self._current_batch is batch:
+                self._current_batch = None
+            self._pending_chars -= batch.chars
+            return batch.messages
@@ -41,6 +41,7 @@ from robocorp_ls_core.debug_adapter_core.dap.dap_schema import (
     StackTraceRequest,
     StepInRequest,
     StepOutRequest,
+    TestFailureDetailsRequest,
     ThreadsRequest,
     VariablesRequest,
 )
@@ -69,12 +70,16 @@ class DebugAdapterComm(object):
 
     def __init__(self, write_to_client_queue):
         from robotframework_debug_adapter.launch_process import LaunchProcess
+        from robotframework_debug_adapter.test_results_stream import (
+            TestResultsReader,
+        )
 
         self.write_to_client_queue = write_to_client_queue
         self._launch_process: Optional[LaunchProcess] = None
         self._supports_run_in_terminal = False
         self._initialize_request_arguments = None
         self._run_in_debug_mode = True
+        self._test_results_reader: Optional[TestResultsReader] = None
 
         # i.e.: When a backend receives a stopped event, it sets itself as
         # a weakreference in weak_stopped_target_comm (so that we can redirect
@@ -351,6 +356,49 @@ class DebugAdapterComm(object):
             else:
                 self._launch_process.resend_request_to_robot(request)
 
+    def on_testFailureDetails_request(self, request: TestFailureDetailsRequest):
+        from robocorp_ls_core.debug_adapter_core.dap.dap_schema import (
+            TestFailureDetailsResponseBody,
+        )
+        from robotframework_debug_adapter.test_results_stream import (
+            TestResultsReader,
+        )
+
+        test_results_file = None
+        if self._launch_process is not None:
+            test_results_file = self._launch_process.test_results_file
+
+        details = None
+        if test_results_file:
+            reader = self._test_results_reader
+            if reader is None or reader.filename != test_results_file:
+                reader = self._test_results_reader = TestResultsReader(
+                    test_results_file
+                )
+            details = reader.get_failure_details(request.arguments.failure)
+
+        if details is None:
+            response = base_schema.build_response(
+                request,
+                kwargs={
+                    "body": TestFailureDetailsResponseBody(),
+                    "success": False,
+                    "message": "Unable to find failure: %s"
+                    % (request.arguments.failure,),
+                },
+            )
+        else:
+            response = base_schema.build_response(
+                request,
+                kwargs={
+                    "body": TestFailureDetailsResponseBody(
+                        message=details.get("message"),
+                        failed_keywords=details.get("failed_keywords"),
+                    )
+                },
+            )
+        self.write_to_client_message(response)
+
     def write_to_client_message(self, protocol_message: BaseSchema):
         """
         :param protocol_message:
@@ -398,6 +398,63 @@ _SuiteEntry = namedtuple("_SuiteEntry", "name, source, entry_type")
 _TestEntry = namedtuple("_TestEntry", "name, source, lineno, entry_type")
 _LogEntry = namedtuple("_LogEntry", "name, source, lineno, entry_type")
 
+_CONTROL_STEP_ENTRY_TYPES = frozenset(
+    (
+        "ELSE IF",
+        "ELSE",
+        "EXCEPT",
+        "FINALLY",
+        "FOR ITERATION",
+        "FOR",
+        "IF",
+        "ITERATION",
+        "TRY",
+        "WHILE",
+    )
+)
+
+
+def _resolve_step_source(source: str) -> str:
+    """
+    Steps may have a directory as the source (i.e.: steps in the suite setup of
+    a directory), in which case the `__init__.robot` is the actual source.
+
+    Note: only done when the source is actually needed (i.e.: when checking
+    breakpoints or when suspended) as it's too slow to be done on each step.
+    """
+    if not source.endswith((".robot", ".resource", ".txt")):
+        robot_init = os.path.join(source, "__init__.robot")
+        if os.path.exists(robot_init):
+            return robot_init
+    return source
+
+
+class _StepName(object):
+    """
+    The name of a step is only computed from the step when actually needed
+    (i.e.: to show it in the stack when suspended).
+    """
+
+    __slots__ = ["_step", "_name"]
+
+    def __init__(self, step):
+        self._step = step
+        self._name = None
+
+    def __str__(self):
+        name = self._name
+        if name is None:
+            step = self._step
+            try:
+                name = str(step).strip()
+                if not name:
+                    name = step.__class__.__name__
+            except:
+                name = "<Unable to get keyword name>"
+            self._name = name
+            self._step = None
+        return name
+
 
 class InvalidFrameIdError(Exception):
     pass
@@ -559,7 +616,18 @@ class _RobotDebuggerImpl(object):
             IgnoreFailuresInStack,
         )
 
-        self._filename_to_line_to_breakpoint = {}
+        # Note: both dicts are replaced (and not changed in-place) when
+        # breakpoints are set as they're accessed in the robot thread.
+        self._filename_to_line_to_breakpoint: Dict[
+            str, Dict[int, IRobotBreakpoint]
+        ] = {}
+
+        # The source as given by robot -> line to breakpoint (computed on the
+        # first step with a given source after breakpoints change, so that the
+        # source doesn't need to be normalized on each step).
+        self._source_to_line_to_breakpoint: Dict[
+            str, Optional[Dict[int, IRobotBreakpoint]]
+        ] = {}
         self.busy_wait = BusyWait()
 
         self._run_state = STATE_RUNNING
@@ -651,6 +719,9 @@ class _RobotDebuggerImpl(object):
             if source is None:
                 return "None"
 
+            if obj.__class__ == _StepEntry:
+                source = _resolve_step_source(source)
+
             filename, _changed = file_utils.norm_file_to_client(source)
         except:
             filename = "<Unable to get %s filename>" % (msg,)
@@ -664,7 +735,7 @@ class _RobotDebuggerImpl(object):
         for entry in reversed(self._stack_ctx_entries_deque):
             try:
                 if entry.__class__ == _StepEntry:
-                    name = entry.name
+                    name = str(entry.name)
                     lineno = entry.lineno
                     variables = entry.variables
                     args = entry.args
@@ -820,12 +891,41 @@ class _RobotDebuggerImpl(object):
         for bp in iter_in:
             log.info("Set breakpoint in %s: %s", filename, bp.lineno)
             line_to_bp[bp.lineno] = bp
-        self._filename_to_line_to_breakpoint[filename] = line_to_bp
+
+        filename_to_line_to_breakpoint = self._filename_to_line_to_breakpoint.copy()
+        if line_to_bp:
+            filename_to_line_to_breakpoint[filename] = line_to_bp
+        else:
+            # Removing all the breakpoints from a file: no need to keep an
+            # empty entry (so that the fast path is used when no breakpoints
+            # are set).
+            filename_to_line_to_breakpoint.pop(filename, None)
+
+        self._filename_to_line_to_breakpoint = filename_to_line_to_breakpoint
+        self._source_to_line_to_breakpoint = {}
+
+    def _compile_source_breakpoints(
+        self, source: str
+    ) -> Optional[Dict[int, IRobotBreakpoint]]:
+        # Note: get the dict to update before getting the breakpoints (so,
+        # if breakpoints are changed in the meanwhile the result is put in
+        # a dict which was already discarded).
+        source_to_line_to_breakpoint = self._source_to_line_to_breakpoint
+
+        filename = file_utils.get_abs_path_real_path_and_base_from_file(
+            _resolve_step_source(source)
+        )[1]
+        lines = self._filename_to_line_to_breakpoint.get(filename)
+        source_to_line_to_breakpoint[source] = lines
+        return lines
 
     # ------------------------------------------------- RobotFramework listeners
 
     # 4.0 versions where the lineno is available on the V2 listener
     def start_keyword_v2(self, _name, attributes):
+        if attributes.get("status") == "NOT RUN":
+            return
+
         from robot.running.context import EXECUTION_CONTEXTS
 
         ctx = EXECUTION_CONTEXTS.current
@@ -834,8 +934,6 @@ class _RobotDebuggerImpl(object):
         name = attributes["kwname"]
         args = attributes["args"]
         entry_type = attributes.get("type", "KEYWORD")
-        if attributes.get("status") == "NOT RUN":
-            return
         if not args:
             args = []
         self._before_run_step(ctx, name, entry_type, lineno, source, args)
@@ -909,12 +1007,6 @@ class _RobotDebuggerImpl(object):
 
     # 3.x versions where the lineno is NOT available on the V2 listener
     def before_run_step(self, step_runner, step, name=None):
-        try:
-            name = str(step).strip()
-            if not name:
-                name = step.__class__.__name__
-        except:
-            name = "<Unable to get keyword name>"
         try:
             lineno = step.lineno
             source = step.source
@@ -926,36 +1018,25 @@ class _RobotDebuggerImpl(object):
             args = []
         ctx = step_runner._context
         entry_type = "KEYWORD"
-        self._before_run_step(ctx, name, entry_type, lineno, source, args)
+        self._before_run_step(ctx, _StepName(step), entry_type, lineno, source, args)
 
     # 3.x versions where the lineno is NOT available on the V2 listener
     def after_run_step(self, step_runner, step, name=None):
         self._after_run_step()
 
     def _is_control_step(self, entry_type):
-        return entry_type in (
-            "ELSE IF",
-            "ELSE",
-            "EXCEPT",
-            "FINALLY",
-            "FOR ITERATION",
-            "FOR",
-            "IF",
-            "ITERATION",
-            "TRY",
-            "WHILE",
-        )
+        return entry_type in _CONTROL_STEP_ENTRY_TYPES
 
     def _before_run_step(self, ctx, name, entry_type, lineno, source, args):
         if entry_type == "KEYWORD":
             self._ignore_failures_in_stack.push(name)
 
+        elif entry_type in _CONTROL_STEP_ENTRY_TYPES:
+            self._stop_on_stack_len += 1
+
         if not name:
             name = entry_type
 
-        if self._is_control_step(entry_type):
-            self._stop_on_stack_len += 1
-
         if source is None or lineno is None:
             # RunKeywordIf doesn't have a source, so, just show the caller source.
             for entry in reversed(self._stack_ctx_entries_deque):
@@ -967,10 +1048,11 @@ class _RobotDebuggerImpl(object):
 
         if not source:
             return
-        if not source.endswith((".robot", ".resource", ".txt")):
-            robot_init = os.path.join(source, "__init__.robot")
-            if os.path.exists(robot_init):
-                source = robot_init
+
+        # Note: this is the hot path when running with the debugger: when no
+        # breakpoints are set and no step command is pending just the entry
+        # is added to the stack (the name/source are only resolved if
+        # needed -- i.e.: when suspended).
         self._stack_ctx_entries_deque.append(
             _StepEntry(
                 name, lineno, source, args, ctx.variables.current, entry_type, ctx
@@ -979,17 +1061,26 @@ class _RobotDebuggerImpl(object):
         if self._skip_breakpoints:
             return
 
-        source = file_utils.get_abs_path_real_path_and_base_from_file(source)[1]
-        log.debug(
-            "run_step %s, %s - step: %s - %s\n", name, lineno, self._step_cmd, source
-        )
-        lines = self._filename_to_line_to_breakpoint.get(source)
+        step_cmd = self._step_cmd
+        if step_cmd == StepEnum.STEP_NONE and not self._filename_to_line_to_breakpoint:
+            return
+
+        try:
+            lines = self._source_to_line_to_breakpoint[source]
+        except KeyError:
+            lines = self._compile_source_breakpoints(source)
 
         stop_reason: Optional[ReasonEnum] = None
-        step_cmd = self._step_cmd
         if lines:
             bp: Optional[IRobotBreakpoint] = lines.get(lineno)
             if bp:
+                source = file_utils.get_abs_path_real_path_and_base_from_file(
+                    _resolve_step_source(source)
+                )[1]
+                log.debug(
+                    "Breakpoint hit at %s (%s) - step: %s", source, lineno, step_cmd
+                )
+
                 # Mark it to stop and then go over exclusions based on condition
                 # and hit_condition.
                 stop_reason = ReasonEnum.REASON_BREAKPOINT
@@ -1072,10 +1163,11 @@ class _RobotDebuggerImpl(object):
     def _after_run_step(self):
         entry = self._stack_ctx_entries_deque.pop()
 
-        if entry.entry_type == "KEYWORD":
+        entry_type = entry.entry_type
+        if entry_type == "KEYWORD":
             self._ignore_failures_in_stack.pop()
 
-        if self._is_control_step(entry.entry_type):
+        elif entry_type in _CONTROL_STEP_ENTRY_TYPES:
             self._stop_on_stack_len -= 1
 
     def start_suite(self, data, result):
@@ -1115,6 +1207,8 @@ class _RobotDebuggerImpl(object):
                     lineno = 0
                     step_entry: _StepEntry = self._stack_ctx_entries_deque[-1]
                     source = step_entry.source
+                    if step_entry.__class__ == _StepEntry:
+                        source = _resolve_step_source(source)
                     source = Source(path=source)
                     try:
                         lineno = step_entry.lineno
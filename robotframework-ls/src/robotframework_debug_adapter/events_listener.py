@@ -25,6 +25,60 @@ def send_event(event):
 
 _SourceInfo = namedtuple("_SourceInfo", "source, lineno, test_name")
 
+_LOG_LEVEL_TO_PRIORITY = {
+    "TRACE": 0,
+    "DEBUG": 1,
+    "INFO": 2,
+    "HTML": 2,
+    "WARN": 3,
+    "ERROR": 4,
+    "FAIL": 5,
+    "NONE": 6,
+}
+
+
+def _load_min_log_message_priority() -> int:
+    """
+    RFLS_LOG_MESSAGE_MIN_LEVEL may be used to set the minimum level of the
+    messages sent as `logMessage` events (i.e.: TRACE, DEBUG, INFO, WARN, ERROR,
+    FAIL or NONE). Note that this is independent of the robot `--loglevel`
+    (which also affects the messages in the log.html).
+    """
+    import os
+
+    level = os.getenv("RFLS_LOG_MESSAGE_MIN_LEVEL")
+    if not level:
+        return 0
+
+    priority = _LOG_LEVEL_TO_PRIORITY.get(level.strip().upper())
+    if priority is None:
+        log.critical(
+            "Expected RFLS_LOG_MESSAGE_MIN_LEVEL to be one of %s. Found: %s",
+            ", ".join(_LOG_LEVEL_TO_PRIORITY),
+            level,
+        )
+        return 0
+    return priority
+
+
+def _create_test_results_writer():
+    import os
+    from robotframework_debug_adapter.test_results_stream import (
+        ENV_TEST_RESULTS_FILE,
+        TestResultsWriter,
+    )
+
+    filename = os.getenv(ENV_TEST_RESULTS_FILE)
+    if not filename:
+        return None
+    try:
+        return TestResultsWriter(filename)
+    except Exception:
+        log.exception(
+            "Unable to write test results to: %s (%s).", filename, ENV_TEST_RESULTS_FILE
+        )
+        return None
+
 
 class EventsListenerV2:
     # Note: see https://robotframework.org/robotframework/latest/RobotFrameworkUserGuide.html
@@ -42,6 +96,8 @@ class EventsListenerV2:
         self._add_to_test_failure: str = ""
         self._source_info_stack: Deque[_SourceInfo] = deque()
         self._ignore_failures_in_stack = IgnoreFailuresInStack()
+        self._min_log_message_priority = _load_min_log_message_priority()
+        self._test_results = _create_test_results_writer()
 
     # start suite/test
 
@@ -62,12 +118,18 @@ class EventsListenerV2:
         lineno = attributes.get("lineno")
         self._source_info_stack.append(_SourceInfo(source, lineno, name))
 
-        send_event(StartTestEvent(StartTestEventBody(name, source, lineno)))
+        if self._test_results is None:
+            send_event(StartTestEvent(StartTestEventBody(name, source, lineno)))
 
     # end suite/test
 
     def end_suite(self, name: str, attributes: Dict[str, Any]) -> None:
         try:
+            if self._test_results is not None:
+                progress_event = self._test_results.create_progress_event(force=True)
+                if progress_event is not None:
+                    send_event(progress_event)
+
             send_event(
                 EndSuiteEvent(
                     EndSuiteEventBody(
@@ -97,6 +159,21 @@ class EventsListenerV2:
                 msg += "\n".join(self._failure_messages)
                 self._failure_messages = []
 
+            test_results = self._test_results
+            if test_results is not None:
+                test_results.add_test(
+                    attributes.get("originalname") or name,
+                    source=attributes.get("source"),
+                    status=attributes.get("status"),
+                    elapsed=attributes.get("elapsedtime"),
+                    message=msg.strip(),
+                    failed_keywords=self._failed_keywords,
+                )
+                progress_event = test_results.create_progress_event()
+                if progress_event is not None:
+                    send_event(progress_event)
+                return
+
             send_event(
                 EndTestEvent(
                     EndTestEventBody(
@@ -137,12 +214,21 @@ class EventsListenerV2:
         if self._ignore_failures_in_stack.ignore():
             return
 
+        level = message.get("level")
+        if level in ("FAIL", "ERROR"):  # FAIL/WARN/INFO/DEBUG/TRACE
+            self._failure_messages.append(message_string)
+
+        if (
+            self._min_log_message_priority
+            and _LOG_LEVEL_TO_PRIORITY.get(level or "INFO", 2)
+            < self._min_log_message_priority
+        ):
+            return
+
         from robotframework_debug_adapter.message_utils import (
             extract_source_and_line_from_message,
         )
 
-        level = message.get("level")
-
         source = None
         lineno = None
         test_name = None
@@ -185,9 +271,6 @@ class EventsListenerV2:
             )
         )
 
-        if message["level"] in ("FAIL", "ERROR"):  # FAIL/WARN/INFO/DEBUG/TRACE
-            self._failure_messages.append(message["message"])
-
     def message(self, message):
         if message["level"] in ("FAIL", "ERROR"):
             # We also want to show these for system messages.
@@ -237,3 +320,7 @@ class EventsListenerV2:
                 log.exception("Error in self._source_info_stack.pop()")
 
             self._ignore_failures_in_stack.pop()
+
+    def close(self) -> None:
+        if self._test_results is not None:
+            self._test_results.close()
@@ -47,15 +47,33 @@ def _noop(*args, **kwargs):
     pass
 
 
-def _read_stream(stream, on_line, category):
+# Max number of bytes forwarded in a single output event.
+_READ_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _read_stream(stream, on_output, category):
+    """
+    Forwards whatever is available in the stream (so, when the process is
+    writing a lot of output, many lines are sent in a single output event
+    instead of one event per line).
+    """
+    import codecs
+
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
     try:
         while True:
-            output = stream.readline()
+            output = stream.read1(_READ_STREAM_CHUNK_SIZE)
             if len(output) == 0:
                 log.debug("Finished reading stream: %s.\n" % (category,))
+                output = decoder.decode(b"", final=True)
+                if output:
+                    on_output(output, category)
                 break
-            output = output.decode("utf-8", errors="replace")
-            on_line(output, category)
+            # Note: the incremental decoder keeps a multi-byte char split
+            # between reads to be decoded in the next read.
+            output = decoder.decode(output)
+            if output:
+                on_output(output, category)
     except:
         log.exception("Error")
 
@@ -352,6 +370,36 @@ class LaunchProcess(object):
 
         self._run_in_debug_mode = not request.arguments.noDebug
 
+        parallel_workers = request.arguments.kwargs.get("parallelWorkers")
+        if parallel_workers is not None:
+            from robotframework_debug_adapter.parallel_runner import (
+                ENV_PARALLEL_WORKERS,
+            )
+
+            if (
+                not isinstance(parallel_workers, int)
+                or isinstance(parallel_workers, bool)
+                or parallel_workers < 1
+            ):
+                return mark_invalid(
+                    f"Invalid parallelWorkers: {parallel_workers} (must be an int >= 1)."
+                )
+            # Note: ignored by the robot process in debug mode.
+            env[ENV_PARALLEL_WORKERS] = str(parallel_workers)
+
+        test_results_file = request.arguments.kwargs.get("testResultsFile")
+        if test_results_file is not None:
+            from robotframework_debug_adapter.test_results_stream import (
+                ENV_TEST_RESULTS_FILE,
+            )
+
+            if not isinstance(test_results_file, str):
+                return mark_invalid(
+                    f"Invalid testResultsFile: {test_results_file} (must be a string)."
+                )
+            if test_results_file:
+                env[ENV_TEST_RESULTS_FILE] = test_results_file
+
         if self._terminal not in VALID_TERMINAL_OPTIONS:
             return mark_invalid(
                 f"Invalid terminal option: {self._terminal} (must be one of: {VALID_TERMINAL_OPTIONS})"
@@ -472,6 +520,18 @@ class LaunchProcess(object):
     def run_in_debug_mode(self) -> bool:
         return self._run_in_debug_mode
 
+    @property
+    def test_results_file(self) -> Optional[str]:
+        from robotframework_debug_adapter.test_results_stream import (
+            ENV_TEST_RESULTS_FILE,
+        )
+
+        filename = self._env.get(ENV_TEST_RESULTS_FILE)
+        if not filename:
+            return None
+        # A relative path is relative to the cwd of the launched process.
+        return os.path.abspath(os.path.join(self._cwd or ".", filename))
+
     def send_and_wait_for_configuration_done_request(self) -> bool:
         """
         :return: Whether the configuration done response was received.
@@ -0,0 +1,494 @@
+"""
+Runs the tests split among parallel worker processes (used when
+`RFLS_PARALLEL_WORKERS` is set and the launch is not in debug mode).
+
+The launched robot process acts as the coordinator:
+
+- The tests are split among the workers (each worker receives a `shard` in
+  `RFLS_PRERUN_FILTER_TESTS`, which is applied by the
+  `FilteringTestsSuiteVisitor`).
+
+- Each worker connects back to the coordinator (using the same protocol used
+  between the robot process and the debug adapter) and the test events from
+  the workers are forwarded to the debug adapter.
+
+- At the end, the output.xml files from the workers are merged and the
+  log/report/xunit are generated from the merged output.
+"""
+import json
+import os
+import queue
+import shutil
+import socket as socket_module
+import subprocess
+import sys
+import tempfile
+import threading
+from typing import Any, Callable, List, Optional, Tuple
+
+from robocorp_ls_core.robotframework_log import get_logger
+
+log = get_logger(__name__)
+
+ENV_PARALLEL_WORKERS = "RFLS_PARALLEL_WORKERS"
+
+_FILTERING_PRERUN_MODIFIER = "--prerunmodifier=robotframework_debug_adapter.prerun_modifiers.FilteringTestsSuiteVisitor"
+
+# Events from the workers which are forwarded to the debug adapter.
+_FORWARD_EVENTS = frozenset(
+    (
+        "startSuite",
+        "endSuite",
+        "startTest",
+        "endTest",
+        "logMessage",
+        "testProgress",
+        "output",
+    )
+)
+
+# Timeout (in seconds) to wait for the remaining events of a worker after it
+# exited.
+_WORKER_EVENTS_TIMEOUT = 5
+
+# Robot exit codes from this value on mean that the execution had errors
+# (invalid arguments, execution stopped, internal errors) or that 250 or more
+# tests failed in the worker.
+_ROBOT_ERROR_RETURN_CODE = 250
+
+
+def get_parallel_workers() -> int:
+    workers = os.getenv(ENV_PARALLEL_WORKERS)
+    if not workers:
+        return 1
+    try:
+        return max(1, int(workers))
+    except ValueError:
+        log.critical(
+            "Expected %s to be an int. Found: %s", ENV_PARALLEL_WORKERS, workers
+        )
+        return 1
+
+
+class _EventsForwarder(object):
+    """
+    Forwards the events from the workers to the debug adapter.
+
+    If `RFLS_TEST_RESULTS_FILE` is set, the coordinator is the one which writes
+    the test results (the workers send the `endTest` events which are written
+    to the file and the client receives `testProgress` events as usual).
+    """
+
+    def __init__(self, write_message: Callable[[Any], None]) -> None:
+        from robotframework_debug_adapter.events_listener import (
+            _create_test_results_writer,
+        )
+
+        self._write_message = write_message
+        self._lock = threading.Lock()
+        self._test_results = _create_test_results_writer()
+
+    def __call__(self, event) -> None:
+        with self._lock:
+            test_results = self._test_results
+            if test_results is not None:
+                if event.event == "startTest":
+                    return
+
+                if event.event == "endTest":
+                    body = event.body
+                    test_results.add_test(
+                        body.name,
+                        source=body.source,
+                        status=body.status,
+                        elapsed=body.elapsedtime,
+                        message=body.message or "",
+                        failed_keywords=body.failed_keywords,
+                    )
+                    progress_event = test_results.create_progress_event()
+                    if progress_event is not None:
+                        self._write_message(progress_event)
+                    return
+
+                if event.event == "endSuite":
+                    progress_event = test_results.create_progress_event(force=True)
+                    if progress_event is not None:
+                        self._write_message(progress_event)
+
+            self._write_message(event)
+
+    def close(self) -> None:
+        if self._test_results is not None:
+            self._test_results.close()
+
+
+class _WorkerComm(object):
+    """
+    Communication with a worker (the coordinator acts as its debug adapter).
+    """
+
+    def __init__(self, socket, on_event: Callable[[Any], None]) -> None:
+        self._socket = socket
+        self._on_event = on_event
+        self._write_queue: "queue.Queue[Any]" = queue.Queue()
+        self.finished = threading.Event()
+
+    def start(self) -> None:
+        from robocorp_ls_core.debug_adapter_core.debug_adapter_threads import (
+            writer_thread,
+        )
+        from robocorp_ls_core.debug_adapter_core.debug_adapter_threads import (
+            reader_thread,
+        )
+        from robocorp_ls_core.debug_adapter_core.dap.dap_schema import (
+            InitializeRequest,
+            InitializeRequestArguments,
+            ConfigurationDoneRequest,
+        )
+
+        read_from = self._socket.makefile("rb")
+        write_to = self._socket.makefile("wb")
+
+        writer = threading.Thread(
+            target=writer_thread,
+            args=(write_to, self._write_queue, "write to worker", True),
+            name="Write to robot worker (_WorkerComm)",
+        )
+        writer.daemon = True
+
+        reader = threading.Thread(
+            target=reader_thread,
+            args=(
+                read_from,
+                self._process_message,
+                self._write_queue,
+                b"read from worker",
+                True,
+            ),
+            name="Read from robot worker (_WorkerComm)",
+        )
+        reader.daemon = True
+
+        reader.start()
+        writer.start()
+
+        self._write_queue.put(
+            InitializeRequest(InitializeRequestArguments("robot-parallel-worker"))
+        )
+        self._write_queue.put(ConfigurationDoneRequest())
+
+    def _process_message(self, protocol_message) -> None:
+        from robocorp_ls_core.debug_adapter_core.debug_adapter_threads import (
+            READER_THREAD_STOPPED,
+        )
+        from robocorp_ls_core.debug_adapter_core.dap.dap_schema import (
+            TerminatedEvent,
+            TerminatedEventBody,
+        )
+
+        if protocol_message is READER_THREAD_STOPPED:
+            self.finished.set()
+            return
+
+        # Note: responses (to initialize/configurationDone) are ignored.
+        if protocol_message.type != "event":
+            return
+
+        event = protocol_message.event
+        if event == "terminated":
+            # The worker waits for the terminated event to be acknowledged.
+            self._write_queue.put(TerminatedEvent(TerminatedEventBody()))
+            self.finished.set()
+
+        elif event in _FORWARD_EVENTS:
+            self._on_event(protocol_message)
+
+    def close(self) -> None:
+        from robocorp_ls_core.debug_adapter_core.debug_adapter_threads import (
+            STOP_WRITER_THREAD,
+        )
+
+        self._write_queue.put(STOP_WRITER_THREAD)
+
+
+def _compute_args(robot_args: List[str]) -> Tuple[List[str], List[str], Any]:
+    """
+    :return:
+        The options (with argument files expanded), the datasources (which
+        must be the last arguments passed to robot) and the `RobotSettings`.
+
+    :raises Information|DataError: if the arguments are not valid.
+    """
+    from robot.run import RobotFramework  # type: ignore
+    from robot.conf import RobotSettings  # type: ignore
+    from robot.utils.argumentparser import ArgFileParser  # type: ignore
+
+    args = ArgFileParser(["--argumentfile", "-A"]).process(list(robot_args))
+
+    app = RobotFramework()
+    options, datasources = app.validate(*app.parse_arguments(args))
+    settings = RobotSettings(options)
+
+    if datasources and args[-len(datasources) :] == datasources:
+        return args[: -len(datasources)], datasources, settings
+    return args, [], settings
+
+
+def _compute_worker_env(index: int, workers: int) -> dict:
+    from robotframework_debug_adapter.test_results_stream import (
+        ENV_TEST_RESULTS_FILE,
+    )
+
+    env = os.environ.copy()
+    env.pop(ENV_PARALLEL_WORKERS, None)
+    env.pop(ENV_TEST_RESULTS_FILE, None)
+
+    tests_filtering = {}
+    s = env.get("RFLS_PRERUN_FILTER_TESTS")
+    if s:
+        tests_filtering = json.loads(s)
+    tests_filtering["shard"] = [index, workers]
+    env["RFLS_PRERUN_FILTER_TESTS"] = json.dumps(tests_filtering)
+    return env
+
+
+def _min_time(t1, t2):
+    times = [t for t in (t1, t2) if t and t != "N/A"]
+    return min(times) if times else t1
+
+
+def _max_time(t1, t2):
+    times = [t for t in (t1, t2) if t and t != "N/A"]
+    return max(times) if times else t1
+
+
+def _create_shards_merger(result):
+    from robot.api import SuiteVisitor
+
+    class _ShardsMerger(SuiteVisitor):
+        """
+        Merges the results of the workers (which have disjoint tests). Similar
+        to `rebot --merge` but without marking the suites/tests as merged.
+        """
+
+        def __init__(self) -> None:
+            self.current = None
+
+        def merge(self, merged) -> None:
+            merged.suite.visit(self)
+            result.errors.add(merged.errors)
+
+        def start_suite(self, suite):
+            if self.current is None:
+                old = result.suite
+            else:
+                old = None
+                for s in self.current.suites:
+                    if s.name == suite.name:
+                        old = s
+                        break
+
+            if old is None:
+                self.current.suites.append(suite)
+                return False
+
+            old.starttime = _min_time(old.starttime, suite.starttime)
+            old.endtime = _max_time(old.endtime, suite.endtime)
+            self.current = old
+            return True
+
+        def end_suite(self, suite):
+            self.current = self.current.parent
+
+        def visit_test(self, test):
+            self.current.tests.append(test)
+
+        def visit_keyword(self, keyword):
+            # Suite setup/teardown are kept from the first output.
+            pass
+
+    return _ShardsMerger()
+
+
+def _merge_outputs(output_files: List[str], settings) -> Optional[int]:
+    """
+    :return: The return code for the merged results (or None if there's
+        nothing to merge).
+    """
+    from robot.api import ExecutionResult  # type: ignore
+    from robot.output import LOGGER  # type: ignore
+    from robot.reporting import ResultWriter  # type: ignore
+
+    results = [ExecutionResult(f) for f in output_files if os.path.exists(f)]
+    if not results:
+        return None
+
+    result = results[0]
+    merger = _create_shards_merger(result)
+    for merged in results[1:]:
+        merger.merge(merged)
+
+    if settings.output:
+        dirname = os.path.dirname(settings.output)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        result.save(settings.output)
+        LOGGER.output_file("Output", settings.output)
+
+    if settings.log or settings.report or settings.xunit:
+        writer = ResultWriter(settings.output if settings.log else result)
+        writer.write_results(settings.get_rebot_settings())
+
+    return result.return_code
+
+
+def _run_workers(
+    run_robot_py: str,
+    options_args: List[str],
+    datasources_args: List[str],
+    output_files: List[str],
+    forwarder: _EventsForwarder,
+) -> List[int]:
+    """
+    Starts a worker for each output file and waits for all of them to finish.
+
+    :return: The return codes of the workers.
+    """
+    workers = len(output_files)
+    comms: List[_WorkerComm] = []
+
+    server_socket = socket_module.socket(
+        socket_module.AF_INET, socket_module.SOCK_STREAM
+    )
+    try:
+        server_socket.bind(("127.0.0.1", 0))
+        server_socket.listen(workers)
+        port = server_socket.getsockname()[1]
+
+        def accept_workers():
+            try:
+                for _i in range(workers):
+                    sock, _addr = server_socket.accept()
+                    comm = _WorkerComm(sock, forwarder)
+                    comms.append(comm)
+                    comm.start()
+            except OSError:
+                pass  # Server socket closed (some worker didn't connect).
+            except:
+                log.exception("Error accepting worker connection.")
+
+        t = threading.Thread(target=accept_workers, name="Accept robot workers")
+        t.daemon = True
+        t.start()
+
+        processes = []
+        for index, output in enumerate(output_files):
+            cmdline = (
+                [
+                    sys.executable,
+                    "-u",
+                    run_robot_py,
+                    "--port",
+                    str(port),
+                    "--no-debug",
+                ]
+                + options_args
+                + [
+                    "--output",
+                    output,
+                    "--log",
+                    "NONE",
+                    "--report",
+                    "NONE",
+                    "--xunit",
+                    "NONE",
+                    "--runemptysuite",
+                ]
+                + datasources_args
+            )
+            log.debug("Starting robot worker: %s", cmdline)
+            processes.append(
+                subprocess.Popen(cmdline, env=_compute_worker_env(index, workers))
+            )
+
+        returncodes = [p.wait() for p in processes]
+
+        for comm in comms[:]:
+            if not comm.finished.wait(_WORKER_EVENTS_TIMEOUT):
+                log.info("Timed out waiting for the events of a robot worker.")
+            comm.close()
+    finally:
+        server_socket.close()
+
+    return returncodes
+
+
+def run_parallel(
+    robot_args: List[str], workers: int, write_message: Callable[[Any], None]
+) -> int:
+    """
+    :param write_message:
+        Used to send the events from the workers to the debug adapter.
+
+    :return: The exit code for the run.
+    """
+    from robot import run_cli
+    from robot.errors import DataError, Information  # type: ignore
+
+    try:
+        options_args, datasources_args, settings = _compute_args(robot_args)
+    except (DataError, Information):
+        # Let robot report it.
+        return run_cli(robot_args, exit=False)
+
+    if _FILTERING_PRERUN_MODIFIER not in options_args:
+        options_args.append(_FILTERING_PRERUN_MODIFIER)
+
+    run_robot_py = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "run_robot__main__.py"
+    )
+
+    forwarder = _EventsForwarder(write_message)
+    tmpdir = tempfile.mkdtemp(prefix="rfls_parallel_")
+    output_files = [
+        os.path.join(tmpdir, "output_%s.xml" % (index,)) for index in range(workers)
+    ]
+
+    try:
+        returncodes = _run_workers(
+            run_robot_py,
+            options_args,
+            datasources_args,
+            output_files,
+            forwarder,
+        )
+
+        _report_failed_workers(output_files, returncodes)
+        try:
+            returncode = _merge_outputs(output_files, settings)
+        except Exception:
+            log.exception("Error merging outputs: %s", output_files)
+            sys.stderr.write("Error merging the output of the robot workers.\n")
+            returncode = None
+    finally:
+        forwarder.close()
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+    # Note: the merged results don't have the tests of a worker which failed,
+    # so, the return codes of the workers must also be considered.
+    if returncode is None:
+        return max(returncodes)
+    return max([returncode] + returncodes)
+
+
+def _report_failed_workers(output_files: List[str], returncodes: List[int]) -> None:
+    for index, (output, returncode) in enumerate(zip(output_files, returncodes)):
+        if not os.path.exists(output):
+            msg = "Robot worker %s failed (exit code: %s, no output generated)."
+        elif returncode >= _ROBOT_ERROR_RETURN_CODE:
+            msg = "Robot worker %s failed (exit code: %s)."
+        else:
+            continue
+        msg = msg % (index, returncode)
+        log.critical(msg)
+        sys.stderr.write(msg + "\n")
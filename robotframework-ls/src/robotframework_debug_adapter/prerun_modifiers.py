@@ -1,7 +1,7 @@
 from robot.api import SuiteVisitor
 import os
 import json
-from typing import Set, Dict, Optional
+from typing import Set, Dict, Optional, Tuple
 
 from robocorp_ls_core.robotframework_log import get_logger
 from robocorp_ls_core.basic import normalize_filename
@@ -21,6 +21,10 @@ class FilteringTestsSuiteVisitor(SuiteVisitor):
         self._include_contains_cache: dict = {}
         self._exclude_contains_cache: dict = {}
 
+        # (index, count): only the tests of the given shard are kept (used to
+        # split the tests among parallel workers).
+        self._shard: Optional[Tuple[int, int]] = None
+
         if tests_filtering is None:
             s = os.getenv("RFLS_PRERUN_FILTER_TESTS", "")
             if s:
@@ -41,6 +45,12 @@ class FilteringTestsSuiteVisitor(SuiteVisitor):
             for tup in tests_filtering.get("exclude", []):
                 add(tup, self.exclude)
 
+            shard = tests_filtering.get("shard")
+            if shard:
+                index, count = shard
+                if int(count) > 1:
+                    self._shard = (int(index), int(count))
+
     def _normalize(self, source):
         return normalize_filename(source)
 
@@ -108,3 +118,35 @@ class FilteringTestsSuiteVisitor(SuiteVisitor):
     def end_suite(self, suite):
         # We don't want to keep empty suites.
         suite.suites = [s for s in suite.suites if s.test_count > 0]
+
+        if self._shard is not None and suite.parent is None:
+            self._keep_shard(suite, self._shard)
+
+    def _keep_shard(self, root_suite, shard: Tuple[int, int]) -> None:
+        # Contiguous chunks are used (in the suite order) so that the tests
+        # of a given suite are usually in the same shard (which means that
+        # suite setups/teardowns are run in fewer workers).
+        index, count = shard
+
+        all_tests = []
+
+        def collect(suite):
+            all_tests.extend(suite.tests)
+            for s in suite.suites:
+                collect(s)
+
+        collect(root_suite)
+
+        total = len(all_tests)
+        keep = set(
+            id(t)
+            for t in all_tests[total * index // count : total * (index + 1) // count]
+        )
+
+        def prune(suite):
+            suite.tests = [t for t in suite.tests if id(t) in keep]
+            for s in suite.suites:
+                prune(s)
+            suite.suites = [s for s in suite.suites if s.test_count > 0]
+
+        prune(root_suite)
@@ -63,12 +63,16 @@ class _RobotTargetComm(threading.Thread):
             --nodebug flag was passed.
         """
         from robocorp_ls_core.debug_adapter_core.dap.dap_base_schema import BaseSchema
+        from robotframework_debug_adapter._log_messages_batcher import (
+            LogMessagesBatcher,
+        )
         from typing import Union
 
         threading.Thread.__init__(self)
         self.daemon = True
         self._socket = socket
         self._write_queue: "queue.Queue[Union[BaseSchema, dict, str]]" = queue.Queue()
+        self._log_messages_batcher = LogMessagesBatcher(self._write_queue.put)
         self.configuration_done = threading.Event()
         self.terminated = threading.Event()
         self._run_in_debug_mode = debug
@@ -170,7 +174,9 @@ class _RobotTargetComm(threading.Thread):
         self.write_message(TerminatedEvent(TerminatedEventBody()))
 
     def write_message(self, msg):
-        self._write_queue.put(msg)
+        # Note: never blocks (log messages are coalesced/dropped if the debug
+        # adapter can't keep up).
+        self._log_messages_batcher.write_message(msg)
 
     def process_message(self, protocol_message):
         from robotframework_debug_adapter.constants import DEBUG
@@ -648,8 +654,22 @@ def main():
             raise
 
         from robot import run_cli
+        from robotframework_debug_adapter.parallel_runner import (
+            get_parallel_workers,
+            run_parallel,
+            ENV_PARALLEL_WORKERS,
+        )
 
-        exitcode = run_cli(robot_args, exit=False)
+        workers = get_parallel_workers()
+        if workers > 1 and not debug:
+            exitcode = run_parallel(robot_args, workers, processor.write_message)
+        else:
+            if workers > 1:
+                sys.stderr.write(
+                    "%s ignored in debug mode (running in a single process).\n"
+                    % (ENV_PARALLEL_WORKERS,)
+                )
+            exitcode = run_cli(robot_args, exit=False)
     finally:
         processor.terminate()
         if processor.terminated.wait(2):
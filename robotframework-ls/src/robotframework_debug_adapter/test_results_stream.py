@@ -0,0 +1,186 @@
+"""
+Compact stream with the results of the Robot Framework tests.
+
+When `RFLS_TEST_RESULTS_FILE` is set, the `EventsListenerV2` writes the test
+results to that file as newline-delimited json (instead of sending the
+`startTest`/`endTest` events) and periodically sends a `testProgress` event
+with the aggregated results and how much of the file was already written.
+
+Each finished test is written as:
+
+    {"source": "...", "name": "...", "status": "PASS", "elapsed": 12}
+
+Tests with a message (i.e.: failures) also have a "failure" (an id computed
+from the failure contents). The failure details are written only once for
+each distinct failure (before the first test which references it) as:
+
+    {"failure": "...", "message": "...", "failed_keywords": [...]}
+
+The debug adapter provides the failure details through the
+`testFailureDetails` request (so, the client only needs to load those when
+they're actually needed).
+"""
+import hashlib
+import os
+import time
+from typing import Any, Dict, List, Optional, Set
+
+from robocorp_ls_core.jsonrpc import json_codec
+from robocorp_ls_core.robotframework_log import get_logger
+
+log = get_logger(__name__)
+
+ENV_TEST_RESULTS_FILE = "RFLS_TEST_RESULTS_FILE"
+
+# Min interval (in seconds) between testProgress events.
+PROGRESS_INTERVAL = 0.5
+
+
+class TestResultsWriter(object):
+    def __init__(self, filename: str) -> None:
+        self.filename = os.path.abspath(filename)
+        dirname = os.path.dirname(self.filename)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+
+        self._stream = open(self.filename, "wb")
+        self._offset = 0
+        self._written_failures: Set[str] = set()
+        self._last_progress_time: Optional[float] = None
+        self._last_progress_offset = -1
+
+        self.passed = 0
+        self.failed = 0
+        self.skipped = 0
+
+    def _write(self, obj: Dict[str, Any]) -> None:
+        data = json_codec.dumps_bytes(obj) + b"\n"
+        self._stream.write(data)
+        self._offset += len(data)
+
+    def add_test(
+        self,
+        name: str,
+        source: Optional[str],
+        status: Optional[str],
+        elapsed: Optional[int],
+        message: str,
+        failed_keywords: Optional[List[Dict[str, Any]]],
+    ) -> None:
+        record: Dict[str, Any] = {
+            "source": source,
+            "name": name,
+            "status": status,
+            "elapsed": elapsed,
+        }
+
+        if message or failed_keywords:
+            details = {"message": message, "failed_keywords": failed_keywords or []}
+            failure = hashlib.sha1(
+                json_codec.dumps_bytes(details, sort_keys=True)
+            ).hexdigest()[:16]
+            if failure not in self._written_failures:
+                self._written_failures.add(failure)
+                details["failure"] = failure
+                self._write(details)
+            record["failure"] = failure
+
+        self._write(record)
+
+        if status == "PASS":
+            self.passed += 1
+        elif status == "FAIL":
+            self.failed += 1
+        elif status == "SKIP":
+            self.skipped += 1
+
+    def create_progress_event(self, force: bool = False):
+        """
+        :return TestProgressEvent|NoneType:
+            The event to be sent to the client (or None if nothing changed
+            since the last one or if a progress event was sent recently and
+            `force` is False).
+        """
+        from robocorp_ls_core.debug_adapter_core.dap.dap_schema import (
+            TestProgressEvent,
+            TestProgressEventBody,
+        )
+
+        if self._offset == self._last_progress_offset:
+            return None
+
+        now = time.monotonic()
+        if (
+            not force
+            and self._last_progress_time is not None
+            and now - self._last_progress_time < PROGRESS_INTERVAL
+        ):
+            return None
+
+        self._last_progress_time = now
+        self._last_progress_offset = self._offset
+        # The offset must only be reported after the contents are flushed.
+        self._stream.flush()
+        return TestProgressEvent(
+            TestProgressEventBody(
+                passed=self.passed,
+                failed=self.failed,
+                skipped=self.skipped,
+                resultsFile=self.filename,
+                resultsOffset=self._offset,
+            )
+        )
+
+    def close(self) -> None:
+        self._stream.close()
+
+
+class TestResultsReader(object):
+    """
+    Provides the failure details from a file written by the `TestResultsWriter`
+    (the file is only read when some failure is requested and new contents are
+    read incrementally afterwards).
+    """
+
+    def __init__(self, filename: str) -> None:
+        self.filename = filename
+        self._offset = 0
+        self._failures: Dict[str, Dict[str, Any]] = {}
+
+    def _read_new_contents(self) -> None:
+        try:
+            with open(self.filename, "rb") as stream:
+                stream.seek(self._offset)
+                contents = stream.read()
+        except FileNotFoundError:
+            return
+
+        # Only consider complete lines (the writer may be in the middle of a line).
+        end = contents.rfind(b"\n") + 1
+        if not end:
+            return
+        self._offset += end
+
+        for line in contents[:end].splitlines():
+            if b'"failure"' not in line or b'"message"' not in line:
+                continue
+            try:
+                obj = json_codec.loads(line)
+            except Exception:
+                log.exception("Error loading line from: %s", self.filename)
+                continue
+            failure = obj.pop("failure", None)
+            if failure and "message" in obj:
+                self._failures[failure] = obj
+
+    def get_failure_details(self, failure: str) -> Optional[Dict[str, Any]]:
+        """
+        :return:
+            A dict with the "message" and "failed_keywords" or None if the
+            given failure was not found.
+        """
+        details = self._failures.get(failure)
+        if details is None:
+            self._read_new_contents()
+            details = self._failures.get(failure)
+        return details
@@ -0,0 +1,271 @@
+"""
+Helpers to re-parse only the test case/keyword affected by an edit instead of
+re-parsing the whole document.
+
+The new AST shares the nodes which weren't changed with the previous AST (the
+nodes after the change are copied with new line numbers if lines were
+added/removed) and the AST of the previous version is never mutated (so, it's
+still safe to use it from other threads).
+"""
+from typing import Optional, Tuple, Callable, Sequence, Any
+import ast as ast_module
+
+from robocorp_ls_core.robotframework_log import get_logger
+
+log = get_logger(__name__)
+
+# Section class name -> (block class name, header used to parse the block)
+_SECTION_CLASS_TO_BLOCK_INFO = {
+    "TestCaseSection": ("TestCase", "*** Test Cases ***\n"),
+    "KeywordSection": ("Keyword", "*** Keywords ***\n"),
+}
+
+# Statements outside of the test cases/keywords which change how those are
+# lexed (i.e.: with a `Test Template` the test case rows are template
+# arguments and a `Config` may set the language).
+_LEXING_STATEMENT_CLASS_NAMES = frozenset(("TestTemplate", "Config"))
+
+
+class IncrementalParseInfo(object):
+    """
+    Keeps the AST computed for a previous version of a document along with
+    the lines which changed since then.
+
+    :ivar changed_lines:
+        None if no lines changed or a tuple(start, end) with the lines
+        (0-based, end exclusive) changed in the current contents.
+
+    :ivar lines_delta:
+        The number of lines added (or removed if negative) since the AST
+        was computed.
+    """
+
+    __slots__ = ["ast", "changed_lines", "lines_delta"]
+
+    def __init__(
+        self,
+        ast,
+        changed_lines: Optional[Tuple[int, int]] = None,
+        lines_delta: int = 0,
+    ):
+        self.ast = ast
+        self.changed_lines = changed_lines
+        self.lines_delta = lines_delta
+
+    def create_with_lines_replaced(
+        self, replace_from: int, replace_to: int, new_lines_count: int
+    ) -> "IncrementalParseInfo":
+        shift = new_lines_count - (replace_to - replace_from)
+        changed_start = replace_from
+        changed_end = replace_from + new_lines_count
+
+        if self.changed_lines is not None:
+            start, end = self.changed_lines
+            if end >= replace_to:
+                end += shift
+            elif end > replace_from:
+                end = changed_end
+            changed_start = min(start, changed_start)
+            changed_end = max(end, changed_end)
+
+        return IncrementalParseInfo(
+            self.ast, (changed_start, changed_end), self.lines_delta + shift
+        )
+
+
+def _copy_node(node):
+    new_node = node.__class__.__new__(node.__class__)
+    new_node.__dict__.update(node.__dict__)
+    return new_node
+
+
+def _copy_node_shifting_lines(node, lines_delta: int):
+    from robot.api import Token
+
+    new_node = _copy_node(node)
+    tokens = node.__dict__.get("tokens")
+    if tokens is not None:
+        new_node.tokens = tuple(
+            Token(
+                token.type,
+                token.value,
+                token.lineno + lines_delta,
+                token.col_offset,
+                token.error,
+            )
+            for token in tokens
+        )
+
+    for field in node._fields:
+        value = getattr(node, field, None)
+        if isinstance(value, list):
+            setattr(
+                new_node,
+                field,
+                [
+                    _copy_node_shifting_lines(v, lines_delta)
+                    if isinstance(v, ast_module.AST)
+                    else v
+                    for v in value
+                ],
+            )
+        elif isinstance(value, ast_module.AST):
+            setattr(new_node, field, _copy_node_shifting_lines(value, lines_delta))
+    return new_node
+
+
+def _shift_lines_in_place(node, lines_delta: int) -> None:
+    for n in ast_module.walk(node):
+        tokens = getattr(n, "tokens", None)
+        if tokens:
+            for token in tokens:
+                token.lineno += lines_delta
+
+
+def _find_block(sections: list, line: int) -> Optional[Tuple[int, int, int, int]]:
+    """
+    :return: tuple(section index, index in the section body, block start line,
+        next block start line (-1 if it's the last in the document)) for the
+        body element which contains the given line (all lines are 0-based).
+    """
+    for section_i, section in enumerate(sections):
+        if section_i + 1 < len(sections):
+            section_end = sections[section_i + 1].lineno - 1
+            if line >= section_end:
+                continue
+        else:
+            section_end = -1
+
+        body = section.body
+        for body_i, node in enumerate(body):
+            if body_i + 1 < len(body):
+                next_start = body[body_i + 1].lineno - 1
+            else:
+                next_start = section_end
+
+            node_start = node.lineno - 1
+            if line >= node_start and (next_start == -1 or line < next_start):
+                return section_i, body_i, node_start, next_start
+        return None
+    return None
+
+
+def _has_lexing_statements(sections: list) -> bool:
+    for section in sections:
+        if section.__class__.__name__ in _SECTION_CLASS_TO_BLOCK_INFO:
+            continue
+        for node in section.body:
+            if node.__class__.__name__ in _LEXING_STATEMENT_CLASS_NAMES:
+                return True
+    return False
+
+
+def parse_incrementally(
+    incremental_parse_info: IncrementalParseInfo,
+    lines: Sequence[str],
+    parse: Callable[[str], Any],
+):
+    """
+    :param lines:
+        The lines of the current contents of the document.
+
+    :param parse:
+        The function used to parse the contents of the document (i.e.:
+        `robot.api.get_model`, `robot.api.get_resource_model`, ...).
+
+    :return:
+        The new AST or None if it wasn't possible to parse incrementally
+        (i.e.: the change isn't contained in a single test case/keyword, the
+        block boundaries changed or the document has some setting, such as
+        `Test Template`, which changes how the block is lexed), in which case the whole document must
+        be parsed.
+    """
+    ast = incremental_parse_info.ast
+    if incremental_parse_info.changed_lines is None:
+        return ast
+
+    start, end = incremental_parse_info.changed_lines
+    lines_delta = incremental_parse_info.lines_delta
+    # The end of the changed lines (exclusive) in the previous contents.
+    old_end = end - lines_delta
+
+    sections = ast.sections
+    if _has_lexing_statements(sections):
+        # The block can't be parsed just with the section header.
+        return None
+
+    found = _find_block(sections, start)
+    if found is None:
+        return None
+
+    section_i, body_i, block_start, next_start = found
+    if next_start != -1 and old_end > next_start:
+        # The change spans multiple blocks.
+        return None
+
+    section = sections[section_i]
+    block = section.body[body_i]
+    block_info = _SECTION_CLASS_TO_BLOCK_INFO.get(section.__class__.__name__)
+    if block_info is None:
+        return None
+
+    block_class_name, header = block_info
+    if block.__class__.__name__ != block_class_name:
+        return None
+
+    if next_start == -1:
+        block_end = len(lines)
+    else:
+        block_end = next_start + lines_delta
+
+    block_lines = lines[block_start:block_end]
+    for line in block_lines:
+        if line.startswith("*"):
+            # Something which may be a section header (even an invalid one)
+            # changes how the remainder of the document is parsed.
+            return None
+
+    new_model = parse(header + "".join(block_lines))
+
+    new_sections = new_model.sections
+    if (
+        len(new_sections) != 1
+        or new_sections[0].__class__ is not section.__class__
+        or len(new_sections[0].body) != 1
+        or new_sections[0].body[0].__class__ is not block.__class__
+        or new_sections[0].header.end_lineno != 1
+    ):
+        # i.e.: the edit created a new block/section or the block starts
+        # with a continuation of the previous statement.
+        return None
+
+    new_block = new_sections[0].body[0]
+    if new_block.header is None or not new_block.name:
+        # i.e.: the edit removed the block name (so, the contents are now
+        # part of the previous block).
+        return None
+
+    # The header is at the 1st line and the block starts at the 2nd line.
+    _shift_lines_in_place(new_block, block_start - 1)
+
+    new_body = section.body[:body_i]
+    new_body.append(new_block)
+    following_sections = sections[section_i + 1 :]
+    following_body = section.body[body_i + 1 :]
+    if lines_delta:
+        following_sections = [
+            _copy_node_shifting_lines(node, lines_delta) for node in following_sections
+        ]
+        following_body = [
+            _copy_node_shifting_lines(node, lines_delta) for node in following_body
+        ]
+    new_body.extend(following_body)
+
+    new_section = _copy_node(section)
+    new_section.body = new_body
+
+    new_ast = _copy_node(ast)
+    # The indexer from the previous AST must not be reused.
+    new_ast.__dict__.pop("__ast_indexer__", None)
+    new_ast.sections = sections[:section_i] + [new_section] + following_sections
+    return new_ast
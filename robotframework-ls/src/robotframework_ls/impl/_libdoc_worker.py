@@ -0,0 +1,161 @@
+"""
+A long-lived process which generates .libspec files with libdoc.
+
+This module is run as a script (so, it must only depend on the standard
+library and on robotframework) and it receives requests as json lines
+in stdin with the libdoc command line arguments:
+
+    {"args": ["--format", "XML", "MyLib", "target.libspec"], "cwd": "/my/dir"}
+
+and replies with json lines in stdout with the return code and output:
+
+    {"returncode": 0, "output": "..."}
+
+or, if some module which is kept loaded changed in the filesystem (i.e.: an
+installed library was upgraded or edited), it replies with:
+
+    {"restart": true}
+
+and exits without running libdoc (so, the request must be done in a new
+worker).
+
+Anything else which would be written to the stdout (i.e.: prints when
+importing libraries) is redirected to the stderr.
+
+The modules from the libraries being documented (i.e.: user code, not the
+standard library, installed packages, extension modules or robotframework
+itself) are removed afterwards, so, libraries which changed are imported again
+in the next request. The modules which are kept have their mtime tracked so
+that a change in those is also noticed.
+"""
+import importlib.machinery
+import sys
+import os
+
+
+def _is_module_kept(name, module, kept_dirs):
+    if name == "robot" or name.startswith("robot."):
+        return True
+
+    module_file = getattr(module, "__file__", None)
+    if not module_file:
+        # Builtin or namespace package.
+        return module_file is None and not hasattr(module, "__path__")
+
+    # Extension modules can't be safely imported again.
+    if module_file.endswith(tuple(importlib.machinery.EXTENSION_SUFFIXES)):
+        return True
+
+    module_file = os.path.normcase(os.path.abspath(module_file))
+    if "site-packages" in module_file or "dist-packages" in module_file:
+        return True
+    return module_file.startswith(kept_dirs)
+
+
+def _get_mtime(filename):
+    try:
+        return os.stat(filename).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _has_changed_files(kept_file_to_mtime):
+    for filename, mtime in kept_file_to_mtime.items():
+        if _get_mtime(filename) != mtime:
+            return True
+    return False
+
+
+def _run_libdoc(libdoc_class, args, cwd, kept_dirs, kept_file_to_mtime):
+    import io
+    import importlib
+    import traceback
+    from contextlib import redirect_stdout, redirect_stderr
+
+    initial_modules = set(sys.modules)
+    initial_path = sys.path[:]
+    initial_cwd = os.getcwd()
+
+    stream = io.StringIO()
+    returncode = 1
+    try:
+        if cwd:
+            os.chdir(cwd)
+        importlib.invalidate_caches()
+
+        with redirect_stdout(stream), redirect_stderr(stream):
+            try:
+                returncode = libdoc_class().execute_cli(args, exit=False)
+            except SystemExit as e:
+                returncode = e.code if isinstance(e.code, int) else 1
+            except BaseException:
+                traceback.print_exc(file=stream)
+                returncode = 1
+    finally:
+        os.chdir(initial_cwd)
+        sys.path[:] = initial_path
+        for name in set(sys.modules).difference(initial_modules):
+            module = sys.modules.get(name)
+            if not _is_module_kept(name, module, kept_dirs):
+                sys.modules.pop(name, None)
+                continue
+
+            module_file = getattr(module, "__file__", None)
+            if module_file and module_file not in kept_file_to_mtime:
+                kept_file_to_mtime[module_file] = _get_mtime(module_file)
+
+    return returncode, stream.getvalue()
+
+
+def main():
+    import io
+    import json
+    import sysconfig
+
+    # The directory of this script must not be in the PYTHONPATH (it could
+    # shadow libraries with the same name of modules in this directory).
+    this_dir = os.path.normcase(os.path.dirname(os.path.abspath(__file__)))
+    sys.path[:] = [
+        p for p in sys.path if os.path.normcase(os.path.abspath(p or ".")) != this_dir
+    ]
+
+    # Keep the original stdin/stdout only for the requests/replies.
+    stdin = sys.stdin
+    sys.stdin = io.StringIO()
+    out = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+
+    paths = sysconfig.get_paths()
+    kept_dirs = tuple(
+        set(
+            os.path.normcase(os.path.abspath(paths[key]))
+            for key in ("stdlib", "platstdlib", "purelib", "platlib")
+            if paths.get(key)
+        )
+    )
+
+    from robot.libdoc import LibDoc  # type: ignore
+
+    kept_file_to_mtime = {}
+    for line in stdin:
+        line = line.strip()
+        if not line:
+            continue
+        request = json.loads(line)
+        if _has_changed_files(kept_file_to_mtime):
+            out.write(json.dumps({"restart": True}))
+            out.write("\n")
+            out.flush()
+            return
+
+        returncode, output = _run_libdoc(
+            LibDoc, request["args"], request.get("cwd"), kept_dirs, kept_file_to_mtime
+        )
+        out.write(json.dumps({"returncode": returncode, "output": output}))
+        out.write("\n")
+        out.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from typing import Optional, Set, List
+from typing import Optional, Set, List, Dict, Tuple, Iterator, Any
 import weakref
 
 from robocorp_ls_core.protocols import ITestInfoFromSymbolsCacheTypedDict
@@ -6,7 +6,49 @@ from robotframework_ls.impl.protocols import (
     ILibraryDoc,
     IRobotDocument,
     ISymbolsJsonListEntry,
+    ISymbolKeywordInfo,
 )
+from robotframework_ls.impl.keyword_name_index import KeywordNameIndex
+
+# (line, col_offset, end_col_offset, qualifier): the range only contains the
+# keyword name part of the usage and the qualifier is the normalized
+# library/resource name if the keyword is used as `Lib.Keyword` (or an
+# empty string otherwise).
+KeywordUsageEntry = Tuple[int, int, int, str]
+
+
+def iter_keyword_usage_entries(ast) -> Iterator[Tuple[Any, str, KeywordUsageEntry]]:
+    """
+    :return: an iterator with (keyword_usage_info, normalized_name, entry)
+    where the normalized_name doesn't contain the library/resource qualifier.
+    """
+    from robotframework_ls.impl import ast_utils
+    from robotframework_ls.impl.text_utilities import normalize_robot_name
+
+    for keyword_usage_info in ast_utils.iter_keyword_usage_tokens(
+        ast, collect_args_as_keywords=True
+    ):
+        keyword_name_possibly_dotted = keyword_usage_info.name
+        token = keyword_usage_info.token
+        if "." in keyword_name_possibly_dotted:
+            qualifier, keyword_name_not_dotted = keyword_name_possibly_dotted.rsplit(
+                ".", 1
+            )
+            qualifier = normalize_robot_name(qualifier)
+            # We just want to match the name part.
+            col_offset = token.col_offset + (
+                len(keyword_name_possibly_dotted) - len(keyword_name_not_dotted)
+            )
+        else:
+            qualifier = ""
+            keyword_name_not_dotted = keyword_name_possibly_dotted
+            col_offset = token.col_offset
+
+        yield (
+            keyword_usage_info,
+            normalize_robot_name(keyword_name_not_dotted),
+            (token.lineno - 1, col_offset, token.end_col_offset, qualifier),
+        )
 
 
 class BaseSymbolsCache:
@@ -21,6 +63,7 @@ class BaseSymbolsCache:
         keywords_used: Set[str],
         uri: Optional[str],  # Always available if generated from doc.
         test_info: Optional[List[ITestInfoFromSymbolsCacheTypedDict]],
+        keyword_usages: Optional[Dict[str, List[KeywordUsageEntry]]] = None,
     ):
         self._uri = uri
         if library_info is not None:
@@ -36,6 +79,10 @@ class BaseSymbolsCache:
         self._json_list = json_list
         self._keywords_used = keywords_used
         self._test_info = test_info
+        self._keyword_usages = keyword_usages
+        self._keyword_name_index: "Optional[KeywordNameIndex[ISymbolKeywordInfo]]" = (
+            None
+        )
 
     def get_test_info(self) -> Optional[List[ITestInfoFromSymbolsCacheTypedDict]]:
         return self._test_info
@@ -46,6 +93,14 @@ class BaseSymbolsCache:
     def has_keyword_usage(self, normalized_keyword_name: str) -> bool:
         return normalized_keyword_name in self._keywords_used
 
+    def get_keyword_usages(self) -> Optional[Dict[str, List[KeywordUsageEntry]]]:
+        """
+        :return: a dict with the normalized keyword name (without the
+        library/resource qualifier) to the places where it's used or None if
+        this information is not available (i.e.: for libraries).
+        """
+        return self._keyword_usages
+
     def get_json_list(self) -> List[ISymbolsJsonListEntry]:
         return self._json_list
 
@@ -60,3 +115,19 @@ class BaseSymbolsCache:
         if w is None:
             return None
         return w()
+
+    def iter_keyword_info(self) -> Iterator[ISymbolKeywordInfo]:
+        raise NotImplementedError("Not implemented in: %s" % (self.__class__,))
+
+    def get_keyword_name_index(self) -> "KeywordNameIndex[ISymbolKeywordInfo]":
+        """
+        :return: an index to search the keyword infos (see: `iter_keyword_info`)
+            by their names.
+        """
+        # Note: it's Ok if it's computed more than once in different threads.
+        keyword_name_index = self._keyword_name_index
+        if keyword_name_index is None:
+            keyword_name_index = self._keyword_name_index = KeywordNameIndex(
+                list(self.iter_keyword_info()), lambda info: info.name
+            )
+        return keyword_name_index
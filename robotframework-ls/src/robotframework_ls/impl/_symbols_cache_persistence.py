@@ -0,0 +1,202 @@
+"""
+Persists the symbols cache computed for documents in the workspace so that
+a restart of the language server only needs to re-parse the files which
+actually changed.
+
+Each entry is keyed by the document path and is validated against the
+mtime/size of the file, the Robot Framework version and the version of the
+index format (so, changing any of those invalidates the entry).
+"""
+from typing import Optional, List, Iterator, Set, Dict
+import os
+
+from robocorp_ls_core.protocols import (
+    check_implements,
+    IDirCache,
+    ITestInfoFromSymbolsCacheTypedDict,
+)
+from robocorp_ls_core.robotframework_log import get_logger
+from robotframework_ls.impl._symbols_cache import BaseSymbolsCache, KeywordUsageEntry
+from robotframework_ls.impl.protocols import (
+    IRobotDocument,
+    ISymbolsCache,
+    ISymbolKeywordInfo,
+    ISymbolsJsonListEntry,
+    IKeywordNode,
+)
+from robocorp_ls_core.lsp import MarkupContentTypedDict
+
+log = get_logger(__name__)
+
+# Bump whenever the format of the persisted data changes.
+INDEX_VERSION = "v2"
+
+
+class _PersistedKeywordInfo:
+    _documentation: MarkupContentTypedDict
+
+    __slots__ = ["name", "_index", "_symbols_cache", "_documentation"]
+
+    def __init__(self, name: str, index: int, symbols_cache: "_SymbolsCacheFromDisk"):
+        self.name = name
+        self._index = index
+        self._symbols_cache = symbols_cache
+
+    def get_documentation(self) -> MarkupContentTypedDict:
+        from robocorp_ls_core.lsp import MarkupKind
+
+        try:
+            return self._documentation
+        except AttributeError:
+            pass
+
+        # The documentation is not persisted, so, it's computed from the
+        # AST (which is only parsed when some documentation is requested).
+        node = self._symbols_cache.get_keyword_node(self._index, self.name)
+        if node is None:
+            self._documentation = {"kind": MarkupKind.Markdown, "value": ""}
+        else:
+            from robotframework_ls.impl.robot_workspace import _KeywordInfo
+
+            self._documentation = _KeywordInfo(node).get_documentation()
+        return self._documentation
+
+    def __typecheckself__(self) -> None:
+        _: ISymbolKeywordInfo = check_implements(self)
+
+
+class _SymbolsCacheFromDisk(BaseSymbolsCache):
+    _cached_keyword_info: List[ISymbolKeywordInfo]
+    _keyword_nodes: List[IKeywordNode]
+
+    def __init__(self, *args, **kwargs):
+        self._keyword_names: List[str] = kwargs.pop("keyword_names")
+        super(_SymbolsCacheFromDisk, self).__init__(*args, **kwargs)
+
+    def get_keyword_node(self, index: int, name: str) -> Optional[IKeywordNode]:
+        try:
+            keyword_nodes = self._keyword_nodes
+        except AttributeError:
+            from robotframework_ls.impl import ast_utils
+
+            keyword_nodes = []
+            doc = self.get_doc()
+            if doc is not None:
+                for keyword_node_info in ast_utils.iter_keywords(doc.get_ast()):
+                    keyword_nodes.append(keyword_node_info.node)
+            self._keyword_nodes = keyword_nodes
+
+        if index < len(keyword_nodes) and keyword_nodes[index].name == name:
+            return keyword_nodes[index]
+
+        # The document changed in the meanwhile: search by name.
+        for node in keyword_nodes:
+            if node.name == name:
+                return node
+        return None
+
+    def iter_keyword_info(self) -> Iterator[ISymbolKeywordInfo]:
+        try:
+            yield from iter(self._cached_keyword_info)
+        except:
+            cache: List[ISymbolKeywordInfo] = []
+            for i, name in enumerate(self._keyword_names):
+                keyword_info = _PersistedKeywordInfo(name, i, self)
+                yield keyword_info
+                cache.append(keyword_info)
+            self._cached_keyword_info = cache
+
+    def __typecheckself__(self) -> None:
+        _: ISymbolsCache = check_implements(self)
+
+
+class SymbolsCachePersistence(object):
+    """
+    Loads/stores the symbols cache for documents which are backed up by a
+    file in the filesystem (documents opened in the editor must not be
+    persisted as their contents don't match the contents on disk).
+    """
+
+    def __init__(self, dir_cache: IDirCache):
+        from robotframework_ls.impl.robot_version import get_robot_version
+
+        self._dir_cache = dir_cache
+        self._robot_version = get_robot_version()
+
+    def _get_validation_info(self, doc: IRobotDocument) -> Optional[list]:
+        if not doc.immutable or not doc.path:
+            return None
+
+        try:
+            stat = os.stat(doc.path)
+        except OSError:
+            return None
+
+        # Checking whether the source is in sync after getting the stat
+        # guarantees that the mtime matches the contents in the document.
+        if not doc.is_source_in_sync():
+            return None
+
+        return [INDEX_VERSION, self._robot_version, stat.st_mtime, stat.st_size]
+
+    def load(self, doc: IRobotDocument) -> Optional[ISymbolsCache]:
+        validation_info = self._get_validation_info(doc)
+        if validation_info is None:
+            return None
+
+        try:
+            value = self._dir_cache.load(("symbols_cache", doc.path), dict)
+        except KeyError:
+            return None
+
+        try:
+            if value["validation_info"] != validation_info:
+                return None
+
+            json_list: List[ISymbolsJsonListEntry] = value["json_list"]
+            keywords_used: Set[str] = set(value["keywords_used"])
+            test_info: List[ITestInfoFromSymbolsCacheTypedDict] = value["test_info"]
+            keyword_names: List[str] = value["keyword_names"]
+            # Note: json converts tuples to lists.
+            keyword_usages: Dict[str, List[KeywordUsageEntry]] = dict(
+                (name, [tuple(usage) for usage in usages])  # type: ignore
+                for name, usages in value["keyword_usages"].items()
+            )
+        except Exception:
+            log.exception("Error loading persisted symbols cache for: %s", doc.path)
+            return None
+
+        return _SymbolsCacheFromDisk(
+            json_list,
+            None,
+            doc,
+            keywords_used,
+            uri=doc.uri,
+            test_info=test_info,
+            keyword_usages=keyword_usages,
+            keyword_names=keyword_names,
+        )
+
+    def store(self, doc: IRobotDocument, symbols_cache: ISymbolsCache) -> None:
+        validation_info = self._get_validation_info(doc)
+        if validation_info is None:
+            return
+
+        assert isinstance(symbols_cache, BaseSymbolsCache)
+        try:
+            self._dir_cache.store(
+                ("symbols_cache", doc.path),
+                {
+                    "validation_info": validation_info,
+                    "json_list": symbols_cache.get_json_list(),
+                    "keywords_used": sorted(symbols_cache._keywords_used),
+                    "test_info": symbols_cache.get_test_info() or [],
+                    "keyword_usages": symbols_cache.get_keyword_usages() or {},
+                    "keyword_names": [
+                        keyword_info.name
+                        for keyword_info in symbols_cache.iter_keyword_info()
+                    ],
+                },
+            )
+        except Exception:
+            log.exception("Error persisting symbols cache for: %s", doc.path)
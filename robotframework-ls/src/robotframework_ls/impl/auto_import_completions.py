@@ -39,10 +39,24 @@ class _Collector(object):
 
         self._matcher = RobotStringMatcher(token_str)
 
+    @property
+    def filter_text(self) -> str:
+        """
+        The normalized text which must be contained in the keyword name.
+        """
+        return self._matcher.filter_text
+
     def accepts(self, keyword_name: str) -> bool:
         if not self._matcher.accepts_keyword_name(keyword_name):
             return False
 
+        return self.accepts_matched(keyword_name)
+
+    def accepts_matched(self, keyword_name: str) -> bool:
+        """
+        :param keyword_name:
+            A keyword name which is already known to match the filter text.
+        """
         keywords_found: Optional[
             List[IKeywordFound]
         ] = self.imported_keyword_name_to_keyword.get(keyword_name)
@@ -234,8 +248,10 @@ def _collect_auto_import_completions(
                 pass
             convert_keyword_format = noop
 
-        for keyword_info in symbols_cache.iter_keyword_info():
-            if collector.accepts(keyword_info.name):
+        for keyword_info in symbols_cache.get_keyword_name_index().iter_matches(
+            collector.filter_text
+        ):
+            if collector.accepts_matched(keyword_info.name):
                 item = collector._create_completion_item(
                     completion_context,
                     convert_keyword_format(keyword_info.name),
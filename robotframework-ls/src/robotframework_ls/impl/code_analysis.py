@@ -18,8 +18,12 @@ log = get_logger(__name__)
 
 class _KeywordContainer(object):
     def __init__(self) -> None:
+        from robotframework_ls.impl.embedded_args_matcher import EmbeddedArgsMatcher
+
         self._name_to_keyword: Dict[str, IKeywordFound] = {}
-        self._names_with_variables: Dict[str, IKeywordFound] = {}
+        self._embedded_args_matcher: EmbeddedArgsMatcher[
+            IKeywordFound
+        ] = EmbeddedArgsMatcher()
 
     def add_keyword(self, keyword_found: IKeywordFound) -> None:
         from robotframework_ls.impl.text_utilities import normalize_robot_name
@@ -28,11 +32,9 @@ class _KeywordContainer(object):
         self._name_to_keyword[normalized_name] = keyword_found
 
         if "{" in normalized_name:
-            self._names_with_variables[normalized_name] = keyword_found
+            self._embedded_args_matcher.add(normalized_name, keyword_found)
 
     def get_keyword(self, normalized_keyword_name: str) -> Optional[IKeywordFound]:
-        from robotframework_ls.impl.text_utilities import matches_robot_keyword
-
         keyword_found = self._name_to_keyword.get(normalized_keyword_name)
 
         if keyword_found is not None:
@@ -40,11 +42,7 @@ class _KeywordContainer(object):
 
         # We do not have an exact match, still, we need to check if we may
         # have a match in keywords that accept variables.
-        for name, keyword_found in self._names_with_variables.items():
-            if matches_robot_keyword(normalized_keyword_name, name):
-                return keyword_found
-
-        return None
+        return self._embedded_args_matcher.get_first_match(normalized_keyword_name)
 
 
 class _AnalysisKeywordsCollector(object):
@@ -10,8 +10,9 @@ from robotframework_ls.impl.protocols import (
     IKeywordCollector,
     IKeywordArg,
     ILibraryDoc,
+    ILibraryDocOrError,
 )
-from typing import Sequence, List, Dict, Optional
+from typing import Sequence, List, Dict, Optional, Tuple
 from robotframework_ls.impl.text_utilities import build_keyword_docs_with_signature
 from robocorp_ls_core.lsp import MarkupContentTypedDict, MarkupKind
 
@@ -307,33 +308,15 @@ def _collect_completions_from_ast(
         collector.on_keyword(keyword_found)
 
 
-def _collect_current_doc_keywords(
-    completion_context: ICompletionContext, collector: IKeywordCollector
-):
-    """
-    :param CompletionContext completion_context:
-    """
-    # Get keywords defined in the file itself
-
-    ast = completion_context.get_ast()
-    _collect_completions_from_ast(ast, completion_context, collector)
-
-
 _LibInfo = namedtuple("_LibInfo", "name, alias, builtin, args, node")
 
 
-def _collect_libraries_keywords(
-    completion_context: ICompletionContext, collector: IKeywordCollector
-):
+def _get_library_infos(completion_context: ICompletionContext) -> Tuple[_LibInfo, ...]:
     """
-    :param CompletionContext completion_context:
+    :return: the libraries imported in the document of the given completion
+        context (BuiltIn is always the last one).
     """
-    from robotframework_ls.impl.libspec_manager import LibspecManager
-    from robotframework_ls.impl.protocols import ILibraryDocOrError
-
-    # Get keywords from libraries
     from robotframework_ls.impl.robot_constants import BUILTIN_LIB
-    from robocorp_ls_core.lsp import CompletionItemKind
     from robotframework_ls.impl import ast_utils
 
     libraries = completion_context.get_imported_libraries()
@@ -362,180 +345,114 @@ def _collect_libraries_keywords(
             library_infos[lib_info] = True
 
     library_infos[_LibInfo(BUILTIN_LIB, None, True, None, None)] = True
-    libspec_manager: LibspecManager = completion_context.workspace.libspec_manager
-
-    for library_info in library_infos:
-        completion_context.check_cancelled()
-        if not completion_context.memo.complete_for_library(
-            library_info.name, library_info.alias
-        ):
-            continue
-
-        library_doc_or_error: ILibraryDocOrError = (
-            libspec_manager.get_library_doc_or_error(
-                library_info.name,
-                create=True,
-                current_doc_uri=completion_context.doc.uri,
-                builtin=library_info.builtin,
-                args=library_info.args,
-            )
-        )
-        library_doc = library_doc_or_error.library_doc
-        if library_doc is not None:
-            #: :type keyword: KeywordDoc
-            for keyword in library_doc.keywords:
-                keyword_name = keyword.name
-                if collector.accepts(keyword_name):
-
-                    keyword_args: Sequence[IKeywordArg] = ()
-                    if keyword.args:
-                        keyword_args = keyword.args
-
-                    collector.on_keyword(
-                        _KeywordFoundFromLibrary(
-                            library_doc,
-                            keyword,
-                            keyword_name,
-                            keyword_args,
-                            completion_context,
-                            CompletionItemKind.Method,
-                            library_alias=library_info.alias,
-                        )
-                    )
-
-            collector.on_resolved_library(
-                completion_context, library_info.node, library_doc
-            )
-        else:
-            from robot.api import Token
-
-            error_msg = library_doc_or_error.error
-
-            node = library_info.node
-            node_name_tok = node.get_token(Token.NAME)
-            if node_name_tok is not None:
-                collector.on_unresolved_library(
-                    completion_context,
-                    node.name,
-                    node_name_tok.lineno,
-                    node_name_tok.lineno,
-                    node_name_tok.col_offset,
-                    node_name_tok.end_col_offset,
-                    error_msg,
-                )
-            else:
-                collector.on_unresolved_library(
-                    completion_context,
-                    library_info.name,
-                    node.lineno,
-                    node.end_lineno,
-                    node.col_offset,
-                    node.end_col_offset,
-                    error_msg,
-                )
-
-
-def _collect_resource_imports_keywords(
-    completion_context: ICompletionContext, collector: IKeywordCollector
-):
+    return tuple(library_infos)
 
-    for node, resource_doc in completion_context.get_resource_imports_as_docs():
-        if resource_doc is None:
-            from robot.api import Token
-
-            node_name_tok = node.get_token(Token.NAME)
-            if node_name_tok is not None:
-                collector.on_unresolved_resource(
-                    completion_context,
-                    node.name,
-                    node_name_tok.lineno,
-                    node_name_tok.lineno,
-                    node_name_tok.col_offset,
-                    node_name_tok.end_col_offset,
-                )
-            else:
-                collector.on_unresolved_resource(
-                    completion_context,
-                    node.name,
-                    node.lineno,
-                    node.end_lineno,
-                    node.col_offset,
-                    node.end_col_offset,
-                )
-            continue
-        new_ctx = completion_context.create_copy(resource_doc)
-        _collect_following_imports(new_ctx, collector)
-
-
-def _collect_following_imports(
-    completion_context: ICompletionContext, collector: IKeywordCollector
-):
-    completion_context.check_cancelled()
-    if completion_context.memo.follow_import(completion_context.doc.uri):
-        # i.e.: prevent collecting keywords for the same doc more than once.
 
-        _collect_current_doc_keywords(completion_context, collector)
+def _get_library_doc_or_error(
+    completion_context: ICompletionContext, library_info: _LibInfo
+) -> ILibraryDocOrError:
+    from robotframework_ls.impl.libspec_manager import LibspecManager
 
-        _collect_resource_imports_keywords(completion_context, collector)
+    libspec_manager: LibspecManager = completion_context.workspace.libspec_manager
+    return libspec_manager.get_library_doc_or_error(
+        library_info.name,
+        create=True,
+        current_doc_uri=completion_context.doc.uri,
+        builtin=library_info.builtin,
+        args=library_info.args,
+    )
 
-        _collect_libraries_keywords(completion_context, collector)
 
+def _create_library_keywords(
+    completion_context: ICompletionContext,
+    library_info: _LibInfo,
+    library_doc: ILibraryDoc,
+) -> Tuple[IKeywordFound, ...]:
+    from robocorp_ls_core.lsp import CompletionItemKind
 
-class _CollectKeywordNameToKeywordFound:
-    def __init__(self) -> None:
-        self.keyword_name_to_keyword_found: Dict[str, List[IKeywordFound]] = {}
+    ret: List[IKeywordFound] = []
 
-    def accepts(self, keyword_name: str) -> bool:
-        return True
+    #: :type keyword: KeywordDoc
+    for keyword in library_doc.keywords:
+        keyword_args: Sequence[IKeywordArg] = ()
+        if keyword.args:
+            keyword_args = keyword.args
 
-    def on_keyword(self, keyword_found: IKeywordFound):
-        lst = self.keyword_name_to_keyword_found.get(keyword_found.keyword_name)
-        if lst is None:
-            self.keyword_name_to_keyword_found[keyword_found.keyword_name] = lst = []
-        lst.append(keyword_found)
+        ret.append(
+            _KeywordFoundFromLibrary(
+                library_doc,
+                keyword,
+                keyword.name,
+                keyword_args,
+                completion_context,
+                CompletionItemKind.Method,
+                library_alias=library_info.alias,
+            )
+        )
+    return tuple(ret)
 
-    def on_resolved_library(
-        self,
-        completion_context: ICompletionContext,
-        library_node,
-        library_doc: ILibraryDoc,
-    ):
-        pass
 
-    def on_unresolved_library(
-        self,
-        completion_context: ICompletionContext,
-        library_name: str,
-        lineno: int,
-        end_lineno: int,
-        col_offset: int,
-        end_col_offset: int,
-        error_msg: Optional[str],
-    ):
-        pass
+def _get_unresolved_library_location(
+    library_info: _LibInfo,
+) -> Tuple[str, int, int, int, int]:
+    """
+    :return: tuple(library_name, lineno, end_lineno, col_offset, end_col_offset)
+    """
+    from robot.api import Token
+
+    node = library_info.node
+    node_name_tok = node.get_token(Token.NAME)
+    if node_name_tok is not None:
+        return (
+            node.name,
+            node_name_tok.lineno,
+            node_name_tok.lineno,
+            node_name_tok.col_offset,
+            node_name_tok.end_col_offset,
+        )
+    return (
+        library_info.name,
+        node.lineno,
+        node.end_lineno,
+        node.col_offset,
+        node.end_col_offset,
+    )
 
-    def on_unresolved_resource(
-        self,
-        completion_context: ICompletionContext,
-        resource_name: str,
-        lineno: int,
-        end_lineno: int,
-        col_offset: int,
-        end_col_offset: int,
-    ):
-        pass
 
-    def __typecheckself__(self) -> None:
-        _: IKeywordCollector = check_implements(self)
+def _get_unresolved_resource_location(node) -> Tuple[str, int, int, int, int]:
+    """
+    :return: tuple(resource_name, lineno, end_lineno, col_offset, end_col_offset)
+    """
+    from robot.api import Token
+
+    node_name_tok = node.get_token(Token.NAME)
+    if node_name_tok is not None:
+        return (
+            node.name,
+            node_name_tok.lineno,
+            node_name_tok.lineno,
+            node_name_tok.col_offset,
+            node_name_tok.end_col_offset,
+        )
+    return (
+        node.name,
+        node.lineno,
+        node.end_lineno,
+        node.col_offset,
+        node.end_col_offset,
+    )
 
 
 def collect_keyword_name_to_keyword_found(
     completion_context: ICompletionContext,
 ) -> Dict[str, List[IKeywordFound]]:
-    completion_context.memo.clear()
-    collector = _CollectKeywordNameToKeywordFound()
-    _collect_following_imports(completion_context, collector)
-    return collector.keyword_name_to_keyword_found
+    """
+    Note: the returned dict is shared by the requests which use the same
+    resolved scope (so, it must not be mutated).
+    """
+    from robotframework_ls.impl.import_graph import get_resolved_scope
+
+    return get_resolved_scope(completion_context).keyword_name_to_keyword_found
 
 
 def collect_keywords(
@@ -544,5 +461,8 @@ def collect_keywords(
     """
     Collects all the keywords that are available to the given completion_context.
     """
-    completion_context.memo.clear()
-    _collect_following_imports(completion_context, collector)
+    from robotframework_ls.impl.import_graph import get_resolved_scope
+
+    get_resolved_scope(completion_context).collect_keywords(
+        completion_context, collector
+    )
@@ -25,19 +25,7 @@ log = get_logger(__name__)
 
 class _Memo(object):
     def __init__(self):
-        self.clear()
-
-    def clear(self):
         self._followed_imports_variables = {}
-        self._followed_imports = {}
-        self._completed_libraries = {}
-
-    def follow_import(self, uri: str) -> bool:
-        if uri not in self._followed_imports:
-            self._followed_imports[uri] = True
-            return True
-
-        return False
 
     def follow_import_variables(self, uri: str) -> bool:
         if uri not in self._followed_imports_variables:
@@ -46,14 +34,6 @@ class _Memo(object):
 
         return False
 
-    def complete_for_library(self, library_name: str, alias: Optional[str]) -> bool:
-        key = (library_name, alias)
-        if key not in self._completed_libraries:
-            self._completed_libraries[key] = True
-            return True
-
-        return False
-
 
 class BaseContext(object):
     def __init__(self, workspace: IRobotWorkspace, config: IConfig, monitor: IMonitor):
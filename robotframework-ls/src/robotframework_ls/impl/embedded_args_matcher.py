@@ -0,0 +1,79 @@
+"""
+Matches a keyword call against many keywords with embedded arguments at once.
+
+The keywords are bucketed by the static text before their first variable
+(for each different length of that text there's a dict from the text to the
+keywords), so, for a given call only the keywords whose static prefix is a
+prefix of the call need to be checked (instead of checking the regexp of
+each keyword with embedded arguments).
+"""
+from typing import Dict, Generic, Iterator, List, Optional, Tuple, TypeVar
+
+from robotframework_ls.impl.text_utilities import (
+    KeywordNamePattern,
+    get_keyword_name_pattern,
+)
+
+T = TypeVar("T")
+
+
+class EmbeddedArgsMatcher(Generic[T]):
+    def __init__(self) -> None:
+        # Note: an entry is never removed (adding the same name again just
+        # replaces the value but keeps the original position).
+        self._entries: List[Tuple[KeywordNamePattern, T]] = []
+        self._name_to_position: Dict[str, int] = {}
+
+        # len(prefix) -> prefix -> positions
+        self._prefix_len_to_positions: Dict[int, Dict[str, List[int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, normalized_name: str, value: T) -> None:
+        """
+        :param normalized_name:
+            The normalized keyword name (which has variables -- i.e.: '{').
+        """
+        position = self._name_to_position.get(normalized_name)
+        pattern = get_keyword_name_pattern(normalized_name)
+        if position is not None:
+            self._entries[position] = (pattern, value)
+            return
+
+        position = len(self._entries)
+        self._entries.append((pattern, value))
+        self._name_to_position[normalized_name] = position
+
+        prefix_to_positions = self._prefix_len_to_positions.get(len(pattern.prefix))
+        if prefix_to_positions is None:
+            prefix_to_positions = self._prefix_len_to_positions[
+                len(pattern.prefix)
+            ] = {}
+        prefix_to_positions.setdefault(pattern.prefix, []).append(position)
+
+    def iter_matches(self, normalized_keyword_name_call_text: str) -> Iterator[T]:
+        """
+        :return: the values of the keywords which match the given call (in
+            the order in which they were added).
+        """
+        text = normalized_keyword_name_call_text
+        candidates: List[int] = []
+        for prefix_len, prefix_to_positions in self._prefix_len_to_positions.items():
+            if prefix_len > len(text):
+                continue
+            positions = prefix_to_positions.get(text[:prefix_len])
+            if positions:
+                candidates.extend(positions)
+
+        candidates.sort()
+        entries = self._entries
+        for position in candidates:
+            pattern, value = entries[position]
+            if pattern.match(text):
+                yield value
+
+    def get_first_match(self, normalized_keyword_name_call_text: str) -> Optional[T]:
+        for value in self.iter_matches(normalized_keyword_name_call_text):
+            return value
+        return None
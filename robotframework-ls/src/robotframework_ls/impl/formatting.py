@@ -20,32 +20,198 @@ def robot_source_format(source, space_count=4):
     return formatted
 
 
-def _create_range(d, offset1, offset2):
+# When there are no unique lines to be used as anchors in the patience diff,
+# ranges up to this size (len(a) * len(b)) are matched with difflib (bigger
+# ranges are considered as changed as a whole).
+_MAX_DIFFLIB_LINES_PRODUCT = 250000
+
+# Hunks bigger than this (in chars) aren't diffed at the char level as a whole:
+# the lines are first aligned by their contents without whitespaces (which is
+# what usually changes when formatting).
+_MAX_CHARS_TO_DIFF_HUNK = 200
+
+# Contents bigger than this (in chars) are replaced as a whole (without a
+# char level diff).
+_MAX_CHARS_TO_DIFF_CHARS = 20000
+
+
+def _longest_increasing_subsequence(pairs):
+    """
+    :param pairs: list(tuple(int, int))
+        Pairs sorted by the first element.
+
+    :return list(tuple(int, int)):
+        The longest subsequence of the pairs where the second element is also
+        increasing.
+    """
+    import bisect
+
+    tails = []  # The second element of the last pair in each pile.
+    tail_indexes = []
+    predecessors = [-1] * len(pairs)
+    for i, (_, j) in enumerate(pairs):
+        pile = bisect.bisect_left(tails, j)
+        if pile > 0:
+            predecessors[i] = tail_indexes[pile - 1]
+        if pile == len(tails):
+            tails.append(j)
+            tail_indexes.append(i)
+        else:
+            tails[pile] = j
+            tail_indexes[pile] = i
+
+    ret = []
+    i = tail_indexes[-1] if tail_indexes else -1
+    while i != -1:
+        ret.append(pairs[i])
+        i = predecessors[i]
+    ret.reverse()
+    return ret
+
+
+def _get_matching_indexes(a, b):
+    """
+    Patience diff: the items which appear only once in both sequences are used
+    as anchors (and the ranges between the anchors are matched recursively).
+
+    :return list(tuple(int, int)):
+        The (sorted) indexes of the items matched in `a` and `b`.
+    """
+    from difflib import SequenceMatcher
+
+    matched = []
+    ranges = [(0, len(a), 0, len(b))]
+    while ranges:
+        alo, ahi, blo, bhi = ranges.pop()
+
+        while alo < ahi and blo < bhi and a[alo] == b[blo]:
+            matched.append((alo, blo))
+            alo += 1
+            blo += 1
+
+        while alo < ahi and blo < bhi and a[ahi - 1] == b[bhi - 1]:
+            ahi -= 1
+            bhi -= 1
+            matched.append((ahi, bhi))
+
+        if alo == ahi or blo == bhi:
+            continue
+
+        a_item_to_index = {}
+        for i in range(alo, ahi):
+            a_item_to_index[a[i]] = i if a[i] not in a_item_to_index else -1
+
+        b_item_to_index = {}
+        for j in range(blo, bhi):
+            item = b[j]
+            if a_item_to_index.get(item, -1) != -1:
+                b_item_to_index[item] = j if item not in b_item_to_index else -1
+
+        anchors = _longest_increasing_subsequence(
+            sorted(
+                (a_item_to_index[item], j)
+                for item, j in b_item_to_index.items()
+                if j != -1
+            )
+        )
+        if not anchors:
+            if (ahi - alo) * (bhi - blo) <= _MAX_DIFFLIB_LINES_PRODUCT:
+                s = SequenceMatcher(None, a[alo:ahi], b[blo:bhi], autojunk=False)
+                for i, j, n in s.get_matching_blocks():
+                    for k in range(n):
+                        matched.append((alo + i + k, blo + j + k))
+            continue
+
+        matched.extend(anchors)
+        for i, j in anchors:
+            ranges.append((alo, i, blo, j))
+            alo = i + 1
+            blo = j + 1
+        ranges.append((alo, ahi, blo, bhi))
+
+    matched.sort()
+    return matched
+
+
+def _iter_changed_hunks(a, b):
+    """
+    :return iterator(tuple(int, int, int, int)):
+        The ranges (i1, i2, j1, j2) where a[i1:i2] must be changed to b[j1:j2].
+    """
+    i = j = 0
+    for match_i, match_j in _get_matching_indexes(a, b) + [(len(a), len(b))]:
+        if match_i != i or match_j != j:
+            yield i, match_i, j, match_j
+        i = match_i + 1
+        j = match_j + 1
+
+
+class _LinesOffsetConverter(object):
+    """
+    Converts an offset in the contents of lines[i1:i2] to a (line, col) in
+    the document (where lines are the lines of the whole document).
+    """
+
+    def __init__(self, lines, i1, i2):
+        self._first_line = i1
+        self._line_start_offsets = line_start_offsets = []
+        offset = 0
+        for i in range(i1, i2):
+            line_start_offsets.append(offset)
+            offset += len(lines[i])
+
+        if i2 > i1 and lines[i2 - 1].endswith(("\r", "\n")):
+            # The offset at the end is at the start of the next line.
+            line_start_offsets.append(offset)
+
+    def offset_to_line_col(self, offset):
+        import bisect
+
+        i_line = bisect.bisect_right(self._line_start_offsets, offset) - 1
+        return (
+            self._first_line + i_line,
+            offset - self._line_start_offsets[i_line],
+        )
+
+
+def _create_range(converter, offset1, offset2):
     from robocorp_ls_core.lsp import Range
 
-    return Range(d.offset_to_line_col(offset1), d.offset_to_line_col(offset2))
+    return Range(
+        converter.offset_to_line_col(offset1), converter.offset_to_line_col(offset2)
+    )
 
 
-def create_text_edit_from_diff(contents, new_contents):
+def _add_char_edits(lst, old_lines, new_lines, i1, i2, j1, j2):
+    """
+    Adds the TextEdits to change old_lines[i1:i2] into new_lines[j1:j2]
+    diffing at the char level.
+    """
     from difflib import SequenceMatcher
+    from robocorp_ls_core.lsp import Range
     from robocorp_ls_core.lsp import TextEdit
-    from robocorp_ls_core.workspace import Document
 
-    d = Document("", contents)
+    contents = "".join(old_lines[i1:i2])
+    new_contents = "".join(new_lines[j1:j2])
+    if i1 == i2:
+        # Just an insertion at the start of line i1.
+        lst.append(TextEdit(Range((i1, 0), (i1, 0)), new_contents))
+        return
 
-    s = SequenceMatcher(None, contents, new_contents)
-    lst = []
-    for tag, i1, i2, j1, j2 in s.get_opcodes():
-        # print(
-        #     "%7s a[%d:%d] (%s) b[%d:%d] (%s)"
-        #     % (tag, i1, i2, contents[i1:i2], j1, j2, new_contents[j1:j2])
-        # )
+    converter = _LinesOffsetConverter(old_lines, i1, i2)
+    if j1 == j2 or len(contents) + len(new_contents) > _MAX_CHARS_TO_DIFF_CHARS:
+        lst.append(TextEdit(_create_range(converter, 0, len(contents)), new_contents))
+        return
 
+    s = SequenceMatcher(None, contents, new_contents, autojunk=False)
+    for tag, ci1, ci2, cj1, cj2 in s.get_opcodes():
         if tag in ("replace", "insert"):
-            lst.append(TextEdit(_create_range(d, i1, i2), new_contents[j1:j2]))
+            lst.append(
+                TextEdit(_create_range(converter, ci1, ci2), new_contents[cj1:cj2])
+            )
 
         elif tag == "delete":
-            lst.append(TextEdit(_create_range(d, i1, i2), ""))
+            lst.append(TextEdit(_create_range(converter, ci1, ci2), ""))
 
         elif tag == "equal":
             pass
@@ -53,4 +219,205 @@ def create_text_edit_from_diff(contents, new_contents):
         else:
             raise AssertionError("Unhandled: %s" % (tag,))
 
+
+def _hunk_chars(lines, i1, i2):
+    return sum(len(lines[i]) for i in range(i1, i2))
+
+
+def _add_hunk_edits(lst, old_lines, new_lines, i1, i2, j1, j2):
+    if (
+        i1 == i2
+        or j1 == j2
+        or _hunk_chars(old_lines, i1, i2) + _hunk_chars(new_lines, j1, j2)
+        <= _MAX_CHARS_TO_DIFF_HUNK
+    ):
+        _add_char_edits(lst, old_lines, new_lines, i1, i2, j1, j2)
+        return
+
+    # A big hunk: align the lines which are the same when whitespaces are
+    # ignored and diff each of those at the char level (what's not aligned is
+    # diffed at the char level as a whole).
+    old_keys = ["".join(line.split()) for line in old_lines[i1:i2]]
+    new_keys = ["".join(line.split()) for line in new_lines[j1:j2]]
+
+    i = j = 0
+    for match_i, match_j in _get_matching_indexes(old_keys, new_keys) + [
+        (len(old_keys), len(new_keys))
+    ]:
+        if match_i != i or match_j != j:
+            _add_char_edits(
+                lst, old_lines, new_lines, i1 + i, i1 + match_i, j1 + j, j1 + match_j
+            )
+
+        if match_i < len(old_keys) and (
+            old_lines[i1 + match_i] != new_lines[j1 + match_j]
+        ):
+            _add_char_edits(
+                lst,
+                old_lines,
+                new_lines,
+                i1 + match_i,
+                i1 + match_i + 1,
+                j1 + match_j,
+                j1 + match_j + 1,
+            )
+        i = match_i + 1
+        j = match_j + 1
+
+
+def create_text_edit_from_diff(contents, new_contents):
+    """
+    Creates the TextEdits to change `contents` into `new_contents`.
+
+    The diff is first done at the line level (with a patience diff) and only
+    the lines which changed are then diffed at the char level.
+    """
+    old_lines = contents.splitlines(True)
+    new_lines = new_contents.splitlines(True)
+
+    lst = []
+    for i1, i2, j1, j2 in _iter_changed_hunks(old_lines, new_lines):
+        _add_hunk_edits(lst, old_lines, new_lines, i1, i2, j1, j2)
+    return lst
+
+
+# Section class name -> (classes of the blocks formatted, header used to
+# format the block)
+_SECTION_CLASS_TO_FORMAT_BLOCK_INFO = {
+    "TestCaseSection": (("TestCase",), "*** Test Cases ***\n"),
+    "KeywordSection": (("Keyword",), "*** Keywords ***\n"),
+    "SettingSection": (None, "*** Settings ***\n"),
+    "VariableSection": (None, "*** Variables ***\n"),
+}
+
+
+def _iter_blocks_in_lines(ast, lines_count, start_line, end_line):
+    """
+    :return iterator(tuple(int, int, str)):
+        The (start line, end line (exclusive), header) of the blocks (test
+        cases, keywords or statements in the settings/variables sections)
+        which have some line in the range from start_line to end_line (0-based,
+        inclusive).
+    """
+    sections = ast.sections
+    for section_i, section in enumerate(sections):
+        if section_i + 1 < len(sections):
+            section_end = sections[section_i + 1].lineno - 1
+        else:
+            section_end = lines_count
+
+        if section_end <= start_line:
+            continue
+        if section.lineno - 1 > end_line:
+            break
+
+        block_info = _SECTION_CLASS_TO_FORMAT_BLOCK_INFO.get(section.__class__.__name__)
+        if block_info is None:
+            continue
+
+        block_class_names, header = block_info
+        body = section.body
+        for body_i, node in enumerate(body):
+            node_start = node.lineno - 1
+            if node_start > end_line:
+                break
+
+            if body_i + 1 < len(body):
+                node_end = body[body_i + 1].lineno - 1
+            else:
+                node_end = section_end
+
+            if node_end <= start_line:
+                continue
+
+            class_name = node.__class__.__name__
+            if block_class_names is None:
+                if class_name == "EmptyLine":
+                    continue
+            elif class_name not in block_class_names:
+                continue
+
+            yield node_start, node_end, header
+
+
+def _get_formatted_block(formatted):
+    """
+    :return: the contents of the formatted block (without the section header
+        and without the empty lines before/after it).
+    """
+    lines = formatted.splitlines(True)
+    for i, line in enumerate(lines):
+        if line.startswith("*"):
+            lines = lines[i + 1 :]
+            break
+    else:
+        return None
+
+    while lines and not lines[0].strip():
+        del lines[0]
+    while lines and not lines[-1].strip():
+        del lines[-1]
+    return "".join(lines)
+
+
+def create_range_text_edits(ast, lines, start_line, end_line, format_source):
+    """
+    Creates the TextEdits to format only the blocks (test cases, keywords or
+    statements in the settings/variables sections) which have some line in
+    the range from start_line to end_line (0-based, inclusive).
+
+    Each block is formatted separately (parsed along with the header of its
+    section), so, the time to format is proportional to the blocks formatted
+    and not to the size of the document.
+
+    :param ast:
+        The AST of the document.
+
+    :param lines:
+        The lines of the document (with the line endings).
+
+    :param format_source:
+        A callable which receives the source of a document and returns the
+        formatted source (or None if it wasn't changed).
+    """
+    lst = []
+    for block_start, block_end, header in _iter_blocks_in_lines(
+        ast, len(lines), start_line, end_line
+    ):
+        # The empty lines after the block are kept as is.
+        content_end = block_end
+        while content_end > block_start and not lines[content_end - 1].strip():
+            content_end -= 1
+
+        content_lines = lines[block_start:content_end]
+        if not content_lines or content_lines[0].lstrip().startswith("..."):
+            # i.e.: a continuation of the previous statement.
+            continue
+
+        if any(line.startswith("*") for line in content_lines):
+            # Something which may be a section header (even an invalid one)
+            # changes how the block is parsed.
+            continue
+
+        content = "".join(content_lines)
+        formatted = format_source(header + content)
+        if formatted is None:
+            continue
+
+        new_content = _get_formatted_block(formatted)
+        if not new_content:
+            continue
+
+        # Keep the line ending of the last line of the block.
+        new_content = (
+            new_content.rstrip("\r\n") + content[len(content.rstrip("\r\n")) :]
+        )
+
+        if new_content == content:
+            continue
+
+        for text_edit in create_text_edit_from_diff(content, new_content):
+            text_edit.range.start.line += block_start
+            text_edit.range.end.line += block_start
+            lst.append(text_edit)
     return lst
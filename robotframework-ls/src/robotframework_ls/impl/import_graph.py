@@ -0,0 +1,442 @@
+"""
+A workspace-level import graph used to resolve the keywords available to a
+document (its "resolved scope").
+
+- Each document visited has a `_DocNode` with the keywords it defines and the
+  resources/libraries it imports (resolved with the settings in effect when
+  the node was created).
+
+- A `ResolvedScope` is the result of following the imports from a given
+  document: the keywords found (in the same order in which they were always
+  collected), along with the resolved/unresolved libraries and resources.
+
+Both are memoized and are only recomputed when a document in the transitive
+import closure changes (which is checked through the identity of the document
+in the workspace, as a new document is created on each change), when a
+library resolves to a different `LibraryDoc` or when the settings used to
+resolve the imports change. Until then, requests for the same document just
+replay the resolved scope.
+
+Note: an unresolved resource import is always checked again (so, creating
+the missing file makes it resolved), but a new file which would shadow an
+already resolved resource (i.e.: a file with the same name in a directory
+checked earlier) is only noticed when the importing document changes.
+"""
+from collections import OrderedDict
+from typing import Optional, List, Dict, Tuple, Set, Any, cast
+import sys
+import threading
+
+from robocorp_ls_core.robotframework_log import get_logger
+from robotframework_ls.impl.keyword_name_index import KeywordNameIndex
+from robotframework_ls.impl.protocols import (
+    ICompletionContext,
+    IKeywordCollector,
+    IKeywordFound,
+    ILibraryDoc,
+    IRobotDocument,
+    IRobotWorkspace,
+)
+
+log = get_logger(__name__)
+
+# The number of resolved scopes kept (each document which is the target of a
+# request has a resolved scope, whereas the nodes are shared by all scopes).
+_MAX_RESOLVED_SCOPES = 100
+
+_ON_KEYWORD = 0
+_ON_RESOLVED_LIBRARY = 1
+_ON_UNRESOLVED_LIBRARY = 2
+_ON_UNRESOLVED_RESOURCE = 3
+
+
+def _get_settings_key(config) -> Tuple[Any, ...]:
+    """
+    :return: the settings which affect how imports are resolved.
+    """
+    from robotframework_ls.impl.robot_lsp_constants import (
+        OPTION_ROBOT_PYTHONPATH,
+        OPTION_ROBOT_VARIABLES,
+        OPTION_ROBOT_PYTHON_ENV,
+    )
+
+    if config is None:
+        return (None, tuple(sys.path))
+
+    return (
+        config.get_setting(OPTION_ROBOT_PYTHONPATH, list, []),
+        config.get_setting(OPTION_ROBOT_VARIABLES, dict, {}),
+        config.get_setting(OPTION_ROBOT_PYTHON_ENV, dict, {}),
+        tuple(sys.path),
+    )
+
+
+class _KeywordsCollector(object):
+    def __init__(self) -> None:
+        self.keywords: List[IKeywordFound] = []
+
+    def accepts(self, keyword_name: str) -> bool:
+        return True
+
+    def on_keyword(self, keyword_found: IKeywordFound):
+        self.keywords.append(keyword_found)
+
+
+class _DocNode(object):
+    """
+    What a single document provides to the documents which import it.
+    """
+
+    def __init__(
+        self, doc: IRobotDocument, workspace: IRobotWorkspace, config, settings_key
+    ):
+        from robotframework_ls.impl.completion_context import CompletionContext
+        from robotframework_ls.impl.collect_keywords import (
+            _collect_completions_from_ast,
+            _get_library_infos,
+            _get_unresolved_resource_location,
+        )
+
+        # Note: the keywords found keep a reference to this context, so, it
+        # must not be the context of the request (which has the selection and
+        # the monitor of that request).
+        completion_context = CompletionContext(doc, workspace=workspace, config=config)
+        self.doc = doc
+        self.completion_context = completion_context
+        self.settings_key = settings_key
+
+        collector = _KeywordsCollector()
+        _collect_completions_from_ast(
+            completion_context.get_ast(), completion_context, collector
+        )
+        self.keywords: Tuple[IKeywordFound, ...] = tuple(collector.keywords)
+
+        # tuple(uri or None, location of the unresolved import or None)
+        resource_imports: List[Tuple[Optional[str], Optional[tuple]]] = []
+        unresolved_resource_imports = []
+        for node, resource_doc in completion_context.get_resource_imports_as_docs():
+            if resource_doc is None:
+                resource_imports.append((None, _get_unresolved_resource_location(node)))
+                unresolved_resource_imports.append(node)
+            else:
+                resource_imports.append((resource_doc.uri, None))
+        self.resource_imports: Tuple[
+            Tuple[Optional[str], Optional[tuple]], ...
+        ] = tuple(resource_imports)
+        self._unresolved_resource_imports = tuple(unresolved_resource_imports)
+
+        self.library_infos = _get_library_infos(completion_context)
+        self._library_info_to_keywords: Dict[
+            Any, Tuple[ILibraryDoc, Tuple[IKeywordFound, ...]]
+        ] = {}
+
+    def is_valid(
+        self, doc: IRobotDocument, workspace: IRobotWorkspace, config, settings_key
+    ) -> bool:
+        from robotframework_ls.impl.completion_context import CompletionContext
+
+        if self.doc is not doc or self.settings_key != settings_key:
+            return False
+
+        for uri, _location in self.resource_imports:
+            if uri is not None:
+                if workspace.get_document(uri, accept_from_file=True) is None:
+                    return False
+
+        if self._unresolved_resource_imports:
+            completion_context = CompletionContext(
+                doc, workspace=workspace, config=config
+            )
+            for node in self._unresolved_resource_imports:
+                if completion_context.get_resource_import_as_doc(node) is not None:
+                    return False
+        return True
+
+    def get_library_keywords(
+        self, library_info, library_doc: ILibraryDoc
+    ) -> Tuple[IKeywordFound, ...]:
+        from robotframework_ls.impl.collect_keywords import _create_library_keywords
+
+        cached = self._library_info_to_keywords.get(library_info)
+        if cached is not None and cached[0] is library_doc:
+            return cached[1]
+
+        keywords = _create_library_keywords(
+            self.completion_context, library_info, library_doc
+        )
+        self._library_info_to_keywords[library_info] = (library_doc, keywords)
+        return keywords
+
+
+class ResolvedScope(object):
+    """
+    The keywords, libraries and resources available to a given document.
+    """
+
+    def __init__(self, settings_key) -> None:
+        self.settings_key = settings_key
+        self.keyword_name_to_keyword_found: Dict[str, List[IKeywordFound]] = {}
+
+        # The nodes in the import closure (the first one is the node of the
+        # document for which the scope was resolved).
+        self.nodes: List[_DocNode] = []
+
+        # tuple(node, library_info, library_doc, error_msg)
+        self.libraries: List[Tuple[_DocNode, Any, Optional[ILibraryDoc], Any]] = []
+
+        self._events: List[tuple] = []
+        self._keyword_name_index: Optional[KeywordNameIndex[str]] = None
+
+    def get_keyword_name_index(self) -> "KeywordNameIndex[str]":
+        """
+        :return: an index to search the keyword names available in this scope.
+        """
+        # Note: it's Ok if it's computed more than once in different threads.
+        keyword_name_index = self._keyword_name_index
+        if keyword_name_index is None:
+            keyword_name_index = self._keyword_name_index = KeywordNameIndex(
+                list(self.keyword_name_to_keyword_found), lambda name: name
+            )
+        return keyword_name_index
+
+    def _add_keyword(self, keyword_found: IKeywordFound) -> None:
+        self._events.append((_ON_KEYWORD, keyword_found))
+        lst = self.keyword_name_to_keyword_found.get(keyword_found.keyword_name)
+        if lst is None:
+            self.keyword_name_to_keyword_found[keyword_found.keyword_name] = lst = []
+        lst.append(keyword_found)
+
+    def collect_keywords(
+        self, completion_context: ICompletionContext, collector: IKeywordCollector
+    ) -> None:
+        """
+        Provides the collector with the same notifications it'd receive if
+        the imports were actually followed.
+        """
+        completion_context.check_cancelled()
+        accepts = collector.accepts
+        on_keyword = collector.on_keyword
+
+        for event in self._events:
+            kind = event[0]
+            if kind == _ON_KEYWORD:
+                keyword_found = event[1]
+                if accepts(keyword_found.keyword_name):
+                    on_keyword(keyword_found)
+
+            elif kind == _ON_RESOLVED_LIBRARY:
+                collector.on_resolved_library(*event[1:])
+
+            elif kind == _ON_UNRESOLVED_LIBRARY:
+                collector.on_unresolved_library(*event[1:])
+
+            elif kind == _ON_UNRESOLVED_RESOURCE:
+                collector.on_unresolved_resource(*event[1:])
+
+
+class ImportGraph(object):
+    """
+    Keeps the nodes of the import graph (keyed by the document uri) and the
+    resolved scopes of the documents which were the target of a request.
+
+    It's thread-safe: requests may run concurrently (in which case the same
+    node/scope may end up being computed more than once).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._uri_to_node: Dict[str, _DocNode] = {}
+        self._uri_to_resolved_scope: "OrderedDict[str, ResolvedScope]" = OrderedDict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._uri_to_node.clear()
+            self._uri_to_resolved_scope.clear()
+
+    def _get_node(
+        self,
+        doc: IRobotDocument,
+        completion_context: ICompletionContext,
+        settings_key,
+        checked: Dict[str, _DocNode],
+    ) -> _DocNode:
+        """
+        :param checked:
+            The nodes already checked in the current request.
+        """
+        node = checked.get(doc.uri)
+        if node is not None and node.doc is doc:
+            return node
+
+        workspace = completion_context.workspace
+        config = completion_context.config
+        node = self._uri_to_node.get(doc.uri)
+        if node is None or not node.is_valid(doc, workspace, config, settings_key):
+            completion_context.check_cancelled()
+            node = _DocNode(doc, workspace, config, settings_key)
+            with self._lock:
+                self._uri_to_node[doc.uri] = node
+
+        checked[doc.uri] = node
+        return node
+
+    def _is_valid(
+        self,
+        resolved_scope: ResolvedScope,
+        completion_context: ICompletionContext,
+        settings_key,
+        checked: Dict[str, _DocNode],
+    ) -> bool:
+        from robotframework_ls.impl.collect_keywords import _get_library_doc_or_error
+
+        if resolved_scope.settings_key != settings_key:
+            return False
+
+        workspace = completion_context.workspace
+        for i, node in enumerate(resolved_scope.nodes):
+            if i == 0:
+                doc = completion_context.doc
+            else:
+                resource_doc = cast(
+                    Optional[IRobotDocument],
+                    workspace.get_document(node.doc.uri, accept_from_file=True),
+                )
+                if resource_doc is None:
+                    return False
+                doc = resource_doc
+
+            if (
+                self._get_node(doc, completion_context, settings_key, checked)
+                is not node
+            ):
+                return False
+
+        for node, library_info, library_doc, error_msg in resolved_scope.libraries:
+            completion_context.check_cancelled()
+            library_doc_or_error = _get_library_doc_or_error(
+                node.completion_context, library_info
+            )
+            if library_doc_or_error.library_doc is not library_doc:
+                return False
+            if library_doc is None and library_doc_or_error.error != error_msg:
+                return False
+
+        return True
+
+    def _resolve_scope(
+        self,
+        completion_context: ICompletionContext,
+        settings_key,
+        checked: Dict[str, _DocNode],
+    ) -> ResolvedScope:
+        from robotframework_ls.impl.collect_keywords import (
+            _get_library_doc_or_error,
+            _get_unresolved_library_location,
+        )
+
+        resolved_scope = ResolvedScope(settings_key)
+        events = resolved_scope._events
+        workspace = completion_context.workspace
+
+        followed_imports: Set[str] = set()
+        completed_libraries: Set[Tuple[str, Optional[str]]] = set()
+
+        def follow_imports(doc: IRobotDocument) -> None:
+            completion_context.check_cancelled()
+            if doc.uri in followed_imports:
+                # i.e.: prevent collecting keywords for the same doc more than once.
+                return
+            followed_imports.add(doc.uri)
+
+            node = self._get_node(doc, completion_context, settings_key, checked)
+            resolved_scope.nodes.append(node)
+            node_ctx = node.completion_context
+
+            for keyword_found in node.keywords:
+                resolved_scope._add_keyword(keyword_found)
+
+            for uri, location in node.resource_imports:
+                if uri is None:
+                    assert location is not None
+                    events.append((_ON_UNRESOLVED_RESOURCE, node_ctx) + location)
+                    continue
+
+                resource_doc = cast(
+                    Optional[IRobotDocument],
+                    workspace.get_document(uri, accept_from_file=True),
+                )
+                if resource_doc is not None:
+                    follow_imports(resource_doc)
+
+            for library_info in node.library_infos:
+                key = (library_info.name, library_info.alias)
+                if key in completed_libraries:
+                    continue
+                completed_libraries.add(key)
+
+                completion_context.check_cancelled()
+                library_doc_or_error = _get_library_doc_or_error(node_ctx, library_info)
+                library_doc = library_doc_or_error.library_doc
+                resolved_scope.libraries.append(
+                    (node, library_info, library_doc, library_doc_or_error.error)
+                )
+                if library_doc is not None:
+                    for keyword_found in node.get_library_keywords(
+                        library_info, library_doc
+                    ):
+                        resolved_scope._add_keyword(keyword_found)
+
+                    events.append(
+                        (
+                            _ON_RESOLVED_LIBRARY,
+                            node_ctx,
+                            library_info.node,
+                            library_doc,
+                        )
+                    )
+                else:
+                    events.append(
+                        (_ON_UNRESOLVED_LIBRARY, node_ctx)
+                        + _get_unresolved_library_location(library_info)
+                        + (library_doc_or_error.error,)
+                    )
+
+        follow_imports(completion_context.doc)
+        return resolved_scope
+
+    def get_resolved_scope(
+        self, completion_context: ICompletionContext
+    ) -> ResolvedScope:
+        settings_key = _get_settings_key(completion_context.config)
+        uri = completion_context.doc.uri
+        checked: Dict[str, _DocNode] = {}
+
+        with self._lock:
+            resolved_scope = self._uri_to_resolved_scope.get(uri)
+
+        if resolved_scope is not None:
+            if self._is_valid(
+                resolved_scope, completion_context, settings_key, checked
+            ):
+                with self._lock:
+                    if uri in self._uri_to_resolved_scope:
+                        self._uri_to_resolved_scope.move_to_end(uri)
+                return resolved_scope
+
+        resolved_scope = self._resolve_scope(completion_context, settings_key, checked)
+        with self._lock:
+            self._uri_to_resolved_scope[uri] = resolved_scope
+            self._uri_to_resolved_scope.move_to_end(uri)
+            while len(self._uri_to_resolved_scope) > _MAX_RESOLVED_SCOPES:
+                self._uri_to_resolved_scope.popitem(last=False)
+        return resolved_scope
+
+
+def get_resolved_scope(completion_context: ICompletionContext) -> ResolvedScope:
+    import_graph: Optional[ImportGraph] = getattr(
+        completion_context.workspace, "import_graph", None
+    )
+    if import_graph is None:
+        # Not really cached (the workspace doesn't have an import graph).
+        import_graph = ImportGraph()
+    return import_graph.get_resolved_scope(completion_context)
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Set
 
 from robocorp_ls_core.protocols import check_implements
 from robocorp_ls_core.robotframework_log import get_logger
@@ -13,13 +13,19 @@ from robocorp_ls_core.lsp import (
     CompletionItemTypedDict,
     InsertTextFormat,
 )
+from robotframework_ls.impl.keyword_name_index import KeywordNameIndex
 
 
 log = get_logger(__name__)
 
 
 class _Collector(object):
-    def __init__(self, completion_context: ICompletionContext, token):
+    def __init__(
+        self,
+        completion_context: ICompletionContext,
+        token,
+        keyword_name_index: "KeywordNameIndex[str]",
+    ):
         from robotframework_ls.impl.string_matcher import RobotStringMatcher
         from robotframework_ls.impl.string_matcher import (
             build_matchers_with_resource_or_library_scope,
@@ -39,13 +45,19 @@ class _Collector(object):
 
         self._convert_keyword_format = create_convert_keyword_format_func(config)
 
-    def accepts(self, keyword_name: str) -> bool:
-        if self._matcher.accepts_keyword_name(keyword_name):
-            return True
+        # The names are searched in the index only once (afterwards just
+        # checking whether a name is in the related set is enough).
+        self._names_accepted_by_matcher: Set[str] = set(
+            keyword_name_index.iter_matches(self._matcher.filter_text)
+        )
+        self._accepted_names: Set[str] = self._names_accepted_by_matcher.copy()
         for matcher in self._scope_matchers:
-            if matcher.accepts_keyword_name(keyword_name):
-                return True
-        return False
+            self._accepted_names.update(
+                keyword_name_index.iter_matches(matcher.filter_text)
+            )
+
+    def accepts(self, keyword_name: str) -> bool:
+        return keyword_name in self._accepted_names
 
     def _create_completion_item_from_keyword(
         self, keyword_found: IKeywordFound, selection, token, col_delta=0
@@ -97,7 +109,7 @@ class _Collector(object):
 
     def on_keyword(self, keyword_found):
         col_delta = 0
-        if not self._matcher.accepts_keyword_name(keyword_found.keyword_name):
+        if keyword_found.keyword_name not in self._names_accepted_by_matcher:
             for matcher in self._scope_matchers:
                 if matcher.accepts_keyword(keyword_found):
                     # +1 for the dot
@@ -152,15 +164,18 @@ class _Collector(object):
 
 
 def complete(completion_context: ICompletionContext) -> List[CompletionItemTypedDict]:
-    from robotframework_ls.impl.collect_keywords import collect_keywords
+    from robotframework_ls.impl.import_graph import get_resolved_scope
     from robotframework_ls.impl import ast_utils
 
     token_info = completion_context.get_current_token()
     if token_info is not None:
         token = ast_utils.get_keyword_name_token(token_info.node, token_info.token)
         if token is not None:
-            collector = _Collector(completion_context, token)
-            collect_keywords(completion_context, collector)
+            resolved_scope = get_resolved_scope(completion_context)
+            collector = _Collector(
+                completion_context, token, resolved_scope.get_keyword_name_index()
+            )
+            resolved_scope.collect_keywords(completion_context, collector)
 
             return collector.completion_items
 
@@ -0,0 +1,89 @@
+"""
+An index to find the keyword names which contain a given text (the same
+matching done by `RobotStringMatcher.accepts_keyword_name`, where both the
+text and the keyword name are normalized).
+
+The normalized names are split in bigrams and trigrams and, for each one,
+the positions of the names which contain it are kept, so, a query only needs
+to check the names in the smallest list of positions of the bigrams/trigrams
+of the text being searched (instead of normalizing and checking all the
+names).
+
+Indexes are immutable: they're created for a given list of keywords (i.e.:
+for the keywords of a symbols cache or of a resolved scope), so, when
+something changes only the index for the changed part is created again.
+"""
+from array import array
+from typing import Callable, Dict, Generic, Iterator, List, Sequence, TypeVar
+
+from robotframework_ls.impl.text_utilities import normalize_robot_name
+
+T = TypeVar("T")
+
+# Below this number of names just checking all the (pre-normalized) names is
+# faster than using the bigrams/trigrams.
+_MIN_NAMES_TO_INDEX = 64
+
+
+def _iter_grams(normalized_name: str, n: int) -> Iterator[str]:
+    for i in range(len(normalized_name) - n + 1):
+        yield normalized_name[i : i + n]
+
+
+class KeywordNameIndex(Generic[T]):
+    def __init__(self, items: Sequence[T], get_name: Callable[[T], str]):
+        self._items: Sequence[T] = items
+        self._normalized_names: List[str] = [
+            normalize_robot_name(get_name(item)) for item in items
+        ]
+
+        self._gram_to_positions: Dict[str, "array[int]"] = {}
+        if len(items) >= _MIN_NAMES_TO_INDEX:
+            gram_to_positions = self._gram_to_positions
+            for position, normalized_name in enumerate(self._normalized_names):
+                for n in (2, 3):
+                    for gram in set(_iter_grams(normalized_name, n)):
+                        positions = gram_to_positions.get(gram)
+                        if positions is None:
+                            positions = gram_to_positions[gram] = array("i")
+                        positions.append(position)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def iter_matches(self, normalized_text: str) -> Iterator[T]:
+        """
+        :param normalized_text:
+            The text to be searched (already normalized with
+            `normalize_robot_name`).
+
+        :return: the items whose normalized name contains the given text (in
+            the same order in which they were given).
+        """
+        items = self._items
+        normalized_names = self._normalized_names
+
+        if not normalized_text:
+            yield from iter(items)
+            return
+
+        if not self._gram_to_positions or len(normalized_text) < 2:
+            for item, normalized_name in zip(items, normalized_names):
+                if normalized_text in normalized_name:
+                    yield item
+            return
+
+        n = 3 if len(normalized_text) >= 3 else 2
+        gram_to_positions = self._gram_to_positions
+        smallest = None
+        for gram in _iter_grams(normalized_text, n):
+            positions = gram_to_positions.get(gram)
+            if positions is None:
+                return  # i.e.: no name has this gram.
+            if smallest is None or len(positions) < len(smallest):
+                smallest = positions
+
+        assert smallest is not None
+        for position in smallest:
+            if normalized_text in normalized_names[position]:
+                yield items[position]
@@ -0,0 +1,222 @@
+"""
+A pool of long-lived processes which generate .libspec files (so that the
+startup of the interpreter and the import of robotframework is paid only once
+per worker and not once per library).
+
+See: _libdoc_worker.py for the process which actually runs libdoc.
+"""
+from typing import Optional, List, Tuple, Set
+import os
+import sys
+import threading
+import time
+
+from robocorp_ls_core.robotframework_log import get_logger
+
+log = get_logger(__name__)
+
+# Each LibspecManager has its own pool, so, keep the default small.
+_DEFAULT_MAX_WORKERS = 2
+
+# Workers which weren't used for this time (in seconds) are stopped.
+_IDLE_WORKER_TIMEOUT = 60
+
+
+class LibdocWorkerError(Exception):
+    """
+    Raised when it's not possible to use a worker (i.e.: it died or couldn't
+    be started).
+    """
+
+
+class _LibdocWorkerRestart(Exception):
+    """
+    Raised when a worker exited because modules it had loaded changed (the
+    request must be done in a new worker).
+    """
+
+
+class _LibdocWorker(object):
+    def __init__(self):
+        from robocorp_ls_core.subprocess_wrapper import subprocess
+        from robotframework_ls.impl import _libdoc_worker
+
+        # Note: the env is always inherited (the process which has the
+        # LibspecManager must be the target env already).
+        self._process = subprocess.Popen(
+            [sys.executable, "-u", _libdoc_worker.__file__],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        self.idle_since = 0.0
+
+    def run_libdoc(self, args: List[str], cwd: Optional[str]) -> Tuple[int, str]:
+        import json
+
+        process = self._process
+        try:
+            process.stdin.write(
+                json.dumps({"args": args, "cwd": cwd}).encode("utf-8") + b"\n"
+            )
+            process.stdin.flush()
+            line = process.stdout.readline()
+        except OSError as e:
+            raise LibdocWorkerError(f"Error communicating with libdoc worker: {e}")
+
+        if not line:
+            raise LibdocWorkerError(
+                f"Libdoc worker exited (return code: {process.poll()})."
+            )
+
+        try:
+            reply = json.loads(line.decode("utf-8"))
+            if reply.get("restart"):
+                raise _LibdocWorkerRestart()
+            return reply["returncode"], reply["output"]
+        except _LibdocWorkerRestart:
+            raise
+        except Exception as e:
+            raise LibdocWorkerError(f"Invalid reply from libdoc worker: {e}")
+
+    def dispose(self):
+        process = self._process
+        try:
+            process.stdin.close()
+        except:
+            pass
+        try:
+            if process.poll() is None:
+                process.kill()
+            process.wait(timeout=1)
+        except:
+            log.debug("Error disposing libdoc worker.", exc_info=True)
+        try:
+            process.stdout.close()
+        except:
+            pass
+
+
+class LibdocWorkerPool(object):
+    """
+    Workers are started on demand (up to `max_workers`) and are kept alive
+    for later requests (a worker which is idle for `idle_timeout` seconds is
+    stopped). If a worker dies it's just discarded (and a new one is started
+    when needed).
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        idle_timeout: float = _IDLE_WORKER_TIMEOUT,
+    ):
+        self._max_workers = max_workers or min(
+            _DEFAULT_MAX_WORKERS, os.cpu_count() or 1
+        )
+        self._idle_timeout = idle_timeout
+        self._semaphore = threading.BoundedSemaphore(self._max_workers)
+        self._lock = threading.Lock()
+        self._idle_workers: List[_LibdocWorker] = []
+        self._all_workers: Set[_LibdocWorker] = set()
+        self._disposed = False
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def _obtain_worker(self) -> _LibdocWorker:
+        with self._lock:
+            if self._disposed:
+                raise LibdocWorkerError("Libdoc worker pool already disposed.")
+            if self._idle_workers:
+                return self._idle_workers.pop()
+
+        try:
+            worker = _LibdocWorker()
+        except Exception as e:
+            raise LibdocWorkerError(f"Unable to start libdoc worker: {e}")
+
+        with self._lock:
+            self._all_workers.add(worker)
+            if self._disposed:
+                # Disposed while it was being created.
+                self._all_workers.discard(worker)
+                worker.dispose()
+                raise LibdocWorkerError("Libdoc worker pool already disposed.")
+        return worker
+
+    def run_libdoc(self, args: List[str], cwd: Optional[str]) -> Tuple[int, str]:
+        """
+        :param args:
+            The command line arguments to libdoc (i.e.: what would be passed
+            after `python -m robot.libdoc`).
+
+        :return: tuple(returncode, output)
+
+        :raises LibdocWorkerError:
+            If it wasn't possible to run libdoc in a worker.
+        """
+        with self._semaphore:
+            try:
+                return self._run_libdoc_in_worker(args, cwd)
+            except _LibdocWorkerRestart:
+                log.info("Libdoc worker restarted (loaded modules changed).")
+                return self._run_libdoc_in_worker(args, cwd)
+
+    def _run_libdoc_in_worker(
+        self, args: List[str], cwd: Optional[str]
+    ) -> Tuple[int, str]:
+        from robocorp_ls_core.timeouts import TimeoutTracker
+
+        worker = self._obtain_worker()
+        try:
+            ret = worker.run_libdoc(args, cwd)
+        except:
+            with self._lock:
+                self._all_workers.discard(worker)
+            worker.dispose()
+            raise
+
+        with self._lock:
+            if not self._disposed:
+                worker.idle_since = time.monotonic()
+                self._idle_workers.append(worker)
+                TimeoutTracker.get_singleton().call_on_timeout(
+                    self._idle_timeout, self._stop_idle_workers
+                )
+                return ret
+            self._all_workers.discard(worker)
+
+        worker.dispose()
+        return ret
+
+    def _stop_idle_workers(self) -> None:
+        # Note: a small tolerance is used because the timeout may be called
+        # slightly before the worker is considered idle for the full timeout.
+        stop_before = time.monotonic() - self._idle_timeout + 0.5
+        with self._lock:
+            stop = [w for w in self._idle_workers if w.idle_since <= stop_before]
+            for worker in stop:
+                self._idle_workers.remove(worker)
+                self._all_workers.discard(worker)
+
+        for worker in stop:
+            log.debug("Stopping idle libdoc worker.")
+            worker.dispose()
+
+    def count_workers(self) -> int:
+        """
+        :return: the number of workers currently running.
+        """
+        with self._lock:
+            return len(self._all_workers)
+
+    def dispose(self):
+        with self._lock:
+            self._disposed = True
+            workers = list(self._all_workers)
+            self._all_workers.clear()
+            del self._idle_workers[:]
+
+        for worker in workers:
+            worker.dispose()
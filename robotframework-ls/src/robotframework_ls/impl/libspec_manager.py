@@ -3,7 +3,7 @@ import sys
 from robotframework_ls.constants import NULL
 from robocorp_ls_core.robotframework_log import get_logger
 import threading
-from typing import Optional, Dict, Set, Iterator, Union, Any
+from typing import Optional, Dict, Set, Iterator, Union, Any, List
 from robocorp_ls_core.protocols import Sentinel, IEndPoint
 from robotframework_ls.impl.protocols import ILibraryDoc, ILibraryDocOrError
 import itertools
@@ -22,6 +22,9 @@ import typing
 from robotframework_ls.impl.text_utilities import get_digest_from_string
 from robocorp_ls_core.basic import normalize_filename
 
+if typing.TYPE_CHECKING:
+    from robotframework_ls.impl.libdoc_worker_pool import LibdocWorkerPool
+
 log = get_logger(__name__)
 
 
@@ -66,6 +69,10 @@ def _load_library_doc_and_mtime(libspec_manager, spec_filename: str, obtain_mute
     from robotframework_ls.impl.libspec_markdown_conversion import (
         load_markdown_json_version,
     )
+    from robotframework_ls.impl.libspec_pickle_cache import (
+        load_pickled_library_doc,
+        dump_pickled_library_doc,
+    )
 
     ctx: Any
     if obtain_mutex:
@@ -76,6 +83,12 @@ def _load_library_doc_and_mtime(libspec_manager, spec_filename: str, obtain_mute
         # We must load it with a mutex to avoid conflicts between generating/reading.
         try:
             mtime = os.path.getmtime(spec_filename)
+            libdoc = load_pickled_library_doc(libspec_manager, spec_filename, mtime)
+            if libdoc is not None:
+                if libdoc.doc_format != "markdown":
+                    libspec_manager.schedule_conversion_to_markdown(spec_filename)
+                return libdoc, mtime
+
             libdoc = load_markdown_json_version(libspec_manager, spec_filename, mtime)
 
             if libdoc is None:
@@ -83,6 +96,8 @@ def _load_library_doc_and_mtime(libspec_manager, spec_filename: str, obtain_mute
                 libdoc = builder.build(spec_filename)
                 if libdoc.doc_format != "markdown":
                     libspec_manager.schedule_conversion_to_markdown(spec_filename)
+
+            dump_pickled_library_doc(libspec_manager, spec_filename, mtime, libdoc)
             return libdoc, mtime
         except Exception:
             log.exception("Error when loading spec info from: %s", spec_filename)
@@ -437,10 +452,15 @@ class LibspecManager(object):
         endpoint: Optional[IEndPoint] = None,
         pre_generate_libspecs: bool = False,
         cache_libspec_dir: Optional[str] = None,
+        use_libdoc_worker_pool: bool = True,
     ):
         """
         :param __internal_libspec_dir__:
             Only to be used in tests (to regenerate the builtins)!
+
+        :param use_libdoc_worker_pool:
+            If True, libspecs are generated in long-lived worker processes,
+            otherwise a new process is created for each libspec.
         """
         from robocorp_ls_core import watchdog_wrapper
         from robocorp_ls_core.cache import DirCache
@@ -498,6 +518,11 @@ class LibspecManager(object):
 
         self._libspec_warmup = LibspecWarmup(endpoint, dir_cache)
 
+        # The libdoc worker pool is only created when some libspec is generated.
+        self.use_libdoc_worker_pool = use_libdoc_worker_pool
+        self._libdoc_worker_pool: Optional["LibdocWorkerPool"] = None
+        self._libdoc_worker_pool_lock = threading.Lock()
+
         self._libspec_failures_cache: Dict[
             tuple, str
         ] = {}  # key -> error creating libspec
@@ -841,6 +866,59 @@ class LibspecManager(object):
 
         return subprocess.check_output(*args, **kwargs)
 
+    def _get_libdoc_worker_pool(self) -> Optional["LibdocWorkerPool"]:
+        if not self.use_libdoc_worker_pool:
+            return None
+
+        libdoc_worker_pool = self._libdoc_worker_pool
+        if libdoc_worker_pool is None:
+            with self._libdoc_worker_pool_lock:
+                libdoc_worker_pool = self._libdoc_worker_pool
+                if libdoc_worker_pool is None:
+                    from robotframework_ls.impl.libdoc_worker_pool import (
+                        LibdocWorkerPool,
+                    )
+
+                    libdoc_worker_pool = self._libdoc_worker_pool = LibdocWorkerPool()
+        return libdoc_worker_pool
+
+    def _run_libdoc(self, libdoc_args: List[str], cwd: Optional[str]) -> None:
+        """
+        Runs libdoc with the given arguments (in a worker from the libdoc
+        worker pool if possible, otherwise in a new process).
+
+        :raises subprocess.CalledProcessError:
+            If libdoc failed.
+        """
+        from robocorp_ls_core.subprocess_wrapper import subprocess
+
+        call = [sys.executable, "-m", "robot.libdoc"] + libdoc_args
+
+        libdoc_worker_pool = self._get_libdoc_worker_pool()
+        if libdoc_worker_pool is not None:
+            from robotframework_ls.impl.libdoc_worker_pool import LibdocWorkerError
+
+            try:
+                returncode, output = libdoc_worker_pool.run_libdoc(libdoc_args, cwd)
+            except LibdocWorkerError:
+                log.exception("Error running libdoc in worker (retrying in process).")
+            else:
+                if returncode != 0:
+                    raise subprocess.CalledProcessError(
+                        returncode, call, output=output.encode("utf-8", "replace")
+                    )
+                return
+
+        # Note: stdout is always subprocess.PIPE in this call.
+        # Note: the env is always inherited (the process which has
+        # the LibspecManager must be the target env already).
+        self._subprocess_check_output(
+            call,
+            stderr=subprocess.STDOUT,
+            stdin=subprocess.PIPE,
+            cwd=cwd,
+        )
+
     def _cached_create_libspec(
         self,
         libname: str,
@@ -903,31 +981,29 @@ class LibspecManager(object):
 
         try:
             try:
-                call = [sys.executable]
+                libdoc_args: List[str] = []
                 major_version = self.get_robot_major_version()
                 if major_version < 4:
-                    call.extend("-m robot.libdoc --format XML".split())
+                    libdoc_args.extend("--format XML".split())
                 else:
-                    call.extend(
-                        "-m robot.libdoc --format XML --specdocformat RAW".split()
-                    )
+                    libdoc_args.extend("--format XML --specdocformat RAW".split())
 
                 if additional_path and additional_path_exists:
-                    call.extend(["-P", os.path.normpath(additional_path)])
+                    libdoc_args.extend(["-P", os.path.normpath(additional_path)])
 
                 if _internal_force_text:
-                    call.append("--docformat")
-                    call.append("text")
+                    libdoc_args.append("--docformat")
+                    libdoc_args.append("text")
 
                 # Note: always set as a whole, so, iterate in generator is thread-safe.
                 for entry in self._additional_pythonpath_folder_to_folder_info:
                     if os.path.exists(entry):
-                        call.extend(["-P", os.path.normpath(entry)])
+                        libdoc_args.extend(["-P", os.path.normpath(entry)])
 
                 if not args:
-                    call.append(libname)
+                    libdoc_args.append(libname)
                 else:
-                    call.append("::".join([libname, args]))
+                    libdoc_args.append("::".join([libname, args]))
 
                 libspec_filename = self._compute_libspec_filename(
                     libname, is_builtin, target_file, args
@@ -938,7 +1014,7 @@ class LibspecManager(object):
                     log.debug(
                         f"Obtained mutex to generate libspec: {libspec_filename}."
                     )
-                    call.append(libspec_filename)
+                    libdoc_args.append(libspec_filename)
 
                     mtime: float = -1
                     try:
@@ -947,24 +1023,16 @@ class LibspecManager(object):
                         pass
 
                     log.debug(
-                        "Generating libspec for: %s.\nCwd:%s\nCommand line:\n%s",
+                        "Generating libspec for: %s.\nCwd:%s\nLibdoc args:\n%s",
                         libname,
                         cwd,
-                        " ".join(call),
+                        " ".join(libdoc_args),
                     )
                     try:
                         try:
-                            # Note: stdout is always subprocess.PIPE in this call.
-                            # Note: the env is always inherited (the process which has
-                            # the LibspecManager must be the target env already).
-                            self._subprocess_check_output(
-                                call,
-                                stderr=subprocess.STDOUT,
-                                stdin=subprocess.PIPE,
-                                cwd=cwd,
-                            )
+                            self._run_libdoc(libdoc_args, cwd)
                         except OSError as e:
-                            log.exception("Error calling: %s", call)
+                            log.exception("Error calling libdoc with: %s", libdoc_args)
                             # We may have something as: Ignore OSError: [WinError 6] The handle is invalid,
                             # give the result based on whether the file changed on disk.
                             try:
@@ -1032,6 +1100,9 @@ class LibspecManager(object):
 
     def dispose(self):
         self._file_changes_notifier.dispose()
+        libdoc_worker_pool = self._libdoc_worker_pool
+        if libdoc_worker_pool is not None:
+            libdoc_worker_pool.dispose()
         if self.libspec_markdown_conversion is not None:
             self.libspec_markdown_conversion.dispose()
 
@@ -0,0 +1,286 @@
+"""
+Keeps a pickled version of the `LibraryDoc` built from a `.libspec` (or from
+its markdown json version) in the libspec cache dir so that loading a library
+doesn't need to parse the xml/json again.
+
+The file has 2 pickles followed by the docs:
+
+- the validation info (format version, libspec mtime and markdown json mtime),
+- the `LibraryDoc` itself (which is only unpickled if the validation info
+  matches) where the (big) docs are just references to the docs blob,
+- the utf-8 encoded docs blob.
+
+This file is shared by all the processes which use the same interpreter (the
+first one to load a given libspec creates it while holding the libspec
+mutex) and the docs are only read from it when actually requested, so, a
+process which doesn't need the docs (i.e.: the one which does the linting)
+doesn't need to keep them in memory.
+"""
+from typing import Optional, List, Tuple, Any, Dict, Hashable
+import os
+import threading
+
+from robocorp_ls_core.basic import normalize_filename
+from robocorp_ls_core.robotframework_log import get_logger
+from robotframework_ls.impl.protocols import ILibraryDoc
+from robotframework_ls.impl.text_utilities import get_digest_from_string
+
+log = get_logger(__name__)
+
+# Bump whenever the pickled classes change in an incompatible way.
+PICKLE_CACHE_VERSION = "v3"
+
+# Protocol 4 is the highest one available in Python 3.7.
+_PICKLE_PROTOCOL = 4
+
+# Docs smaller than this are kept in the pickle.
+_MIN_LAZY_DOC_LEN = 80
+
+_DOC_STORE_PERSISTENT_ID = "doc_store"
+
+
+class _DocStore(object):
+    """
+    Provides the docs from the docs blob of a pickle cache file.
+
+    If the file is rewritten (i.e.: the libspec changed or its markdown json
+    version was created) while the `LibraryDoc` is still alive, the docs are
+    read from the new file (matched by the key of the object which has the doc).
+    """
+
+    def __init__(self, filename: str, stat_key: Tuple[Any, ...]):
+        self._filename = filename
+        self._stat_key = stat_key
+        self._lock = threading.Lock()
+        self.blob_start = -1
+
+        # Only available after the file is rewritten: key -> (offset, length)
+        # in the new file.
+        self._key_to_location: Optional[Dict[Hashable, Tuple[int, int]]] = None
+
+    def read(self, offset: int, length: int, key: Hashable) -> Optional[str]:
+        """
+        :return: the doc or None if it couldn't be read.
+        """
+        try:
+            with self._lock, open(self._filename, "rb") as stream:
+                stat_key = _get_stat_key(stream)
+                if stat_key != self._stat_key:
+                    log.info(
+                        "Pickled libdoc changed: %s (loading docs from new version).",
+                        self._filename,
+                    )
+                    self._key_to_location = _load_doc_locations(stream)
+                    self._stat_key = stat_key
+                    self.blob_start = stream.tell()
+
+                if self._key_to_location is not None:
+                    location = self._key_to_location.get(key)
+                    if location is None:
+                        # The object is no longer in the new version.
+                        return ""
+                    offset, length = location
+
+                stream.seek(self.blob_start + offset)
+                return stream.read(length).decode("utf-8")
+        except Exception:
+            log.exception("Error loading doc from: %s", self._filename)
+            return None
+
+
+class _DocRef(object):
+    __slots__ = ["_store", "_offset", "_length", "_key"]
+
+    def __init__(self, store: _DocStore, offset: int, length: int, key: Hashable):
+        self._store = store
+        self._offset = offset
+        self._length = length
+        self._key = key
+
+    def load(self) -> Optional[str]:
+        return self._store.read(self._offset, self._length, self._key)
+
+    def __reduce__(self):
+        return (_DocRef, (self._store, self._offset, self._length, self._key))
+
+
+def _get_doc_key(obj) -> Hashable:
+    return (obj.__class__.__name__, getattr(obj, "name", None))
+
+
+def _load_doc_locations(stream) -> Dict[Hashable, Tuple[int, int]]:
+    """
+    Reads the pickles of a (rewritten) pickle cache file and provides the
+    location of each doc in its docs blob.
+
+    The stream is left at the start of the docs blob.
+    """
+    import pickle
+
+    key_to_location: Dict[Hashable, Tuple[int, int]] = {}
+
+    def new_doc_ref(_store, offset, length, key):
+        key_to_location[key] = (offset, length)
+
+    class _Unpickler(pickle.Unpickler):
+        def persistent_load(self, pid):
+            if pid == _DOC_STORE_PERSISTENT_ID:
+                return None
+            raise pickle.UnpicklingError(f"Unexpected persistent id: {pid}")
+
+        def find_class(self, module, name):
+            if module == __name__ and name == "_DocRef":
+                return new_doc_ref
+            return super().find_class(module, name)
+
+    stream.seek(0)
+    validation_info = pickle.load(stream)
+    if validation_info[0] != PICKLE_CACHE_VERSION:
+        raise RuntimeError(f"Unexpected pickle cache version: {validation_info[0]}")
+    _Unpickler(stream).load()
+    return key_to_location
+
+
+def _new_instance(cls):
+    return cls.__new__(cls)
+
+
+def _get_stat_key(stream) -> Tuple[Any, ...]:
+    stat = os.fstat(stream.fileno())
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def get_pickle_cache_filename(libspec_manager, spec_filename: str) -> str:
+    spec_filename = normalize_filename(spec_filename)
+    digest = get_digest_from_string(spec_filename)
+
+    return os.path.join(
+        libspec_manager.cache_libspec_dir,
+        f"{digest}_{os.path.basename(spec_filename)}.pickle",
+    )
+
+
+def _get_validation_info(libspec_manager, spec_filename: str, mtime: float) -> list:
+    from robotframework_ls.impl.libspec_markdown_conversion import (
+        _get_markdown_json_version_filename,
+    )
+
+    target_json = _get_markdown_json_version_filename(libspec_manager, spec_filename)
+    try:
+        json_mtime: Optional[float] = os.path.getmtime(target_json)
+    except OSError:
+        json_mtime = None
+
+    return [PICKLE_CACHE_VERSION, mtime, json_mtime]
+
+
+def load_pickled_library_doc(
+    libspec_manager, spec_filename: str, mtime: float
+) -> Optional[ILibraryDoc]:
+    """
+    :return: the `LibraryDoc` or None if there's no pickled version or if it's
+        no longer valid.
+    """
+    import pickle
+
+    target = get_pickle_cache_filename(libspec_manager, spec_filename)
+    try:
+        stream = open(target, "rb")
+    except OSError:
+        log.debug("Unable to load pickled libdoc: %s (file does not exist)", target)
+        return None
+
+    try:
+        with stream:
+            validation_info = pickle.load(stream)
+            if validation_info != _get_validation_info(
+                libspec_manager, spec_filename, mtime
+            ):
+                log.debug(
+                    "Unable to load pickled libdoc: %s (no longer valid).", target
+                )
+                return None
+
+            store = _DocStore(target, _get_stat_key(stream))
+
+            class _Unpickler(pickle.Unpickler):
+                def persistent_load(self, pid):
+                    if pid == _DOC_STORE_PERSISTENT_ID:
+                        return store
+                    raise pickle.UnpicklingError(f"Unexpected persistent id: {pid}")
+
+            libdoc = _Unpickler(stream).load()
+            # The docs blob starts right after the pickled LibraryDoc.
+            store.blob_start = stream.tell()
+
+        # The filename must be the one requested (even if the pickle was
+        # created for another path with the same normalized name).
+        libdoc.filename = spec_filename
+        return libdoc
+    except Exception:
+        log.exception("Error loading pickled libdoc: %s", target)
+        return None
+
+
+def dump_pickled_library_doc(
+    libspec_manager, spec_filename: str, mtime: float, libdoc: ILibraryDoc
+) -> None:
+    import copyreg
+    import pickle
+    import tempfile
+    from robotframework_ls.impl import robot_specbuilder
+
+    target = get_pickle_cache_filename(libspec_manager, spec_filename)
+    validation_info = _get_validation_info(libspec_manager, spec_filename, mtime)
+
+    # Note: the actual store is only available when loading.
+    store = _DocStore(target, ())
+    blob: List[bytes] = []
+    blob_len = 0
+
+    def reduce_with_doc_ref(obj):
+        nonlocal blob_len
+
+        doc = obj.doc
+        state = obj.__getstate__()
+        if doc and len(doc) >= _MIN_LAZY_DOC_LEN:
+            encoded = doc.encode("utf-8")
+            state["_doc"] = _DocRef(store, blob_len, len(encoded), _get_doc_key(obj))
+            blob.append(encoded)
+            blob_len += len(encoded)
+        else:
+            state["_doc"] = doc
+        return (_new_instance, (obj.__class__,), state)
+
+    class _Pickler(pickle.Pickler):
+        def persistent_id(self, obj):
+            if obj is store:
+                return _DOC_STORE_PERSISTENT_ID
+            return None
+
+    try:
+        dirname = os.path.dirname(target)
+        os.makedirs(dirname, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode="wb", dir=dirname, suffix=".tmp", delete=False
+        ) as tempf:
+            pickle.dump(validation_info, tempf, protocol=_PICKLE_PROTOCOL)
+
+            pickler = _Pickler(tempf, protocol=_PICKLE_PROTOCOL)
+            dispatch_table = copyreg.dispatch_table.copy()
+            for cls in (
+                robot_specbuilder.LibraryDoc,
+                robot_specbuilder.KeywordDoc,
+                robot_specbuilder.TypedDictDoc,
+                robot_specbuilder.EnumDoc,
+                robot_specbuilder.CustomDoc,
+            ):
+                dispatch_table[cls] = reduce_with_doc_ref
+            pickler.dispatch_table = dispatch_table
+            pickler.dump(libdoc)
+
+            for encoded in blob:
+                tempf.write(encoded)
+        os.replace(tempf.name, target)
+    except Exception:
+        log.exception("Error pickling libdoc to: %s", target)
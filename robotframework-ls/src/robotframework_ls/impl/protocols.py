@@ -10,6 +10,7 @@ from typing import (
     Generic,
     Iterator,
     Callable,
+    Dict,
 )
 from robocorp_ls_core.protocols import (
     Sentinel,
@@ -241,6 +242,13 @@ class ISymbolsCache(Protocol):
     def has_keyword_usage(self, normalized_keyword_name: str) -> bool:
         pass
 
+    def get_keyword_usages(
+        self,
+    ) -> Optional[Dict[str, List[Tuple[int, int, int, str]]]]:
+        """
+        :return: normalized keyword name -> list(line, col, end_col, qualifier)
+        """
+
     def get_json_list(self) -> List[ISymbolsJsonListEntry]:
         pass
 
@@ -256,9 +264,15 @@ class ISymbolsCache(Protocol):
     def iter_keyword_info(self) -> Iterator[ISymbolKeywordInfo]:
         pass
 
+    def get_keyword_name_index(self) -> Any:
+        """
+        :return: a `KeywordNameIndex` with the items from `iter_keyword_info`.
+        """
+
 
 class IRobotWorkspace(IWorkspace, Protocol):
     libspec_manager: Any
+    import_graph: Any
 
     def iter_all_doc_uris_in_workspace(
         self, extensions: Tuple[str, ...]
@@ -13,6 +13,7 @@ from robotframework_ls.impl.protocols import (
 import typing
 from robocorp_ls_core.protocols import check_implements
 from robocorp_ls_core.basic import isinstance_name, normalize_filename
+from robotframework_ls.impl._symbols_cache import KeywordUsageEntry
 
 
 log = get_logger(__name__)
@@ -91,91 +92,76 @@ def iter_keyword_references_in_doc(
     maps to the proper place (if not given, we'll just match based on the name
     without verifying if the definition is the same).
     """
-    from robotframework_ls.impl import ast_utils
-    from robotframework_ls.impl.find_definition import find_definition
-    from robotframework_ls.impl.completion_context import CompletionContext
-    from robotframework_ls.impl.text_utilities import normalize_robot_name
+    from robotframework_ls.impl._symbols_cache import iter_keyword_usage_entries
 
     ast = doc.get_ast()
     if ast is not None:
-        # Dict with normalized name -> whether it was found or not previously.
-        found_in_this_doc: Dict[str, bool] = {}
-
-        # Ok, we have the document, now, load the usages.
-        for keyword_usage_info in ast_utils.iter_keyword_usage_tokens(
-            ast, collect_args_as_keywords=True
-        ):
+        usages: List[KeywordUsageEntry] = []
+        for _usage_info, name, entry in iter_keyword_usage_entries(ast):
             completion_context.check_cancelled()
-            keword_name_possibly_dotted = keyword_usage_info.name
-            found_dot_in_usage = "." in keword_name_possibly_dotted
-            if found_dot_in_usage:
-                keword_name_not_dotted = keword_name_possibly_dotted.split(".")[-1]
-            else:
-                keword_name_not_dotted = keword_name_possibly_dotted
-
-            if normalize_robot_name(keword_name_not_dotted) == normalized_name:
-                found_once_in_this_doc = found_in_this_doc.get(
-                    keword_name_possibly_dotted
+            if name == normalized_name:
+                usages.append(entry)
+
+        yield from _iter_verified_keyword_references_in_doc(
+            completion_context, doc, usages, keyword_found
+        )
+
+
+def _iter_verified_keyword_references_in_doc(
+    completion_context: ICompletionContext,
+    doc: IRobotDocument,
+    usages: List[KeywordUsageEntry],
+    keyword_found: Optional[IKeywordFound],
+) -> Iterator[RangeTypedDict]:
+    """
+    :param usages: the usages of the keyword in the document (already
+    filtered by name).
+    """
+    from robotframework_ls.impl.find_definition import find_definition
+    from robotframework_ls.impl.completion_context import CompletionContext
+
+    # Dict with qualifier -> whether it was found or not previously.
+    found_in_this_doc: Dict[str, bool] = {}
+
+    for line, col_offset, end_col_offset, qualifier in usages:
+        completion_context.check_cancelled()
+
+        if keyword_found is not None:
+            found_once_in_this_doc = found_in_this_doc.get(qualifier)
+            if found_once_in_this_doc is None:
+                # Verify if it's actually the same one (not one defined in
+                # a different place with the same name).
+                new_ctx = CompletionContext(
+                    doc,
+                    line,
+                    col_offset,
+                    workspace=completion_context.workspace,
+                    config=completion_context.config,
+                    monitor=completion_context.monitor,
                 )
-                token = keyword_usage_info.token
-
-                line = token.lineno - 1
-
-                if keyword_found is not None:
-                    if found_once_in_this_doc is None:
-                        # Verify if it's actually the same one (not one defined in
-                        # a different place with the same name).
-
-                        new_ctx = CompletionContext(
-                            doc,
-                            line,
-                            token.col_offset,
-                            workspace=completion_context.workspace,
-                            config=completion_context.config,
-                            monitor=completion_context.monitor,
-                        )
-                        definitions = find_definition(new_ctx)
-                        for definition in definitions:
-                            found = matches_source(
-                                definition.source, keyword_found.source
-                            )
-
-                            if found:
-                                found_once_in_this_doc = found_in_this_doc[
-                                    keword_name_possibly_dotted
-                                ] = True
-                                break
-                        else:
-                            found_once_in_this_doc = found_in_this_doc[
-                                keword_name_possibly_dotted
-                            ] = False
-                            continue
-
-                    if not found_once_in_this_doc:
-                        continue
-
-                token = keyword_usage_info.token
-                if found_dot_in_usage:
-                    # We need to create a new token because we just want to match the name part.
-                    col_offset = token.col_offset + (
-                        len(keword_name_possibly_dotted) - len(keword_name_not_dotted)
-                    )
-                    end_col_offset = token.end_col_offset
+                definitions = find_definition(new_ctx)
+                for definition in definitions:
+                    if matches_source(definition.source, keyword_found.source):
+                        found_once_in_this_doc = True
+                        break
                 else:
-                    col_offset = token.col_offset
-                    end_col_offset = token.end_col_offset
+                    found_once_in_this_doc = False
+                found_in_this_doc[qualifier] = found_once_in_this_doc
 
-                # Ok, we found it, let's add it to the result.
-                yield {
-                    "start": {
-                        "line": line,
-                        "character": col_offset,
-                    },
-                    "end": {
-                        "line": line,
-                        "character": end_col_offset,
-                    },
-                }
+            if not found_once_in_this_doc:
+                continue
+
+        # Ok, we found it, let's add it to the result.
+        yield {
+            "start": {
+                "line": line,
+                "character": col_offset,
+            },
+            "end": {
+                "line": line,
+                "character": end_col_offset,
+            },
+        }
 
 
 def references(
@@ -246,37 +232,53 @@ def _references_for_keyword_found(
             }
         )
 
-    from robotframework_ls.impl.workspace_symbols import iter_symbols_caches
+    from robotframework_ls.impl.robot_workspace import RobotWorkspace
+
+    workspace = typing.cast(RobotWorkspace, completion_context.workspace)
+    workspace_indexer = workspace.workspace_indexer
+    if workspace_indexer is None:
+        # i.e.: this can happen if this is being asked on a server where we aren't indexing the workspace contents.
+        log.critical(
+            "Error: workspace.workspace_indexer is None when searching for references (it seems that the wrong API is being used here)."
+        )
+        return ret
 
-    for symbols_cache in iter_symbols_caches(
-        None, completion_context, force_all_docs_in_workspace=True, timeout=999999
+    # The index provides only the documents where the keyword name is used
+    # (so, only those need to be verified).
+    for uri, _usages in workspace_indexer.iter_keyword_usages(
+        normalized_name, completion_context
     ):
         completion_context.check_cancelled()
-        if symbols_cache.has_keyword_usage(normalized_name):
-            doc: Optional[IRobotDocument] = symbols_cache.get_doc()
-            if doc is None:
-                uri = symbols_cache.get_uri()
-                if uri is None:
-                    continue
-
-                doc = typing.cast(
-                    Optional[IRobotDocument],
-                    completion_context.workspace.get_document(
-                        doc_uri=uri, accept_from_file=True
-                    ),
-                )
-
-                if doc is None:
-                    log.debug(
-                        "Unable to load document for getting references with uri: %s",
-                        uri,
-                    )
-                    continue
+        doc = typing.cast(
+            Optional[IRobotDocument],
+            workspace.get_document(doc_uri=uri, accept_from_file=True),
+        )
 
-            ref_range: RangeTypedDict
-            for ref_range in iter_keyword_references_in_doc(
+        if doc is None:
+            log.debug(
+                "Unable to load document for getting references with uri: %s",
+                uri,
+            )
+            continue
+
+        symbols_cache = doc.symbols_cache
+        if symbols_cache is None:
+            # The document changed after the index was updated: compute the
+            # usages from the AST.
+            refs = iter_keyword_references_in_doc(
                 completion_context, doc, normalized_name, keyword_found
-            ):
-                ret.append({"uri": doc.uri, "range": ref_range})
+            )
+        else:
+            doc_keyword_usages = symbols_cache.get_keyword_usages() or {}
+            refs = _iter_verified_keyword_references_in_doc(
+                completion_context,
+                doc,
+                doc_keyword_usages.get(normalized_name, []),
+                keyword_found,
+            )
+
+        ref_range: RangeTypedDict
+        for ref_range in refs:
+            ret.append({"uri": doc.uri, "range": ref_range})
 
     return ret
@@ -38,6 +38,8 @@ OPTION_ROBOT_WORKSPACE_SYMBOLS_ONLY_FOR_OPEN_DOCS = (
     "robot.workspaceSymbolsOnlyForOpenDocs"
 )
 
+OPTION_ROBOT_MAX_API_PROCESSES = "robot.maxApiProcesses"
+
 OPTION_ROBOT_COMPLETION_SECTION_HEADERS_FORM = "robot.completions.section_headers.form"
 OPTION_ROBOT_COMPLETION_SECTION_HEADERS_FORM_PLURAL = "plural"
 OPTION_ROBOT_COMPLETION_SECTION_HEADERS_FORM_SINGULAR = "singular"
@@ -65,6 +67,7 @@ ALL_ROBOT_OPTIONS = frozenset(
         OPTION_ROBOT_LINT_UNDEFINED_LIBRARIES,
         OPTION_ROBOT_LINT_UNDEFINED_RESOURCES,
         OPTION_ROBOT_LINT_KEYWORD_CALL_ARGUMENTS,
+        OPTION_ROBOT_MAX_API_PROCESSES,
     )
 )
 
@@ -18,7 +18,7 @@
 import os
 import weakref
 from robocorp_ls_core.cache import instance_cache
-from typing import Optional, Union, Type, Callable, List, Tuple
+from typing import Optional, Union, Type, Callable, List, Tuple, Any
 from robocorp_ls_core.protocols import Sentinel
 from robotframework_ls.impl.protocols import ISymbolsCache, ILibraryDoc, IKeywordArg
 from robocorp_ls_core.robotframework_log import get_logger, get_log_level
@@ -147,7 +147,35 @@ def docs_and_format(obj):
     return obj.doc, "plaintext"
 
 
-class LibraryDoc(object):
+class _DocHolder(object):
+    """
+    The `doc` may be set to an object with a `load()` method which is only
+    called when the doc is actually requested (see: libspec_pickle_cache.py).
+
+    If the `load()` fails it returns None (and is retried on the next access).
+    """
+
+    _doc: str
+
+    @property
+    def doc(self) -> str:
+        doc = self._doc
+        if doc.__class__ is not str:
+            loaded = typing.cast(Any, doc).load()
+            if loaded is None:
+                return ""
+            doc = self._doc = loaded
+        return doc
+
+    @doc.setter
+    def doc(self, doc: str) -> None:
+        self._doc = doc
+
+    def __getstate__(self):
+        return self.__dict__.copy()
+
+
+class LibraryDoc(_DocHolder):
     def __init__(
         self,
         filename,
@@ -254,6 +282,21 @@ class LibraryDoc(object):
 
     __str__ = __repr__
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Caches are not pickled.
+        state.pop("__instance_cache__", None)
+        state["symbols_cache"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        weak_libdoc = weakref.ref(self)
+        for keyword in self.inits:
+            keyword._weak_libdoc = weak_libdoc
+        for keyword in self.keywords:
+            keyword._weak_libdoc = weak_libdoc
+
     def convert_docs_to_markdown(self) -> bool:
         old_doc_format = self.doc_format
         formatter = _get_formatter(old_doc_format)
@@ -424,7 +467,7 @@ class KeywordArg(object):
     __str__ = __repr__
 
 
-class KeywordDoc(object):
+class KeywordDoc(_DocHolder):
     def __init__(
         self, weak_libdoc, name="", args=(), doc="", tags=(), source=None, lineno=-1
     ):
@@ -474,6 +517,13 @@ class KeywordDoc(object):
 
     __str__ = __repr__
 
+    def __getstate__(self):
+        # The weak reference to the library is restored by the LibraryDoc.
+        state = self.__dict__.copy()
+        state.pop("_weak_libdoc", None)
+        state.pop("__instance_cache__", None)
+        return state
+
     def to_dictionary(self) -> dict:
         return {
             "name": self.name,
@@ -491,7 +541,7 @@ class KeywordDoc(object):
         _: IKeywordDoc = check_implements(self)
 
 
-class DataType(object):
+class DataType(_DocHolder):
     type: str = ""
 
     def __init__(self, name, doc):
@@ -32,7 +32,15 @@ from robocorp_ls_core.lsp import (
     MarkupKind,
 )
 from robocorp_ls_core import uris
-from robotframework_ls.impl._symbols_cache import BaseSymbolsCache
+from robotframework_ls.impl._symbols_cache import (
+    BaseSymbolsCache,
+    KeywordUsageEntry,
+    iter_keyword_usage_entries,
+)
+from robotframework_ls.impl._symbols_cache_persistence import (
+    SymbolsCachePersistence,
+    INDEX_VERSION,
+)
 
 log = get_logger(__name__)
 
@@ -131,10 +139,10 @@ def _compute_symbols_from_ast(completion_context: ICompletionContext) -> ISymbol
         )
 
     keywords_used = set()
-    for keyword_usage_info in ast_utils.iter_keyword_usage_tokens(
-        ast, collect_args_as_keywords=True
-    ):
+    keyword_usages: Dict[str, List[KeywordUsageEntry]] = {}
+    for keyword_usage_info, normalized_name, entry in iter_keyword_usage_entries(ast):
         keywords_used.add(normalize_robot_name(keyword_usage_info.name))
+        keyword_usages.setdefault(normalized_name, []).append(entry)
 
     test_info = list_tests(completion_context)
     test_info_for_cache: List[ITestInfoFromSymbolsCacheTypedDict] = [
@@ -148,6 +156,7 @@ def _compute_symbols_from_ast(completion_context: ICompletionContext) -> ISymbol
         keywords_used,
         uri=uri,
         test_info=test_info_for_cache,
+        keyword_usages=keyword_usages,
         keywords=keywords,
     )
 
@@ -226,14 +235,106 @@ class _ReindexManager(object):
             self._reindex_event.set()
 
 
+class _KeywordUsagesIndex(object):
+    """
+    Inverted index with the normalized keyword name -> uri -> usages in the
+    workspace.
+
+    It's kept up to date by the WorkspaceIndexer: whenever some uri changes
+    it's marked as dirty and it's recomputed before the next query.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+
+        # normalized keyword name -> uri -> usages
+        self._name_to_uri_to_usages: Dict[str, Dict[str, List[KeywordUsageEntry]]] = {}
+
+        # uri -> symbols cache used to compute the entries for that uri.
+        self._uri_to_symbols_cache: Dict[str, ISymbolsCache] = {}
+
+        self._dirty_uris: Set[str] = set()
+
+    def mark_dirty(self, uri: str) -> None:
+        with self._lock:
+            self._dirty_uris.add(uri)
+
+    def pop_uris_to_update(self, uris_in_workspace: Set[str]) -> Set[str]:
+        """
+        :return: the uris which must be recomputed (the ones marked as dirty
+        and the ones which still weren't indexed).
+
+        Uris which are no longer in the workspace are removed from the index.
+        """
+        with self._lock:
+            dirty_uris = self._dirty_uris
+            self._dirty_uris = set()
+
+            for uri in list(self._uri_to_symbols_cache):
+                if uri not in uris_in_workspace:
+                    self._remove_uri_unlocked(uri)
+
+            uris_to_update = uris_in_workspace.difference(self._uri_to_symbols_cache)
+            uris_to_update.update(dirty_uris.intersection(uris_in_workspace))
+            return uris_to_update
+
+    def restore_dirty(self, dirty_uris: Set[str]) -> None:
+        with self._lock:
+            self._dirty_uris.update(dirty_uris)
+
+    def _remove_uri_unlocked(self, uri: str) -> None:
+        symbols_cache = self._uri_to_symbols_cache.pop(uri, None)
+        if symbols_cache is None:
+            return
+
+        keyword_usages = symbols_cache.get_keyword_usages()
+        if keyword_usages:
+            for normalized_name in keyword_usages:
+                uri_to_usages = self._name_to_uri_to_usages.get(normalized_name)
+                if uri_to_usages is not None:
+                    uri_to_usages.pop(uri, None)
+                    if not uri_to_usages:
+                        del self._name_to_uri_to_usages[normalized_name]
+
+    def update(self, uri: str, symbols_cache: Optional[ISymbolsCache]) -> None:
+        with self._lock:
+            if symbols_cache is None:
+                self._remove_uri_unlocked(uri)
+                return
+
+            if self._uri_to_symbols_cache.get(uri) is symbols_cache:
+                return  # Unchanged
+
+            self._remove_uri_unlocked(uri)
+            self._uri_to_symbols_cache[uri] = symbols_cache
+            keyword_usages = symbols_cache.get_keyword_usages()
+            if not keyword_usages:
+                return
+
+            for normalized_name, usages in keyword_usages.items():
+                self._name_to_uri_to_usages.setdefault(normalized_name, {})[
+                    uri
+                ] = usages
+
+    def get_usages(self, normalized_name: str) -> Dict[str, List[KeywordUsageEntry]]:
+        with self._lock:
+            return self._name_to_uri_to_usages.get(normalized_name, {}).copy()
+
+
 class WorkspaceIndexer(object):
     def __init__(
         self,
         robot_workspace,
         endpoint: Optional[IEndPoint],
         collect_tests: bool = False,
+        symbols_cache_dir: Optional[str] = None,
     ) -> None:
         self._robot_workspace = weakref.ref(robot_workspace)
+        self._keyword_usages_index = _KeywordUsagesIndex()
+        self._keyword_usages_index_update_lock = threading.Lock()
+        self._symbols_cache_persistence = self._create_symbols_cache_persistence(
+            symbols_cache_dir
+        )
         robot_workspace.on_file_changed.register(self._on_file_changed)
         self._endpoint = endpoint
         self._collect_tests = collect_tests
@@ -248,12 +349,36 @@ class WorkspaceIndexer(object):
         t.daemon = True
         t.start()
 
+    def _create_symbols_cache_persistence(
+        self, symbols_cache_dir: Optional[str]
+    ) -> Optional[SymbolsCachePersistence]:
+        from robocorp_ls_core.cache import DirCache
+        from robotframework_ls import robot_config
+        import os.path
+
+        if symbols_cache_dir is None:
+            symbols_cache_dir = os.path.join(
+                robot_config.get_robotframework_ls_home(),
+                ".cache",
+                "workspace_index",
+                INDEX_VERSION,
+            )
+        try:
+            return SymbolsCachePersistence(DirCache(symbols_cache_dir))
+        except:
+            log.exception(
+                "Unable to create persistence for the symbols cache at: %s",
+                symbols_cache_dir,
+            )
+            return None
+
     def _on_file_changed(self, filename: str):
         # with open("x:/temp/rara.txt", "a+") as stream:
         #     stream.write("%s\n" % filename)
 
         if filename and filename.endswith((".resource", ".robot")):
             uri = uris.from_fs_path(filename)
+            self._keyword_usages_index.mark_dirty(uri)
             self._reindex_manager.request_uri_collection(uri)
 
     def wait_for_full_test_collection(self):
@@ -269,10 +394,12 @@ class WorkspaceIndexer(object):
 
     def _on_thread(self) -> None:
         if not self._collect_tests:
-            for _uri, symbols_cache in self.iter_uri_and_symbols_cache():
-                # Do a single collection at startup, afterwards only
-                # collect again on demand.
-                pass
+            # Do a single collection at startup, afterwards only
+            # collect again on demand.
+            try:
+                self._update_keyword_usages_index()
+            except:
+                log.exception("Error collecting workspace symbols at startup.")
         else:
             endpoint = self._endpoint
             assert endpoint
@@ -362,11 +489,56 @@ class WorkspaceIndexer(object):
         self._reindex_manager.dispose()
 
     def on_updated_document(self, doc_uri: str):
+        self._keyword_usages_index.mark_dirty(doc_uri)
         self._reindex_manager.request_uri_collection(doc_uri)
 
     def on_updated_folders(self):
         self._reindex_manager.request_full_collection()
 
+    def _update_keyword_usages_index(
+        self, context: Optional[IBaseCompletionContext] = None
+    ) -> None:
+        workspace = self._robot_workspace()
+        if not workspace:
+            log.critical("self._robot_workspace already collected in WorkspaceIndexer.")
+            return
+
+        index = self._keyword_usages_index
+        with self._keyword_usages_index_update_lock:
+            # Note: the initial scan of the workspace folders is done in a thread,
+            # so, new uris may appear without any change notification (so, we
+            # always check for the uris which weren't indexed yet).
+            uris_in_workspace = set(
+                workspace.iter_all_doc_uris_in_workspace((".robot", ".resource"))
+            )
+            uris_to_update = index.pop_uris_to_update(uris_in_workspace)
+            if not uris_to_update:
+                return
+
+            try:
+                for _ in self.iter_uri_and_symbols_cache(
+                    context=context, uris_to_iter=uris_to_update
+                ):
+                    pass
+            except:
+                index.restore_dirty(uris_to_update)
+                raise
+
+    def iter_keyword_usages(
+        self,
+        normalized_name: str,
+        context: Optional[IBaseCompletionContext] = None,
+    ) -> Iterator[Tuple[str, List[KeywordUsageEntry]]]:
+        """
+        Provides the uris and places where a given keyword (its normalized
+        name without the library/resource qualifier) is used in the workspace.
+
+        Note: the usages are found just based on the name (callers must still
+        verify whether the usage actually maps to a given definition).
+        """
+        self._update_keyword_usages_index(context)
+        yield from self._keyword_usages_index.get_usages(normalized_name).items()
+
     def iter_uri_and_symbols_cache(
         self,
         only_for_open_docs=False,
@@ -393,6 +565,8 @@ class WorkspaceIndexer(object):
             log.critical("self._robot_workspace already collected in WorkspaceIndexer.")
             return
 
+        persistence = self._symbols_cache_persistence
+
         if uris_to_iter is not None:
 
             def iter_in():
@@ -435,10 +609,16 @@ class WorkspaceIndexer(object):
                 workspace.get_document(uri, accept_from_file=True),
             )
             if doc is None:
+                self._keyword_usages_index.update(uri, None)
                 yield uri, None  # i.e.: No longer there...
                 continue
 
             symbols_cache = doc.symbols_cache
+            if symbols_cache is None and persistence is not None:
+                # Note: only documents loaded from the filesystem are
+                # persisted (this is checked internally).
+                symbols_cache = persistence.load(doc)
+
             if symbols_cache is None:
                 from robotframework_ls.impl.completion_context import (
                     CompletionContext,
@@ -457,7 +637,10 @@ class WorkspaceIndexer(object):
                         workspace=workspace,
                     )
                 symbols_cache = _compute_symbols_from_ast(ctx)
+                if persistence is not None:
+                    persistence.store(doc, symbols_cache)
             doc.symbols_cache = symbols_cache
+            self._keyword_usages_index.update(uri, symbols_cache)
             yield uri, symbols_cache
 
 
@@ -473,7 +656,10 @@ class RobotWorkspace(Workspace):
         collect_tests=False,
         endpoint: Optional[IEndPoint] = None,
     ):
+        from robotframework_ls.impl.import_graph import ImportGraph
+
         self.libspec_manager = libspec_manager
+        self.import_graph = ImportGraph()
 
         # It needs to be set to None in the initialization (while we setup folders).
         self.workspace_indexer: Optional[WorkspaceIndexer] = None
@@ -533,6 +719,7 @@ class RobotWorkspace(Workspace):
     @overrides(Workspace.dispose)
     def dispose(self):
         Workspace.dispose(self)
+        self.import_graph.clear()
         indexer = self.workspace_indexer
         if indexer is not None:
             indexer.dispose()
@@ -582,15 +769,61 @@ class RobotDocument(Document):
         self._generate_ast = generate_ast
         self._ast = None
         self.symbols_cache = None
+        self._incremental_parse_info_before_change = None
 
     @overrides(Document._clear_caches)
     def _clear_caches(self):
         Document._clear_caches(self)
         self._symbols_cache = None
+        self._ast = None
+        self._incremental_parse_info = None
         self.get_ast.cache_clear(self)  # noqa (clear the instance_cache).
         self.get_python_ast.cache_clear(self)  # noqa (clear the instance_cache).
         self.get_yaml_contents.cache_clear(self)  # noqa (clear the instance_cache).
 
+    def _get_incremental_parse_info(self):
+        from robotframework_ls.impl._incremental_parse import IncrementalParseInfo
+
+        # Note: the order is important as `get_ast` sets the `_ast` before
+        # clearing the `_incremental_parse_info` (and it may be called in
+        # another thread).
+        incremental_parse_info = self._incremental_parse_info
+        if incremental_parse_info is None:
+            ast = self._ast
+            if ast is not None:
+                incremental_parse_info = IncrementalParseInfo(ast)
+        return incremental_parse_info
+
+    @overrides(Document._set_contents_from)
+    def _set_contents_from(self, doc: "Document") -> None:
+        incremental_parse_info = None
+        if isinstance(doc, RobotDocument):
+            incremental_parse_info = doc._get_incremental_parse_info()
+        Document._set_contents_from(self, doc)
+        self._incremental_parse_info = incremental_parse_info
+
+    @overrides(Document._apply_change)
+    def _apply_change(self, change_range, text):
+        # Applying the change clears the caches (so, keep what's needed to
+        # parse incrementally until `_on_lines_replaced` is called).
+        self._incremental_parse_info_before_change = self._get_incremental_parse_info()
+        try:
+            Document._apply_change(self, change_range, text)
+        finally:
+            self._incremental_parse_info_before_change = None
+
+    @overrides(Document._on_lines_replaced)
+    def _on_lines_replaced(
+        self, replace_from: int, replace_to: int, new_lines_count: int
+    ) -> None:
+        incremental_parse_info = self._incremental_parse_info_before_change
+        if incremental_parse_info is not None:
+            self._incremental_parse_info = (
+                incremental_parse_info.create_with_lines_replaced(
+                    replace_from, replace_to, new_lines_count
+                )
+            )
+
     def get_type(self):
         path = self.path
         if not path:
@@ -625,19 +858,38 @@ class RobotDocument(Document):
         try:
             t = self.get_type()
             if t == self.TYPE_TEST_CASE:
-                ast = get_model(source)
+                parse = get_model
 
             elif t == self.TYPE_RESOURCE:
-                ast = get_resource_model(source)
+                parse = get_resource_model
 
             elif t == self.TYPE_INIT:
-                ast = get_init_model(source)
+                parse = get_init_model
 
             else:
                 log.critical("Unrecognized section: %s", t)
-                ast = get_model(source)
+                parse = get_model
+
+            ast = None
+            incremental_parse_info = self._incremental_parse_info
+            if incremental_parse_info is not None:
+                from robotframework_ls.impl._incremental_parse import (
+                    parse_incrementally,
+                )
+
+                try:
+                    ast = parse_incrementally(
+                        incremental_parse_info, self._lines, parse
+                    )
+                except:
+                    log.exception(f"Error parsing incrementally {self.uri}")
+
+            if ast is None:
+                ast = parse(source)
 
             ast.source = self.path
+            self._ast = ast
+            self._incremental_parse_info = None
             return ast
         except:
             log.critical(f"Error parsing {self.uri}")
@@ -1,6 +1,7 @@
 from typing import List, Tuple, Set, Iterator, Optional
 import itertools
 from robocorp_ls_core.protocols import IDocument
+from robocorp_ls_core.lsp import RangeTypedDict, SemanticTokensEditTypedDict
 from robotframework_ls.impl.protocols import ICompletionContext
 
 
@@ -191,10 +192,6 @@ PARAMETER_NAME_INDEX = TOKEN_TYPE_TO_INDEX["parameterName"]
 DOCUMENTATION_INDEX = TOKEN_TYPE_TO_INDEX["documentation"]
 
 
-def semantic_tokens_range(context, range):
-    return []
-
-
 def _tokenize_token(node, initial_token, context):
     from robotframework_ls.impl.ast_utils import (
         is_argument_keyword_name,
@@ -392,14 +389,45 @@ def _tokenize_token(node, initial_token, context):
             yield token, token_type_index
 
 
-def semantic_tokens_full(context: ICompletionContext):
-    try:
-        ast = context.doc.get_ast()
-    except:
-        return []
-
+def _iter_nodes_in_lines(ast, start_line: int, end_line: int):
+    """
+    Provides the nodes which have some token in the given lines (1-based,
+    inclusive) without visiting sections/blocks which are out of the range.
+    """
     from robotframework_ls.impl import ast_utils
 
+    for section in ast.sections:
+        if section.end_lineno < start_line:
+            continue
+        if section.lineno > end_line:
+            break
+
+        yield section
+        if section.header is not None:
+            yield section.header
+
+        for block in section.body:
+            if block.end_lineno < start_line:
+                continue
+            if block.lineno > end_line:
+                break
+
+            yield block
+            for _stack, node in ast_utils.iter_all_nodes_recursive(block):
+                yield node
+
+
+def _encode_semantic_tokens(
+    nodes, context: ICompletionContext, start_line: int = 1, end_line: int = -1
+) -> List[int]:
+    """
+    :param start_line:
+        Only tokens starting at this line (1-based) or after are encoded.
+
+    :param end_line:
+        Only tokens starting at this line (1-based) or before are encoded
+        (-1 means that there's no limit).
+    """
     monitor = context.monitor
 
     ret: List[int] = []
@@ -407,12 +435,16 @@ def semantic_tokens_full(context: ICompletionContext):
 
     last_line = 0
     last_column = 0
-    for _stack, node in ast_utils.iter_all_nodes_recursive(ast):
+    for node in nodes:
         if monitor:
             monitor.check_cancelled()
         tokens = getattr(node, "tokens", None)
         if tokens:
             for token in tokens:
+                if token.lineno < start_line or (
+                    end_line != -1 and token.lineno > end_line
+                ):
+                    continue
                 for token_part, token_type_index in _tokenize_token(
                     node, token, context
                 ):
@@ -438,6 +470,84 @@ def semantic_tokens_full(context: ICompletionContext):
     return ret
 
 
+def semantic_tokens_full(context: ICompletionContext) -> List[int]:
+    try:
+        ast = context.doc.get_ast()
+    except:
+        return []
+
+    from robotframework_ls.impl import ast_utils
+
+    return _encode_semantic_tokens(
+        (node for _stack, node in ast_utils.iter_all_nodes_recursive(ast)), context
+    )
+
+
+def semantic_tokens_range(
+    context: ICompletionContext, range: RangeTypedDict
+) -> List[int]:
+    """
+    Provides the semantic tokens only for the lines in the given range (the
+    first token is still relative to the start of the document).
+    """
+    try:
+        ast = context.doc.get_ast()
+    except:
+        return []
+
+    # Note: RangeTypedDict is 0-based and the AST is 1-based.
+    start_line = range["start"]["line"] + 1
+    end_line = range["end"]["line"] + 1
+
+    return _encode_semantic_tokens(
+        _iter_nodes_in_lines(ast, start_line, end_line),
+        context,
+        start_line,
+        end_line,
+    )
+
+
+def compute_semantic_tokens_edits(
+    previous_data: List[int], new_data: List[int]
+) -> List[SemanticTokensEditTypedDict]:
+    """
+    Computes the edits to transform the previous semantic tokens into the
+    new semantic tokens (a single edit replacing what's in-between the
+    common prefix and the common suffix, which is usually all that changes
+    with an edit in the editor).
+    """
+    if previous_data == new_data:
+        return []
+
+    previous_len = len(previous_data)
+    new_len = len(new_data)
+    max_common = min(previous_len, new_len)
+
+    prefix = 0
+    while prefix < max_common and previous_data[prefix] == new_data[prefix]:
+        prefix += 1
+
+    # Note: edits are done on whole tokens (5 ints per token).
+    prefix -= prefix % 5
+
+    suffix = 0
+    max_suffix = max_common - prefix
+    while (
+        suffix < max_suffix
+        and previous_data[previous_len - suffix - 1] == new_data[new_len - suffix - 1]
+    ):
+        suffix += 1
+    suffix -= suffix % 5
+
+    return [
+        {
+            "start": prefix,
+            "deleteCount": previous_len - suffix - prefix,
+            "data": new_data[prefix : new_len - suffix],
+        }
+    ]
+
+
 def decode_semantic_tokens(
     semantic_tokens_as_int: List[int], doc: IDocument, stream=None
 ):
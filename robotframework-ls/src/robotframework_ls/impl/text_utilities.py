@@ -66,45 +66,79 @@ def contains_variable_text(text: str) -> bool:
     return False
 
 
-def matches_robot_keyword(keyword_name_call_text, keyword_name, _re_cache={}):
+class KeywordNamePattern(object):
+    """
+    The pattern to match a keyword call against a keyword name with embedded
+    arguments (the static text before the first/after the last variable is
+    checked before the regexp as a fast way to discard it).
     """
-    Checks if a given text matches a given keyword.
 
-    Note: both should be already normalized.
-    Note: should NOT be called if keyword does not have '{' in it.
+    __slots__ = ["prefix", "suffix", "_compiled"]
+
+    def __init__(self, prefix: str, suffix: str, regexp: str):
+        self.prefix = prefix
+        self.suffix = suffix
+        self._compiled = re.compile(regexp)
+
+    def match(self, keyword_name_call_text: str):
+        if not keyword_name_call_text.startswith(
+            self.prefix
+        ) or not keyword_name_call_text.endswith(self.suffix):
+            return None
+        return self._compiled.match(keyword_name_call_text)
 
-    :param str keyword_name_call_text:
-        The call that has resolved variables.
 
+def get_keyword_name_pattern(keyword_name, _cache={}) -> KeywordNamePattern:
+    """
     :param str keyword_name:
-        The keyword (which has variables -- i.e.: '{').
+        The keyword (which has variables -- i.e.: '{') already normalized.
     """
-
     try:
-        compiled = _re_cache[keyword_name]
+        return _cache[keyword_name]
     except KeyError:
-        from robotframework_ls.impl import ast_utils
-        import re
+        pass
 
-        try:
-            tokenized_vars = ast_utils.tokenize_variables_from_name(keyword_name)
-        except:
-            regexp = [re.escape(keyword_name)]
-        else:
-            regexp = []
-            for t in tokenized_vars:
-                if t.type == t.VARIABLE:
-                    regexp.append("(.*)")
-                else:
-                    regexp.append(re.escape(t.value))
+    from robotframework_ls.impl import ast_utils
+
+    try:
+        tokenized_vars = ast_utils.tokenize_variables_from_name(keyword_name)
+    except:
+        regexp = [re.escape(keyword_name)]
+        prefix = keyword_name
+        suffix = ""
+    else:
+        regexp = []
+        static_parts = [""]
+        for t in tokenized_vars:
+            if t.type == t.VARIABLE:
+                regexp.append("(.*)")
+                static_parts.append("")
+            else:
+                regexp.append(re.escape(t.value))
+                static_parts[-1] += t.value
+        prefix = static_parts[0]
+        suffix = static_parts[-1] if len(static_parts) > 1 else ""
+
+    regexp.append("$")
+
+    pattern = _cache[keyword_name] = KeywordNamePattern(prefix, suffix, "".join(regexp))
+    return pattern
 
-        regexp.append("$")
 
-        regexp = "".join(regexp)
-        _re_cache[keyword_name] = re.compile(regexp)
-        compiled = _re_cache[keyword_name]
+def matches_robot_keyword(keyword_name_call_text, keyword_name):
+    """
+    Checks if a given text matches a given keyword.
 
-    return compiled.match(keyword_name_call_text)
+    Note: both should be already normalized.
+    Note: should NOT be called if keyword does not have '{' in it.
+
+    :param str keyword_name_call_text:
+        The call that has resolved variables.
+
+    :param str keyword_name:
+        The keyword (which has variables -- i.e.: '{').
+    """
+    return get_keyword_name_pattern(keyword_name).match(keyword_name_call_text)
 
 
 def iter_dotted_names(text: str):
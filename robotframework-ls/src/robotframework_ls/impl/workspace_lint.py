@@ -0,0 +1,436 @@
+"""
+Lints all the files in the workspace with the same diagnostics which are shown
+by the language server (used by the `robot.lintWorkspace` command and by the
+`robotframework_ls.lint_workspace` command line).
+
+The files are sharded among the processes of a `ProcessPoolExecutor`. Each
+worker process keeps its own `RobotWorkspace` (so, the caches of the imports
+resolved are reused for all the files in the shards it checks) and uses the
+same libspec folders as the process which started it (so, the libspecs are
+generated only once -- the generation is guarded by a system mutex -- and are
+then loaded from the shared libspec pickle cache).
+
+The diagnostics of each file are sent back through a queue as soon as it's
+linted (so, the caller may show partial results while the remaining files are
+being linted).
+
+The contents of the documents open in the editor may be passed to be used
+instead of the contents in the filesystem (they're used when linting those
+files and when they're imported by other files).
+"""
+import os
+import queue
+import sys
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from robocorp_ls_core.protocols import IConfig, IMonitor, TypedDict
+from robocorp_ls_core.robotframework_log import get_logger
+from robotframework_ls.impl.protocols import ICompletionContext
+
+
+log = get_logger(__name__)
+
+
+class LintWorkspaceStatsTypedDict(TypedDict):
+    files: int
+    filesWithDiagnostics: int
+    diagnostics: int
+    workers: int
+    elapsedTime: float
+    filesPerSecond: float
+
+
+# The maximum number of files in each shard (files are sorted by path, so,
+# files in the same directory, which usually share imports, are linted in the
+# same worker).
+_MAX_SHARD_SIZE = 20
+
+# Shards are created so that each worker receives at least this number of
+# shards (so that the load is balanced among the workers even if some files
+# are much slower to lint than others).
+_SHARDS_PER_WORKER = 4
+
+# How long to wait for a result before checking whether the workers are
+# still alive.
+_QUEUE_POLL_TIMEOUT = 0.2
+
+
+def collect_lint_diagnostics(completion_context: ICompletionContext) -> List[Dict]:
+    """
+    :return: the LSP diagnostics for the document in the completion context
+        (errors in the AST, errors from the code analysis and Robocop
+        diagnostics, depending on the configuration).
+
+    :raises JsonRpcRequestCancelled:
+        If the monitor in the completion context is cancelled.
+    """
+    from robocorp_ls_core import uris
+    from robocorp_ls_core.lsp import Error
+    from robotframework_ls.impl.ast_utils import collect_errors
+    from robotframework_ls.impl import code_analysis
+    from robotframework_ls.impl.robot_lsp_constants import (
+        OPTION_ROBOT_LINT_ROBOCOP_ENABLED,
+    )
+    from robotframework_ls.impl.robot_lsp_constants import (
+        OPTION_ROBOT_LINT_ENABLED,
+    )
+
+    config = completion_context.config
+    robocop_enabled = config is None or config.get_setting(
+        OPTION_ROBOT_LINT_ROBOCOP_ENABLED, bool, False
+    )
+
+    ast = completion_context.get_ast()
+    source = completion_context.doc.source
+    completion_context.check_cancelled()
+    errors = collect_errors(ast)
+    log.debug("Collected AST errors: %s", len(errors))
+    completion_context.check_cancelled()
+
+    lint_ls_enabled = config is None or config.get_setting(
+        OPTION_ROBOT_LINT_ENABLED, bool, True
+    )
+    if lint_ls_enabled:
+        analysis_errors = code_analysis.collect_analysis_errors(completion_context)
+        completion_context.check_cancelled()
+        log.debug("Collected analysis errors: %s", len(analysis_errors))
+        errors.extend(analysis_errors)
+    else:
+        log.debug("Language server linting disabled.")
+
+    lsp_diagnostics = [error.to_lsp_diagnostic() for error in errors]
+
+    try:
+        if robocop_enabled:
+            from robocorp_ls_core.robocop_wrapper import collect_robocop_diagnostics
+
+            workspace = completion_context.workspace
+            if workspace is not None:
+                project_root = workspace.root_path
+            else:
+                project_root = os.path.abspath(".")
+
+            completion_context.check_cancelled()
+            lsp_diagnostics.extend(
+                collect_robocop_diagnostics(
+                    project_root,
+                    ast,
+                    uris.to_fs_path(completion_context.doc.uri),
+                    source,
+                )
+            )
+    except Exception as e:
+        log.exception(
+            "Error collecting Robocop errors (possibly an unsupported Robocop version is installed)."
+        )
+        lsp_diagnostics.append(
+            Error(
+                f"Error collecting Robocop errors: {e}", (0, 0), (1, 0)
+            ).to_lsp_diagnostic()
+        )
+
+    return lsp_diagnostics
+
+
+def create_shards(doc_uris: Sequence[str], max_workers: int) -> List[List[str]]:
+    """
+    Splits the given uris in shards of contiguous (sorted) uris.
+    """
+    doc_uris = sorted(doc_uris)
+    if not doc_uris:
+        return []
+
+    shard_size = len(doc_uris) // (max_workers * _SHARDS_PER_WORKER)
+    shard_size = max(1, min(_MAX_SHARD_SIZE, shard_size))
+    return [doc_uris[i : i + shard_size] for i in range(0, len(doc_uris), shard_size)]
+
+
+def get_workers_count(shards: Sequence[List[str]], max_workers: int) -> int:
+    """
+    :return: the number of worker processes started to lint the given shards.
+    """
+    return min(max_workers, len(shards))
+
+
+# --- Code which runs in the worker processes.
+
+
+class _WorkerState(object):
+    def __init__(self, results_queue, workspace, config: IConfig):
+        self.results_queue = results_queue
+        self.workspace = workspace
+        self.config = config
+
+
+_worker_state: Optional[_WorkerState] = None
+
+
+def _worker_initialize(
+    results_queue,
+    root_uri: str,
+    folders: Sequence[Tuple[str, str]],
+    settings: Dict[str, Any],
+    doc_uri_to_source: Dict[str, str],
+    log_level: int,
+    log_file: Optional[str],
+) -> None:
+    global _worker_state
+
+    # The process which starts the workers may be using its stdout for the
+    # communication (i.e.: the language server api), so, make sure that any
+    # output from libraries goes to stderr.
+    try:
+        sys.stdout.flush()
+        os.dup2(2, 1)
+    except:
+        pass
+    sys.stdout = sys.stderr
+
+    from robocorp_ls_core.robotframework_log import configure_logger
+
+    configure_logger("lint-worker", log_level, log_file or "")
+
+    from robocorp_ls_core import uris
+    from robocorp_ls_core.lsp import TextDocumentItem
+    from robocorp_ls_core.lsp import WorkspaceFolder
+    from robocorp_ls_core.watchdog_wrapper import create_observer
+    from robotframework_ls.impl.libspec_manager import LibspecManager
+    from robotframework_ls.impl.robot_workspace import RobotWorkspace
+    from robotframework_ls.robot_config import RobotConfig
+
+    config = RobotConfig()
+    config.set_workspace_dir(uris.to_fs_path(root_uri))
+    config.update(settings)
+
+    observer = create_observer("dummy", ())
+
+    # Note: the libspec folders are the same ones used by the other processes
+    # for this interpreter (so, libspecs are shared). Libspecs are generated
+    # in a new process for each library here (there are already many workers
+    # running and libspecs are usually already generated at this point).
+    libspec_manager = LibspecManager(observer=observer, use_libdoc_worker_pool=False)
+    libspec_manager.config = config
+
+    workspace = RobotWorkspace(
+        root_uri,
+        observer,
+        [WorkspaceFolder(uri, name) for uri, name in folders],
+        libspec_manager=libspec_manager,
+    )
+    for doc_uri, source in doc_uri_to_source.items():
+        workspace.put_document(TextDocumentItem(doc_uri, text=source))
+    _worker_state = _WorkerState(results_queue, workspace, config)
+
+
+def _lint_doc_uri(state: _WorkerState, doc_uri: str) -> List[Dict]:
+    from robocorp_ls_core.lsp import Error
+    from robotframework_ls.impl.completion_context import CompletionContext
+
+    try:
+        document = state.workspace.get_document(doc_uri, accept_from_file=True)
+        if document is None:
+            log.info("Unable to get document for uri: %s.", doc_uri)
+            return []
+
+        completion_context = CompletionContext(
+            document, workspace=state.workspace, config=state.config
+        )
+        return collect_lint_diagnostics(completion_context)
+    except Exception as e:
+        log.exception("Error linting: %s", doc_uri)
+        return [
+            Error(f"Error collecting errors: {e}", (0, 0), (1, 0)).to_lsp_diagnostic()
+        ]
+
+
+def _lint_shard(doc_uris: List[str]) -> int:
+    state = _worker_state
+    assert state is not None, "Lint worker not initialized."
+
+    for doc_uri in doc_uris:
+        state.results_queue.put((doc_uri, _lint_doc_uri(state, doc_uri)))
+    return len(doc_uris)
+
+
+# --- Code which runs in the process which starts the workers.
+
+
+def get_default_max_workers() -> int:
+    return max(1, min(8, (os.cpu_count() or 1) - 1))
+
+
+def iter_lint_workspace(
+    root_uri: str,
+    folders: Sequence[Tuple[str, str]],
+    doc_uris: Sequence[str],
+    settings: Dict[str, Any],
+    max_workers: Optional[int] = None,
+    monitor: Optional[IMonitor] = None,
+    log_level: int = 0,
+    log_file: Optional[str] = None,
+    doc_uri_to_source: Optional[Dict[str, str]] = None,
+) -> Iterator[Tuple[str, List[Dict]]]:
+    """
+    Lints the given documents in a pool of processes.
+
+    :param folders:
+        A sequence of tuple(folder uri, folder name) with the workspace folders.
+
+    :param settings:
+        The settings to be used (i.e.: `{"robot": {"pythonpath": [...]}}`).
+
+    :param monitor:
+        If given and cancelled the lint is stopped (shards not started are
+        cancelled and the pending results aren't waited for).
+
+    :param doc_uri_to_source:
+        The contents of the documents open in the editor (used instead of the
+        contents in the filesystem).
+
+    :raises JsonRpcRequestCancelled:
+        If the monitor is cancelled.
+
+    :return: an iterator yielding `(doc_uri, diagnostics)` as each document is
+        linted.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    import multiprocessing
+
+    from robocorp_ls_core.lsp import Error
+
+    if max_workers is None:
+        max_workers = get_default_max_workers()
+
+    shards = create_shards(doc_uris, max_workers)
+    if not shards:
+        return
+    max_workers = get_workers_count(shards, max_workers)
+
+    # Note: spawn is always used because forking a process with threads
+    # running (such as the language server api) is not safe.
+    mp_context = multiprocessing.get_context("spawn")
+    results_queue = mp_context.Queue()
+
+    pool = ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=mp_context,
+        initializer=_worker_initialize,
+        initargs=(
+            results_queue,
+            root_uri,
+            folders,
+            settings,
+            doc_uri_to_source or {},
+            log_level,
+            log_file,
+        ),
+    )
+    futures = [pool.submit(_lint_shard, shard) for shard in shards]
+    finished = False
+    try:
+        pending = set(doc_uris)
+
+        while pending:
+            if monitor is not None:
+                monitor.check_cancelled()
+
+            try:
+                doc_uri, diagnostics = results_queue.get(timeout=_QUEUE_POLL_TIMEOUT)
+            except queue.Empty:
+                if not all(future.done() for future in futures):
+                    continue
+
+                failed = [
+                    future.exception()
+                    for future in futures
+                    if not future.cancelled() and future.exception() is not None
+                ]
+                if not failed:
+                    # All the shards finished, the results are still on the
+                    # way to the queue.
+                    continue
+
+                # A worker died: the files not reported won't be linted.
+                log.critical("Error in workspace lint worker: %s", failed[0])
+                error = Error(
+                    f"Unable to lint (lint worker failed): {failed[0]}",
+                    (0, 0),
+                    (1, 0),
+                ).to_lsp_diagnostic()
+                for doc_uri in sorted(pending):
+                    yield doc_uri, [error]
+                break
+
+            if doc_uri in pending:
+                pending.discard(doc_uri)
+                yield doc_uri, diagnostics
+        finished = True
+    finally:
+        if not finished:
+            log.info("Workspace lint stopped before all the files were linted.")
+            for future in futures:
+                future.cancel()
+        pool.shutdown(wait=finished)
+        results_queue.close()
+
+
+def lint_workspace(
+    root_uri: str,
+    folders: Sequence[Tuple[str, str]],
+    doc_uris: Sequence[str],
+    settings: Dict[str, Any],
+    on_file_linted: Callable[[str, List[Dict]], Any],
+    max_workers: Optional[int] = None,
+    monitor: Optional[IMonitor] = None,
+    log_level: int = 0,
+    log_file: Optional[str] = None,
+    doc_uri_to_source: Optional[Dict[str, str]] = None,
+) -> LintWorkspaceStatsTypedDict:
+    """
+    Lints the given documents in a pool of processes, calling `on_file_linted`
+    with `(doc_uri, diagnostics)` as each document is linted.
+
+    :return: information on the number of files linted and the throughput.
+    """
+    if max_workers is None:
+        max_workers = get_default_max_workers()
+
+    initial_time = time.time()
+    files = 0
+    files_with_diagnostics = 0
+    diagnostics_count = 0
+    for doc_uri, diagnostics in iter_lint_workspace(
+        root_uri,
+        folders,
+        doc_uris,
+        settings,
+        max_workers=max_workers,
+        monitor=monitor,
+        log_level=log_level,
+        log_file=log_file,
+        doc_uri_to_source=doc_uri_to_source,
+    ):
+        files += 1
+        if diagnostics:
+            files_with_diagnostics += 1
+            diagnostics_count += len(diagnostics)
+        on_file_linted(doc_uri, diagnostics)
+
+    elapsed_time = time.time() - initial_time
+    ret: LintWorkspaceStatsTypedDict = {
+        "files": files,
+        "filesWithDiagnostics": files_with_diagnostics,
+        "diagnostics": diagnostics_count,
+        "workers": get_workers_count(create_shards(doc_uris, max_workers), max_workers),
+        "elapsedTime": elapsed_time,
+        "filesPerSecond": files / elapsed_time if elapsed_time > 0 else 0.0,
+    }
+    log.info(
+        "Linted %s files in %.2fs (%.1f files/s) with %s workers.",
+        ret["files"],
+        ret["elapsedTime"],
+        ret["filesPerSecond"],
+        ret["workers"],
+    )
+    return ret
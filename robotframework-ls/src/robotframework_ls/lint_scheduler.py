@@ -0,0 +1,142 @@
+"""
+Schedules lint requests to be run by a bounded number of worker threads.
+
+- A lint is only run after its delay elapses (scheduling a new lint for the
+  same key before that replaces the previous one).
+- Among the lints which are ready to run, the ones with a higher priority
+  (lower value) run first.
+- As at most `max_workers` lints run at the same time (each worker waits for
+  the lint result before getting a new one), bulk changes don't flood the
+  lint api with requests (they're just kept pending in the scheduler).
+"""
+from typing import Callable, Dict, List, Optional
+from functools import partial
+import itertools
+import threading
+import time
+
+from robocorp_ls_core.robotframework_log import get_logger
+
+log = get_logger(__name__)
+
+PRIORITY_ACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+
+class _ScheduledLint(object):
+    __slots__ = ["key", "func", "run_at", "seq"]
+
+    def __init__(self, key: str, func: Callable[[], None], run_at: float, seq):
+        self.key = key
+        self.func = func
+        self.run_at = run_at
+        self.seq = seq
+
+
+class LintScheduler(object):
+    def __init__(
+        self,
+        max_workers: int = 2,
+        get_priority: Optional[Callable[[str], int]] = None,
+    ):
+        """
+        :param get_priority:
+            Called with the key of a lint which is ready to run (so, the
+            priority is computed when the lint is about to run and not when
+            it's scheduled).
+        """
+        self._max_workers = max_workers
+        self._get_priority = get_priority
+        self._condition = threading.Condition()
+        self._pending: Dict[str, _ScheduledLint] = {}
+        self._workers: List[threading.Thread] = []
+        self._idle_workers = 0
+        self._next_seq = partial(next, itertools.count(0))
+        self._disposed = False
+
+    def schedule(self, key: str, func: Callable[[], None], delay: float) -> None:
+        with self._condition:
+            if self._disposed:
+                return
+            # Any lint still pending for the same key is replaced.
+            self._pending[key] = _ScheduledLint(
+                key, func, time.monotonic() + delay, self._next_seq()
+            )
+            if not self._idle_workers and len(self._workers) < self._max_workers:
+                t = threading.Thread(
+                    target=self._worker_loop,
+                    name=f"Lint worker {len(self._workers)}",
+                    daemon=True,
+                )
+                self._workers.append(t)
+                t.start()
+            else:
+                self._condition.notify()
+
+    def cancel(self, key: str) -> None:
+        """
+        Cancels a lint which is still pending (a lint which is already running
+        must be cancelled by the caller).
+        """
+        with self._condition:
+            self._pending.pop(key, None)
+
+    def count_pending(self) -> int:
+        with self._condition:
+            return len(self._pending)
+
+    def dispose(self) -> None:
+        with self._condition:
+            self._disposed = True
+            self._pending.clear()
+            self._condition.notify_all()
+
+    def _get_next(self) -> Optional[_ScheduledLint]:
+        """
+        Must be called with the lock held.
+
+        :return: the lint to run or None if the scheduler was disposed.
+        """
+        while not self._disposed:
+            now = time.monotonic()
+            ready = []
+            next_run_at = None
+            for scheduled in self._pending.values():
+                if scheduled.run_at <= now:
+                    ready.append(scheduled)
+                elif next_run_at is None or scheduled.run_at < next_run_at:
+                    next_run_at = scheduled.run_at
+
+            if ready:
+                get_priority = self._get_priority
+                if get_priority is not None:
+                    priorities = {s.key: get_priority(s.key) for s in ready}
+                    scheduled = min(
+                        ready, key=lambda s: (priorities[s.key], s.run_at, s.seq)
+                    )
+                else:
+                    scheduled = min(ready, key=lambda s: (s.run_at, s.seq))
+                del self._pending[scheduled.key]
+                return scheduled
+
+            self._idle_workers += 1
+            try:
+                if next_run_at is None:
+                    self._condition.wait()
+                else:
+                    self._condition.wait(next_run_at - now)
+            finally:
+                self._idle_workers -= 1
+        return None
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._condition:
+                scheduled = self._get_next()
+            if scheduled is None:
+                return
+
+            try:
+                scheduled.func()
+            except Exception:
+                log.exception("Error running lint for: %s", scheduled.key)
@@ -0,0 +1,188 @@
+"""
+Command line to lint the .robot/.resource files in a folder with the same
+diagnostics provided by the language server (i.e.: to be used in a CI).
+
+Usage:
+
+    python -m robotframework_ls.lint_workspace <folder> [--settings=settings.json]
+
+The diagnostics for each file are printed as the file is linted and the
+process exits with 1 if some error was found (and 0 otherwise).
+"""
+import argparse
+import os
+import sys
+
+
+_SEVERITY_TO_NAME = {1: "error", 2: "warning", 3: "info", 4: "hint"}
+
+_COLLECT_FILES_TIMEOUT_IN_SECONDS = 60 * 5
+
+
+def add_arguments(parser):
+    parser.description = (
+        "Lints the .robot/.resource files in the given folders with the "
+        "Robot Framework Language Server."
+    )
+
+    parser.add_argument(
+        "folders",
+        nargs="*",
+        help="The folders to be linted (the current folder if not given).",
+    )
+
+    parser.add_argument(
+        "--settings",
+        help=(
+            "A .json file with the settings to be used (i.e.: "
+            '{"robot": {"pythonpath": ["./src"], "lint": {"robocop": {"enabled": true}}}}).'
+        ),
+    )
+
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="The number of processes used to lint (default: based on the number of cpus).",
+    )
+
+    parser.add_argument(
+        "--format",
+        choices=("text", "json"),
+        default="text",
+        help="The format of the output (json outputs one json object per file linted).",
+    )
+
+    parser.add_argument(
+        "--log-file",
+        help="Redirect logs to the given file instead of writing to stderr (i.e.: c:/temp/my_log.log).",
+    )
+
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="count",
+        default=0,
+        help="Increase verbosity of log output (i.e.: -vv).",
+    )
+
+
+def _format_diagnostic(filename, diagnostic) -> str:
+    start = diagnostic["range"]["start"]
+    severity = _SEVERITY_TO_NAME.get(diagnostic.get("severity", 1), "error")
+    source = diagnostic.get("source", "")
+    code = diagnostic.get("code")
+    if code:
+        source = f"{source}:{code}"
+    return "%s:%s:%s: %s: %s (%s)" % (
+        filename,
+        start["line"] + 1,
+        start["character"] + 1,
+        severity,
+        diagnostic["message"],
+        source,
+    )
+
+
+def main(args=None) -> int:
+    import json
+
+    try:
+        import robotframework_ls
+    except ImportError:
+        # Automatically add it to the path if __main__ is being executed.
+        sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        import robotframework_ls  # @UnusedImport
+    robotframework_ls.import_robocorp_ls_core()
+
+    from robocorp_ls_core import uris
+    from robocorp_ls_core.lsp import WorkspaceFolder
+    from robocorp_ls_core.robotframework_log import configure_logger
+    from robocorp_ls_core.watchdog_wrapper import create_observer
+    from robocorp_ls_core.workspace import Workspace
+    from robotframework_ls.impl import workspace_lint
+
+    parser = argparse.ArgumentParser()
+    add_arguments(parser)
+    args = parser.parse_args(args=args)
+
+    configure_logger("lint", args.verbose, args.log_file or "")
+
+    settings = {}
+    if args.settings:
+        with open(args.settings, "r", encoding="utf-8") as stream:
+            settings = json.load(stream)
+
+    folders = [os.path.abspath(folder) for folder in (args.folders or ["."])]
+    for folder in folders:
+        if not os.path.isdir(folder):
+            sys.stderr.write(f"Expected {folder} to be a directory.\n")
+            return 2
+
+    root_uri = uris.from_fs_path(folders[0])
+    workspace_folders = [
+        (uris.from_fs_path(folder), os.path.basename(folder)) for folder in folders
+    ]
+
+    # Just used to collect the files to lint (the same ignored directories
+    # from the language server are used).
+    observer = create_observer("dummy", ())
+    workspace = Workspace(
+        root_uri,
+        observer,
+        [WorkspaceFolder(uri, name) for uri, name in workspace_folders],
+    )
+    try:
+        workspace.wait_for_check_done(_COLLECT_FILES_TIMEOUT_IN_SECONDS)
+        doc_uris = list(
+            workspace.iter_all_doc_uris_in_workspace((".robot", ".resource"))
+        )
+    finally:
+        workspace.dispose()
+        observer.dispose()
+
+    found_errors = [False]
+
+    def on_file_linted(doc_uri, diagnostics):
+        if any(diagnostic.get("severity", 1) == 1 for diagnostic in diagnostics):
+            found_errors[0] = True
+
+        filename = uris.to_fs_path(doc_uri)
+        if args.format == "json":
+            sys.stdout.write(
+                json.dumps({"uri": doc_uri, "diagnostics": diagnostics}) + "\n"
+            )
+        else:
+            relative = os.path.relpath(filename)
+            for diagnostic in diagnostics:
+                sys.stdout.write(_format_diagnostic(relative, diagnostic) + "\n")
+        sys.stdout.flush()
+
+    stats = workspace_lint.lint_workspace(
+        root_uri,
+        workspace_folders,
+        doc_uris,
+        settings,
+        on_file_linted,
+        max_workers=args.jobs,
+        log_level=args.verbose,
+        log_file=args.log_file,
+    )
+
+    sys.stderr.write(
+        "Linted %s files in %.2fs (%.1f files/s, %s workers): %s diagnostics in %s files.\n"
+        % (
+            stats["files"],
+            stats["elapsedTime"],
+            stats["filesPerSecond"],
+            stats["workers"],
+            stats["diagnostics"],
+            stats["filesWithDiagnostics"],
+        )
+    )
+    return 1 if found_errors[0] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
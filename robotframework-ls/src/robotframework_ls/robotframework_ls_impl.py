@@ -19,6 +19,7 @@ from robotframework_ls.ep_providers import (
     EPEndPointProvider,
 )
 from robocorp_ls_core.jsonrpc.endpoint import require_monitor
+from robocorp_ls_core.jsonrpc.json_codec import RawJson
 from functools import partial
 import itertools
 from robotframework_ls import __version__, rf_interactive_integration
@@ -35,6 +36,7 @@ from robotframework_ls.commands import (
     ROBOT_GET_RFLS_HOME_DIR,
     ROBOT_START_INDEXING_INTERNAL,
     ROBOT_WAIT_FULL_TEST_COLLECTION_INTERNAL,
+    ROBOT_LINT_WORKSPACE,
 )
 
 
@@ -43,6 +45,25 @@ log = get_logger(__name__)
 _LINT_DEBOUNCE_IN_SECONDS_LOW = 0.2
 _LINT_DEBOUNCE_IN_SECONDS_HIGH = 0.8
 
+# The maximum number of lint requests running at the same time.
+_LINT_MAX_WORKERS = 2
+
+# Documents with some request from the client in this timeout are considered
+# visible in the client and are linted first.
+_LINT_ACTIVE_DOC_TIMEOUT_IN_SECONDS = 30
+
+# Linting the whole workspace may take a long time in big workspaces (it may
+# still be cancelled by the client).
+_LINT_WORKSPACE_TIMEOUT_IN_SECONDS = 60 * 60 * 24
+
+# The results of the api requests are forwarded without being decoded, so,
+# these are checked to keep returning None for empty results.
+_EMPTY_RAW_RESULTS = frozenset((b"null", b"[]", b"{}", b'""', b"false", b"0"))
+
+
+def _is_empty_raw_result(result) -> bool:
+    return result.__class__ is RawJson and result.data in _EMPTY_RAW_RESULTS
+
 
 class _CurrLintInfo(object):
     def __init__(
@@ -101,18 +122,11 @@ class _CurrLintInfo(object):
         self._monitor.cancel()
 
 
-def run_in_new_thread(func, thread_name):
-    import threading
-
-    t = threading.Thread(target=func)
-    t.name = thread_name
-    t.start()
-
-
 class _LintManager(object):
     def __init__(self, server_manager, lsp_messages) -> None:
         import threading
         from robotframework_ls.server_manager import ServerManager
+        from robotframework_ls.lint_scheduler import LintScheduler
 
         self._server_manager: ServerManager = server_manager
         self._lsp_messages = lsp_messages
@@ -121,8 +135,35 @@ class _LintManager(object):
         self._doc_id_to_info: Dict[str, _CurrLintInfo] = {}
         self._lock = threading.Lock()
 
+        # doc uri -> time when the client last made a request for it (used to
+        # give priority to the documents visible in the client).
+        self._doc_id_to_active_time: Dict[str, float] = {}
+        self._active_lock = threading.Lock()
+
+        self._lint_scheduler = LintScheduler(
+            max_workers=_LINT_MAX_WORKERS, get_priority=self._get_priority
+        )
+
+    def mark_active(self, doc_uri: str) -> None:
+        with self._active_lock:
+            self._doc_id_to_active_time[doc_uri] = time.time()
+
+    def _get_priority(self, doc_uri: str) -> int:
+        from robotframework_ls.lint_scheduler import (
+            PRIORITY_ACTIVE,
+            PRIORITY_BACKGROUND,
+        )
+
+        with self._active_lock:
+            active_time = self._doc_id_to_active_time.get(doc_uri)
+        if active_time is not None:
+            if time.time() - active_time < _LINT_ACTIVE_DOC_TIMEOUT_IN_SECONDS:
+                return PRIORITY_ACTIVE
+        return PRIORITY_BACKGROUND
+
     def schedule_lint(self, doc_uri: str, is_saved: bool, timeout: float) -> None:
-        self.cancel_lint(doc_uri)
+        # Note: a lint still pending in the scheduler is replaced by this one.
+        self._cancel_curr_lint(doc_uri)
         rf_lint_api_client = self._server_manager.get_lint_rf_api_client(doc_uri)
         if rf_lint_api_client is None:
             log.info("Unable to get lint api for: %s", doc_uri)
@@ -148,15 +189,9 @@ class _LintManager(object):
         with self._lock:
             self._doc_id_to_info[doc_uri] = curr_info
 
-        from robocorp_ls_core.timeouts import TimeoutTracker
+        self._lint_scheduler.schedule(doc_uri, curr_info, timeout)
 
-        timeout_tracker = TimeoutTracker.get_singleton()
-        timeout_tracker.call_on_timeout(
-            timeout,
-            partial(run_in_new_thread, curr_info, f"Lint: {doc_uri}"),
-        )
-
-    def cancel_lint(self, doc_uri: str) -> None:
+    def _cancel_curr_lint(self, doc_uri: str) -> None:
         with self._lock:
             curr_info = self._doc_id_to_info.pop(doc_uri, None)
             if curr_info is not None:
@@ -164,6 +199,16 @@ class _LintManager(object):
 
                 curr_info.cancel()
 
+    def cancel_lint(self, doc_uri: str) -> None:
+        self._lint_scheduler.cancel(doc_uri)
+        self._cancel_curr_lint(doc_uri)
+
+        with self._active_lock:
+            self._doc_id_to_active_time.pop(doc_uri, None)
+
+    def dispose(self) -> None:
+        self._lint_scheduler.dispose()
+
 
 from robocorp_ls_core.command_dispatcher import _CommandDispatcher
 
@@ -347,7 +392,7 @@ class RobotFrameworkLanguageServer(PythonLanguageServer):
             "completionProvider": {"resolveProvider": True},  # Docs are lazily computed
             "documentFormattingProvider": True,
             "documentHighlightProvider": True,
-            "documentRangeFormattingProvider": False,
+            "documentRangeFormattingProvider": True,
             "documentSymbolProvider": True,
             "definitionProvider": True,
             "executeCommandProvider": {
@@ -387,8 +432,8 @@ class RobotFrameworkLanguageServer(PythonLanguageServer):
                     "tokenTypes": TOKEN_TYPES,
                     "tokenModifiers": TOKEN_MODIFIERS,
                 },
-                "range": False,
-                "full": True,
+                "range": True,
+                "full": {"delta": True},
             },
         }
         log.debug("Server capabilities: %s", server_capabilities)
@@ -446,6 +491,34 @@ class RobotFrameworkLanguageServer(PythonLanguageServer):
         log.info("Unable to wait for first test collection (no api available).")
         return []
 
+    @command_dispatcher(ROBOT_LINT_WORKSPACE)
+    def _lint_workspace(self, *arguments):
+        """
+        Lints all the files in the workspace (the diagnostics are published as
+        each file is linted).
+
+        :return LintWorkspaceStatsTypedDict: information on the number of files
+            linted and the throughput.
+        """
+        max_workers = None
+        if arguments and isinstance(arguments[0], dict):
+            max_workers = arguments[0].get("maxWorkers")
+
+        rf_api_client = self._server_manager.get_lint_rf_api_client("")
+        if rf_api_client is not None:
+            func = partial(
+                self._threaded_api_request_no_doc,
+                rf_api_client,
+                "request_lint_workspace",
+                max_workers=max_workers,
+                __timeout__=_LINT_WORKSPACE_TIMEOUT_IN_SECONDS,
+            )
+            func = require_monitor(func)
+            return func
+
+        log.info("Unable to lint workspace (no api available).")
+        return None
+
     @command_dispatcher("robot.getInternalInfo")
     def _get_internal_info(self, *arguments):
         in_memory_docs = []
@@ -536,6 +609,7 @@ class RobotFrameworkLanguageServer(PythonLanguageServer):
         except Exception:
             log.exception("Error disposing RemoteFSObserver.")
         self._server_manager.shutdown()
+        self._lint_manager.dispose()
 
         PythonLanguageServer.m_shutdown(self, **kwargs)
 
@@ -561,6 +635,26 @@ class RobotFrameworkLanguageServer(PythonLanguageServer):
         message_matcher = source_format_rf_api_client.request_source_format(
             text_document=textDocument, options=options
         )
+        return self._wait_for_code_format(message_matcher)
+
+    def m_text_document__range_formatting(
+        self, textDocument=None, range=None, options=None
+    ) -> Optional[list]:
+        doc_uri = textDocument["uri"]
+
+        source_format_rf_api_client = self._server_manager.get_others_api_client(
+            doc_uri
+        )
+        if source_format_rf_api_client is None:
+            log.info("Unable to get API for source format.")
+            return []
+
+        message_matcher = source_format_rf_api_client.request_range_source_format(
+            text_document=textDocument, range=range, options=options
+        )
+        return self._wait_for_code_format(message_matcher)
+
+    def _wait_for_code_format(self, message_matcher) -> list:
         if message_matcher is None:
             raise RuntimeError(
                 "Error requesting code formatting (message_matcher==None)."
@@ -597,6 +691,7 @@ class RobotFrameworkLanguageServer(PythonLanguageServer):
 
     @overrides(PythonLanguageServer.m_text_document__did_open)
     def m_text_document__did_open(self, textDocument=None, **_kwargs):
+        self._lint_manager.mark_active(textDocument["uri"])
         self._server_manager.forward(
             ("api", "lint", "others"),
             "textDocument/didOpen",
@@ -663,6 +758,7 @@ class RobotFrameworkLanguageServer(PythonLanguageServer):
 
     def m_text_document__completion(self, **params):
         doc_uri = params["textDocument"]["uri"]
+        self._lint_manager.mark_active(doc_uri)
         # Note: 0-based
         line, col = params["position"]["line"], params["position"]["character"]
         return self._robot_framework_ls_completion_impl.text_document_completion(
@@ -710,12 +806,12 @@ class RobotFrameworkLanguageServer(PythonLanguageServer):
             __timeout__,
             monitor,
         ):
-            msg = message_matcher.msg
+            msg = message_matcher.raw_msg
             if msg is not None:
                 result = msg.get("result")
                 if __log__:
                     log.info("Result: %s", result)
-                if result:
+                if result and not _is_empty_raw_result(result):
                     return result
 
         return None
@@ -726,6 +822,7 @@ class RobotFrameworkLanguageServer(PythonLanguageServer):
         rf_api_client: IRobotFrameworkApiClient,
         request_method_name: str,
         monitor: Optional[IMonitor],
+        __timeout__=DEFAULT_COMPLETIONS_TIMEOUT,
         **kwargs,
     ):
         from robocorp_ls_core.client_base import wait_for_message_matcher
@@ -741,13 +838,13 @@ class RobotFrameworkLanguageServer(PythonLanguageServer):
         if wait_for_message_matcher(
             message_matcher,
             rf_api_client.request_cancel,
-            DEFAULT_COMPLETIONS_TIMEOUT,
+            __timeout__,
             monitor,
         ):
-            msg = message_matcher.msg
+            msg = message_matcher.raw_msg
             if msg is not None:
                 result = msg.get("result")
-                if result:
+                if result and not _is_empty_raw_result(result):
                     return result
 
         return None
@@ -761,6 +858,9 @@ class RobotFrameworkLanguageServer(PythonLanguageServer):
         __add_doc_uri_in_args__=True,
         **kwargs,
     ):
+        if doc_uri:
+            self._lint_manager.mark_active(doc_uri)
+
         rf_api_client: IRobotFrameworkApiClient
         if target_api == "api":
             rf_api_client = self._server_manager.get_regular_rf_api_client(doc_uri)
@@ -900,10 +1000,48 @@ class RobotFrameworkLanguageServer(PythonLanguageServer):
         return []
 
     def m_text_document__semantic_tokens__range(self, textDocument=None, range=None):
-        raise RuntimeError("Not currently implemented!")
+        doc_uri = textDocument["uri"]
+        self._lint_manager.mark_active(doc_uri)
+        api = self._server_manager.get_others_api_client(doc_uri)
+        if api is None:
+            log.info("Unable to get api client when computing semantic tokens (range).")
+            return {"resultId": None, "data": []}
+
+        func = partial(
+            self._threaded_api_request_no_doc,
+            api,
+            "request_semantic_tokens_range",
+            text_document=textDocument,
+            range=range,
+        )
+        func = require_monitor(func)
+        return func
+
+    def m_text_document__semantic_tokens__full__delta(
+        self, textDocument=None, previousResultId=None
+    ):
+        doc_uri = textDocument["uri"]
+        self._lint_manager.mark_active(doc_uri)
+        api = self._server_manager.get_others_api_client(doc_uri)
+        if api is None:
+            log.info("Unable to get api client when computing semantic tokens (delta).")
+            return {"resultId": None, "data": []}
+
+        # Note: the previous result is kept in the api (so, only the delta
+        # needs to be sent from the api to the language server).
+        func = partial(
+            self._threaded_api_request_no_doc,
+            api,
+            "request_semantic_tokens_full_delta",
+            text_document=textDocument,
+            previous_result_id=previousResultId,
+        )
+        func = require_monitor(func)
+        return func
 
     def m_text_document__semantic_tokens__full(self, textDocument=None):
         doc_uri = textDocument["uri"]
+        self._lint_manager.mark_active(doc_uri)
         api = self._server_manager.get_others_api_client(doc_uri)
         if api is None:
             log.info("Unable to get api client when computing semantic tokens (full).")
@@ -936,6 +1074,7 @@ class RobotFrameworkLanguageServer(PythonLanguageServer):
     def m_text_document__document_highlight(self, **kwargs):
         params: TextDocumentPositionParamsTypedDict = kwargs
         doc_uri = params["textDocument"]["uri"]
+        self._lint_manager.mark_active(doc_uri)
         line, col = params["position"]["line"], params["position"]["character"]
         api = self._server_manager.get_others_api_client(doc_uri)
         if api is None:
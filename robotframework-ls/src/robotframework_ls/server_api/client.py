@@ -14,6 +14,7 @@ from robocorp_ls_core.lsp import (
     CompletionItemTypedDict,
     CompletionsResponseTypedDict,
     CompletionResolveResponseTypedDict,
+    RangeTypedDict,
 )
 from robocorp_ls_core.basic import implements
 
@@ -120,6 +121,16 @@ class RobotFrameworkApiClient(LanguageServerClientBase):
         """
         return self.request_async(self._build_msg("lint", doc_uri=doc_uri))
 
+    def request_lint_workspace(
+        self, max_workers: Optional[int] = None
+    ) -> Optional[IIdMessageMatcher]:
+        """
+        :Note: async complete.
+        """
+        return self.request_async(
+            self._build_msg("lintWorkspace", max_workers=max_workers)
+        )
+
     def request_semantic_tokens_full(
         self, text_document: TextDocumentTypedDict
     ) -> Optional[IIdMessageMatcher]:
@@ -132,6 +143,34 @@ class RobotFrameworkApiClient(LanguageServerClientBase):
             )
         )
 
+    def request_semantic_tokens_full_delta(
+        self, text_document: TextDocumentTypedDict, previous_result_id: Optional[str]
+    ) -> Optional[IIdMessageMatcher]:
+        """
+        :Note: async complete.
+        """
+        return self.request_async(
+            self._build_msg(
+                "textDocument/semanticTokens/full/delta",
+                textDocument=text_document,
+                previousResultId=previous_result_id,
+            )
+        )
+
+    def request_semantic_tokens_range(
+        self, text_document: TextDocumentTypedDict, range: RangeTypedDict
+    ) -> Optional[IIdMessageMatcher]:
+        """
+        :Note: async complete.
+        """
+        return self.request_async(
+            self._build_msg(
+                "textDocument/semanticTokens/range",
+                textDocument=text_document,
+                range=range,
+            )
+        )
+
     def request_semantic_tokens_from_code_full(
         self, prefix: str, full_code: str, indent: str, uri: str
     ) -> Optional[IIdMessageMatcher]:
@@ -273,6 +312,21 @@ class RobotFrameworkApiClient(LanguageServerClientBase):
             self._build_msg("codeFormat", text_document=text_document, options=options)
         )
 
+    def request_range_source_format(
+        self, text_document, range, options
+    ) -> Optional[IIdMessageMatcher]:
+        """
+        :Note: async complete.
+        """
+        return self.request_async(
+            self._build_msg(
+                "rangeCodeFormat",
+                text_document=text_document,
+                range=range,
+                options=options,
+            )
+        )
+
     def request_signature_help(self, doc_uri, line, col) -> Optional[IIdMessageMatcher]:
         """
         :Note: async complete.
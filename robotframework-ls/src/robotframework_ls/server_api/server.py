@@ -1,7 +1,7 @@
 from robocorp_ls_core.python_ls import PythonLanguageServer
 from robocorp_ls_core.basic import overrides
 from robocorp_ls_core.robotframework_log import get_logger
-from typing import Optional, List, Dict, Deque
+from typing import Optional, List, Dict, Deque, Tuple, Union
 from robocorp_ls_core.protocols import IConfig, IMonitor, ITestInfoTypedDict, IWorkspace
 from functools import partial
 from robocorp_ls_core.jsonrpc.endpoint import require_monitor
@@ -17,6 +17,8 @@ from robocorp_ls_core.lsp import (
     DocumentHighlightTypedDict,
     RangeTypedDict,
     CompletionItemTypedDict,
+    SemanticTokensTypedDict,
+    SemanticTokensDeltaTypedDict,
 )
 from robotframework_ls.impl.protocols import (
     IKeywordFound,
@@ -29,10 +31,13 @@ import itertools
 import typing
 import sys
 import threading
+import os
 
 
 log = get_logger(__name__)
 
+_LINT_WORKSPACE_COLLECT_FILES_TIMEOUT = 60 * 5
+
 
 class RobotFrameworkServerApi(PythonLanguageServer):
     """
@@ -76,6 +81,11 @@ class RobotFrameworkServerApi(PythonLanguageServer):
         self._completion_contexts_saved_lock = threading.Lock()
         self._completion_contexts_saved: Deque[ICompletionContext] = deque()
 
+        # doc uri -> (result id, semantic tokens data) of the last result.
+        self._semantic_tokens_cache: Dict[str, Tuple[str, List[int]]] = {}
+        self._semantic_tokens_cache_lock = threading.Lock()
+        self._next_semantic_tokens_result_id = partial(next, itertools.count(0))
+
     @overrides(PythonLanguageServer._create_config)
     def _create_config(self) -> IConfig:
         from robotframework_ls.robot_config import RobotConfig
@@ -169,19 +179,10 @@ class RobotFrameworkServerApi(PythonLanguageServer):
 
     def _threaded_lint(self, doc_uri, monitor: IMonitor):
         from robocorp_ls_core.jsonrpc.exceptions import JsonRpcRequestCancelled
-        from robotframework_ls.impl.robot_lsp_constants import (
-            OPTION_ROBOT_LINT_ROBOCOP_ENABLED,
-        )
-        from robocorp_ls_core import uris
         from robocorp_ls_core.lsp import Error
-        from robotframework_ls.impl.robot_lsp_constants import (
-            OPTION_ROBOT_LINT_ENABLED,
-        )
 
         try:
-            from robotframework_ls.impl.ast_utils import collect_errors
-            from robotframework_ls.impl import code_analysis
-            import os.path
+            from robotframework_ls.impl.workspace_lint import collect_lint_diagnostics
 
             log.debug("Lint: starting (in thread).")
 
@@ -189,64 +190,7 @@ class RobotFrameworkServerApi(PythonLanguageServer):
             if completion_context is None:
                 return []
 
-            config = completion_context.config
-            robocop_enabled = config is None or config.get_setting(
-                OPTION_ROBOT_LINT_ROBOCOP_ENABLED, bool, False
-            )
-
-            ast = completion_context.get_ast()
-            source = completion_context.doc.source
-            monitor.check_cancelled()
-            errors = collect_errors(ast)
-            log.debug("Collected AST errors (in thread): %s", len(errors))
-            monitor.check_cancelled()
-
-            lint_ls_enabled = config is None or config.get_setting(
-                OPTION_ROBOT_LINT_ENABLED, bool, True
-            )
-            if lint_ls_enabled:
-                analysis_errors = code_analysis.collect_analysis_errors(
-                    completion_context
-                )
-                monitor.check_cancelled()
-                log.debug(
-                    "Collected analysis errors (in thread): %s", len(analysis_errors)
-                )
-                errors.extend(analysis_errors)
-            else:
-                log.debug("Language server linting disabled.")
-
-            lsp_diagnostics = [error.to_lsp_diagnostic() for error in errors]
-
-            try:
-                if robocop_enabled:
-                    from robocorp_ls_core.robocop_wrapper import (
-                        collect_robocop_diagnostics,
-                    )
-
-                    workspace = completion_context.workspace
-                    if workspace is not None:
-                        project_root = workspace.root_path
-                    else:
-                        project_root = os.path.abspath(".")
-
-                    monitor.check_cancelled()
-                    lsp_diagnostics.extend(
-                        collect_robocop_diagnostics(
-                            project_root, ast, uris.to_fs_path(doc_uri), source
-                        )
-                    )
-            except Exception as e:
-                log.exception(
-                    "Error collecting Robocop errors (possibly an unsupported Robocop version is installed)."
-                )
-                lsp_diagnostics.append(
-                    Error(
-                        f"Error collecting Robocop errors: {e}", (0, 0), (1, 0)
-                    ).to_lsp_diagnostic()
-                )
-
-            return lsp_diagnostics
+            return collect_lint_diagnostics(completion_context)
         except JsonRpcRequestCancelled:
             raise JsonRpcRequestCancelled("Lint cancelled (inside lint)")
         except Exception as e:
@@ -258,6 +202,80 @@ class RobotFrameworkServerApi(PythonLanguageServer):
             ]
             return ret
 
+    def m_lint_workspace(self, max_workers=None):
+        if not self._check_min_version((3, 2)):
+            log.info(self.m_version())
+            return None
+
+        func = partial(self._threaded_lint_workspace, max_workers)
+        func = require_monitor(func)
+        return func
+
+    def _threaded_lint_workspace(self, max_workers, monitor: IMonitor):
+        """
+        Lints all the files in the workspace in a pool of processes (the
+        diagnostics for each file are sent with `textDocument/publishDiagnostics`
+        as soon as the file is linted).
+
+        :return LintWorkspaceStatsTypedDict: information on the number of files
+            linted and the throughput.
+        """
+        from robocorp_ls_core.lsp import LSPMessages
+        from robocorp_ls_core.progress_report import progress_context
+        from robocorp_ls_core.progress_report import ProgressWrapperForTotalWork
+        from robotframework_ls.impl import workspace_lint
+        from robotframework_ls.impl.robot_workspace import RobotWorkspace
+        from robotframework_ls.options import Setup
+
+        workspace = self.workspace
+        if not workspace:
+            log.info("Workspace still not initialized.")
+            return None
+
+        robot_workspace = typing.cast(RobotWorkspace, workspace)
+
+        # Make sure that the files in the workspace were already collected.
+        robot_workspace.wait_for_check_done(_LINT_WORKSPACE_COLLECT_FILES_TIMEOUT)
+        doc_uris = list(
+            robot_workspace.iter_all_doc_uris_in_workspace((".robot", ".resource"))
+        )
+
+        # The documents open in the editor must be linted with their contents
+        # in memory (and not with the contents in the filesystem).
+        doc_uri_to_source = {}
+        for doc_uri in robot_workspace.get_open_docs_uris():
+            doc = robot_workspace.get_document(doc_uri, accept_from_file=False)
+            if doc is not None:
+                doc_uri_to_source[doc_uri] = doc.source
+
+        folders = [(folder.uri, folder.name) for folder in workspace.iter_folders()]
+        lsp_messages = LSPMessages(self._endpoint)
+
+        with progress_context(self._endpoint, "Lint workspace", None) as progress:
+            progress_wrapper = ProgressWrapperForTotalWork(
+                progress, message="Linted %s of %s files"
+            )
+            for _doc_uri in doc_uris:
+                progress_wrapper.increment_total_steps()
+
+            def on_file_linted(doc_uri, diagnostics):
+                lsp_messages.publish_diagnostics(doc_uri, diagnostics)
+                progress_wrapper.increment_step_done()
+
+            stats = workspace_lint.lint_workspace(
+                workspace.root_uri,
+                folders,
+                doc_uris,
+                self.config.get_full_settings(),
+                on_file_linted,
+                max_workers=max_workers,
+                monitor=monitor,
+                log_level=Setup.options.verbose,
+                log_file=Setup.options.log_file,
+                doc_uri_to_source=doc_uri_to_source,
+            )
+        return stats
+
     def m_resolve_completion_item(
         self,
         completion_item: CompletionItemTypedDict,
@@ -455,7 +473,19 @@ class RobotFrameworkServerApi(PythonLanguageServer):
         func = require_monitor(func)
         return func
 
-    def _threaded_code_format(self, text_document, options, monitor: IMonitor):
+    def m_range_code_format(self, text_document, range, options):
+        func = partial(self._threaded_code_format, text_document, options, range=range)
+        func = require_monitor(func)
+        return func
+
+    def _threaded_code_format(
+        self, text_document, options, monitor: IMonitor, range=None
+    ):
+        """
+        :param range:
+            If given only the blocks (test cases, keywords, ...) which
+            intersect the given range are formatted.
+        """
         from robotframework_ls.impl.formatting import create_text_edit_from_diff
         from robocorp_ls_core.lsp import TextDocumentItem
         import os.path
@@ -471,7 +501,8 @@ class RobotFrameworkServerApi(PythonLanguageServer):
 
         text_document_item = TextDocumentItem(**text_document)
         text = text_document_item.text
-        if not text:
+        completion_context = None
+        if not text or range is not None:
             completion_context = self._create_completion_context(
                 text_document_item.uri, 0, 0, monitor
             )
@@ -512,7 +543,11 @@ class RobotFrameworkServerApi(PythonLanguageServer):
         if formatter == OPTION_ROBOT_CODE_FORMATTER_BUILTIN_TIDY:
             from robotframework_ls.impl.formatting import robot_source_format
 
-            new_contents = robot_source_format(text, space_count=tab_size)
+            def format_source(source):
+                return robot_source_format(source, space_count=tab_size)
+
+            def format_document():
+                return format_source(text)
 
         else:
             if not self._check_min_version((4, 0)):
@@ -523,7 +558,13 @@ class RobotFrameworkServerApi(PythonLanguageServer):
 
             from robocorp_ls_core.robotidy_wrapper import robot_tidy_source_format
 
-            ast = completion_context.get_ast()
+            if completion_context is None:
+                completion_context = self._create_completion_context(
+                    text_document_item.uri, 0, 0, monitor
+                )
+                if completion_context is None:
+                    return []
+
             path = completion_context.doc.path
             dirname = "."
             try:
@@ -536,13 +577,44 @@ class RobotFrameworkServerApi(PythonLanguageServer):
             else:
                 dirname = os.path.dirname(path)
 
-            try:
-                new_contents = robot_tidy_source_format(ast, dirname)
-            except ImportError:
-                log.critical(
-                    "Unable to code-format because robotidy could not be imported."
-                )
-                return []
+            def format_source(source):
+                from robot.api import get_model
+
+                return robot_tidy_source_format(get_model(source), dirname)
+
+            def format_document():
+                return robot_tidy_source_format(completion_context.get_ast(), dirname)
+
+        try:
+            if range is not None:
+                from robotframework_ls.impl.formatting import create_range_text_edits
+
+                start_line = range["start"]["line"]
+                end_line = range["end"]["line"]
+                if end_line > start_line and range["end"]["character"] == 0:
+                    # The end line isn't really selected.
+                    end_line -= 1
+
+                # Note: the completion context is always created for a range.
+                assert completion_context is not None
+                doc = completion_context.doc
+                return [
+                    x.to_dict()
+                    for x in create_range_text_edits(
+                        completion_context.get_ast(),
+                        doc.get_internal_lines(),
+                        start_line,
+                        end_line,
+                        format_source,
+                    )
+                ]
+
+            new_contents = format_document()
+        except ImportError:
+            log.critical(
+                "Unable to code-format because robotidy could not be imported."
+            )
+            return []
 
         if new_contents is None or new_contents == text:
             return []
@@ -802,23 +874,106 @@ class RobotFrameworkServerApi(PythonLanguageServer):
         )
 
     def m_text_document__semantic_tokens__range(self, textDocument=None, range=None):
-        raise RuntimeError("Not currently implemented!")
+        func = partial(
+            self.threaded_semantic_tokens_range, textDocument=textDocument, range=range
+        )
+        func = require_monitor(func)
+        return func
+
+    def threaded_semantic_tokens_range(
+        self,
+        textDocument: TextDocumentTypedDict,
+        range: RangeTypedDict,
+        monitor: Optional[IMonitor] = None,
+    ) -> SemanticTokensTypedDict:
+        from robotframework_ls.impl.semantic_tokens import semantic_tokens_range
+
+        doc_uri = textDocument["uri"]
+        context = self._create_completion_context(doc_uri, -1, -1, monitor)
+        if context is None:
+            return {"resultId": None, "data": []}
+        return {"resultId": None, "data": semantic_tokens_range(context, range)}
 
     def m_text_document__semantic_tokens__full(self, textDocument=None):
         func = partial(self.threaded_semantic_tokens_full, textDocument=textDocument)
         func = require_monitor(func)
         return func
 
+    def _compute_semantic_tokens_full(
+        self, doc_uri: str, monitor: Optional[IMonitor]
+    ) -> Optional[SemanticTokensTypedDict]:
+        """
+        Computes the semantic tokens and keeps them (so that a delta can be
+        computed in the next request).
+        """
+        from robotframework_ls.impl.semantic_tokens import semantic_tokens_full
+
+        context = self._create_completion_context(doc_uri, -1, -1, monitor)
+        if context is None:
+            return None
+
+        data = semantic_tokens_full(context)
+        result_id = f"{os.getpid()}-{self._next_semantic_tokens_result_id()}"
+        with self._semantic_tokens_cache_lock:
+            self._semantic_tokens_cache[doc_uri] = (result_id, data)
+        return {"resultId": result_id, "data": data}
+
     def threaded_semantic_tokens_full(
         self, textDocument: TextDocumentTypedDict, monitor: Optional[IMonitor] = None
+    ) -> SemanticTokensTypedDict:
+        doc_uri = textDocument["uri"]
+        ret = self._compute_semantic_tokens_full(doc_uri, monitor)
+        if ret is None:
+            return {"resultId": None, "data": []}
+        return ret
+
+    def m_text_document__semantic_tokens__full__delta(
+        self, textDocument=None, previousResultId=None
     ):
-        from robotframework_ls.impl.semantic_tokens import semantic_tokens_full
+        func = partial(
+            self.threaded_semantic_tokens_full_delta,
+            textDocument=textDocument,
+            previousResultId=previousResultId,
+        )
+        func = require_monitor(func)
+        return func
+
+    def threaded_semantic_tokens_full_delta(
+        self,
+        textDocument: TextDocumentTypedDict,
+        previousResultId: Optional[str],
+        monitor: Optional[IMonitor] = None,
+    ) -> Union[SemanticTokensTypedDict, SemanticTokensDeltaTypedDict]:
+        from robotframework_ls.impl.semantic_tokens import (
+            compute_semantic_tokens_edits,
+        )
 
         doc_uri = textDocument["uri"]
-        context = self._create_completion_context(doc_uri, -1, -1, monitor)
-        if context is None:
+        with self._semantic_tokens_cache_lock:
+            previous = self._semantic_tokens_cache.get(doc_uri)
+
+        ret = self._compute_semantic_tokens_full(doc_uri, monitor)
+        if ret is None:
             return {"resultId": None, "data": []}
-        return {"resultId": None, "data": semantic_tokens_full(context)}
+
+        if previous is None or previous[0] != previousResultId:
+            # We don't have the previous result (i.e.: the process was
+            # restarted or the result is from another process), so, provide
+            # the full result.
+            return ret
+
+        return {
+            "resultId": ret["resultId"],
+            "edits": compute_semantic_tokens_edits(previous[1], ret["data"]),
+        }
+
+    @overrides(PythonLanguageServer.m_text_document__did_close)
+    def m_text_document__did_close(self, textDocument=None, **_kwargs) -> None:
+        with self._semantic_tokens_cache_lock:
+            self._semantic_tokens_cache.pop(textDocument["uri"], None)
+        PythonLanguageServer.m_text_document__did_close(
+            self, textDocument=textDocument, **_kwargs
+        )
 
     def m_monaco_completions_from_code_full(
         self,
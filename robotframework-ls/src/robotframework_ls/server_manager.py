@@ -9,7 +9,7 @@ import sys
 import weakref
 import os
 from robocorp_ls_core.robotframework_log import get_logger
-from typing import Any, Dict, Optional, Tuple, List, Iterable
+from typing import Any, Dict, Optional, Tuple, List, Iterable, Set
 from robotframework_ls.ep_resolve_interpreter import (
     EPResolveInterpreter,
     IInterpreterInfo,
@@ -25,6 +25,9 @@ from functools import partial
 
 DEFAULT_API_ID = "default"
 
+# Each interpreter uses 3 processes (see: _RegularLintAndOthersApi).
+DEFAULT_MAX_API_PROCESSES = 30
+
 log = get_logger(__name__)
 
 _next_id = partial(next, itertools.count(0))
@@ -75,6 +78,10 @@ class _ServerApi(object):
 
         self._last_settings_sent: Optional[dict] = None
 
+    @property
+    def is_running(self) -> bool:
+        return self._server_process is not None
+
     @property
     def stats(self) -> Optional[dict]:
         client = self._robotframework_api_client
@@ -283,12 +290,19 @@ class _ServerApi(object):
                 write_to = server_process.stdin
                 read_from = server_process.stdout
                 w = JsonRpcStreamWriter(write_to, sort_keys=True)
-                r = JsonRpcStreamReader(read_from)
+                # Note: the results from the api are usually just forwarded to
+                # the client, so, they're only decoded when actually needed.
+                r = JsonRpcStreamReader(read_from, raw_results=True)
 
                 language_server_ref = self._language_server_ref
 
                 def on_received_message(msg):
-                    if msg.get("method") in ("$/customProgress", "$/testsCollected"):
+                    if msg.get("method") in (
+                        "$/customProgress",
+                        "$/testsCollected",
+                        # Published by the workspace lint.
+                        "textDocument/publishDiagnostics",
+                    ):
                         robot_framework_language_server = language_server_ref()
                         if robot_framework_language_server is not None:
                             robot_framework_language_server.forward_msg(msg)
@@ -452,6 +466,17 @@ class _RegularLintAndOthersApi(object):
         self.lint_api = lint_api
         self.others_api = others_api
 
+        # The interpreter ids which currently resolve to these apis (when
+        # empty these apis are idle and may be removed).
+        self.interpreter_ids: Set[str] = set()
+
+        # Used to know which are the least recently used apis.
+        self.last_used: int = 0
+
+        # True if the processes were stopped because of the limit of api
+        # processes (in which case they're only restarted when requested again).
+        self.stopped: bool = False
+
     def __iter__(self):
         yield self.api
         yield self.lint_api
@@ -461,6 +486,32 @@ class _RegularLintAndOthersApi(object):
         for api in self:
             api.set_interpreter_info(interpreter_info)
 
+    def count_running(self) -> int:
+        return sum(1 for api in self if api.is_running)
+
+    def stop(self):
+        for api in self:
+            api.exit()
+        self.stopped = True
+
+
+def _compute_apis_id(interpreter_info: IInterpreterInfo) -> str:
+    """
+    Interpreter infos with the same python executable, environment and
+    pythonpath are served by the same apis.
+    """
+    import json
+    from robotframework_ls.impl.text_utilities import get_digest_from_string
+
+    key = json.dumps(
+        [
+            interpreter_info.get_python_exe(),
+            sorted((interpreter_info.get_environ() or {}).items()),
+            list(interpreter_info.get_additional_pythonpath_entries() or []),
+        ]
+    )
+    return "interpreter_" + get_digest_from_string(key)
+
 
 class ServerManager(object):
     """
@@ -485,6 +536,8 @@ class ServerManager(object):
         self._workspace: Optional[IWorkspace] = workspace
         self._pm = pm
         self._id_to_apis: Dict[str, _RegularLintAndOthersApi] = {}
+        self._interpreter_id_to_apis_id: Dict[str, str] = {}
+        self._used_counter = itertools.count(1)
         if language_server is None:
             self._language_server_ref = lambda: None
         else:
@@ -561,25 +614,100 @@ class ServerManager(object):
             for ep in self._pm.get_implementations(EPResolveInterpreter):
                 interpreter_info = ep.get_interpreter_info_for_doc_uri(doc_uri)
                 if interpreter_info is not None:
-                    # Note: we currently only identify things through the interpreter
-                    # id, but a potential optimization would be using the same python
-                    # executable in different APIs if they match.
+                    # Note: different interpreter ids with the same python
+                    # executable, environment and pythonpath share the same apis.
                     interpreter_id = interpreter_info.get_interpreter_id()
-                    apis = self._id_to_apis.get(interpreter_id)
-                    if apis is not None:
-                        apis.set_interpreter_info(interpreter_info)
-                    else:
-                        apis = self._create_apis(interpreter_id)
-                        apis.set_interpreter_info(interpreter_info)
-
+                    apis_id = _compute_apis_id(interpreter_info)
+
+                    old_apis_id = self._interpreter_id_to_apis_id.get(interpreter_id)
+                    if old_apis_id != apis_id:
+                        if old_apis_id is not None:
+                            old_apis = self._id_to_apis.get(old_apis_id)
+                            if old_apis is not None:
+                                old_apis.interpreter_ids.discard(interpreter_id)
+                        self._interpreter_id_to_apis_id[interpreter_id] = apis_id
+
+                    apis = self._id_to_apis.get(apis_id)
+                    if apis is None:
+                        apis = self._create_apis(apis_id)
+                    apis.interpreter_ids.add(interpreter_id)
+                    apis.set_interpreter_info(interpreter_info)
+                    self._mark_used(apis_id, apis)
                     return apis
 
-        return self._get_default_apis()
+        apis = self._get_default_apis()
+        self._mark_used(DEFAULT_API_ID, apis)
+        return apis
+
+    def _get_max_api_processes(self) -> int:
+        from robotframework_ls.impl.robot_lsp_constants import (
+            OPTION_ROBOT_MAX_API_PROCESSES,
+        )
+
+        config = self._config
+        if config is None:
+            return DEFAULT_MAX_API_PROCESSES
+        return config.get_setting(
+            OPTION_ROBOT_MAX_API_PROCESSES, int, DEFAULT_MAX_API_PROCESSES
+        )
+
+    def _mark_used(self, apis_id: str, apis: _RegularLintAndOthersApi) -> None:
+        apis.last_used = next(self._used_counter)
+        if apis.stopped:
+            apis.stopped = False
+
+        max_api_processes = self._get_max_api_processes()
+        if max_api_processes <= 0:
+            return
+
+        # The processes of the apis being used are started on demand, so,
+        # consider that all of those will be running.
+        running = 3
+        candidates = []
+        for other_id, other_apis in self._id_to_apis.items():
+            if other_apis is apis:
+                continue
+            count = other_apis.count_running()
+            running += count
+            if other_id != DEFAULT_API_ID and (count or not other_apis.interpreter_ids):
+                candidates.append((other_id, other_apis))
+
+        if running <= max_api_processes:
+            return
+
+        # Idle apis (not referenced by any interpreter id) are stopped first,
+        # then the least recently used ones.
+        candidates.sort(
+            key=lambda tup: (bool(tup[1].interpreter_ids), tup[1].last_used)
+        )
+        for other_id, other_apis in candidates:
+            if running <= max_api_processes and other_apis.interpreter_ids:
+                break
+            running -= other_apis.count_running()
+            log.info(
+                "Stopping api processes for: %s (limit of api processes: %s).",
+                other_id,
+                max_api_processes,
+            )
+            other_apis.stop()
+            if not other_apis.interpreter_ids:
+                del self._id_to_apis[other_id]
 
     def forward(self, target: Tuple[str, ...], method_name: str, params: Any) -> None:
+        from robocorp_ls_core.jsonrpc.json_codec import RawJson
+
         self._check_in_main_thread()
+
+        # The same params are sent to multiple processes (so, serialize
+        # those only once).
+        params = RawJson.from_obj(params)
+
         apis: _RegularLintAndOthersApi
         for apis in self._id_to_apis.values():
+            if apis.stopped:
+                # The documents/settings are sent again when restarted.
+                continue
+
             # Note: always forward async to all APIs (all the messages are sent
             # from the current main thread, so, the messages ordering is still
             # guaranteed to be correct).
@@ -161,7 +161,10 @@ setup(
     # "scripts" keyword. Entry points provide cross-platform support and allow
     # pip to create the appropriate form of executable for the target platform.
     entry_points={
-        "console_scripts": ["robotframework_ls = robotframework_ls.__main__:main"],
+        "console_scripts": [
+            "robotframework_ls = robotframework_ls.__main__:main",
+            "robotframework_ls_lint = robotframework_ls.lint_workspace:main",
+        ],
         "jupyter_lsp_spec_v1": [
             "robotframework_ls = robotframework_ls.ext.jupyter_lsp:spec_v1"
         ],
@@ -271,6 +271,8 @@ class _DebuggerAPI(object):
         args: Optional[Iterable[str]] = None,
         env: Optional[dict] = None,
         make_suite: Optional[bool] = None,
+        parallel_workers: Optional[int] = None,
+        test_results_file: Optional[str] = None,
     ):
         """
         :param args:
@@ -306,6 +308,12 @@ class _DebuggerAPI(object):
         if make_suite is not None:
             launch_args.kwargs["makeSuite"] = make_suite
 
+        if parallel_workers is not None:
+            launch_args.kwargs["parallelWorkers"] = parallel_workers
+
+        if test_results_file is not None:
+            launch_args.kwargs["testResultsFile"] = test_results_file
+
         self.write(LaunchRequest(launch_args))
 
         if terminal == "external":
@@ -602,6 +602,104 @@ def test_debugger_core_stop_on_failure_in_import(
     assert code == 0
 
 
+def test_debugger_core_no_breakpoints_fast_path(
+    debugger_api, run_robot_cli, debugger_impl, monkeypatch
+) -> None:
+    from robotframework_debug_adapter import debugger_impl as debugger_impl_module
+    from robotframework_debug_adapter.debugger_impl import RobotBreakpoint
+
+    resolved = []
+    original = debugger_impl_module._resolve_step_source
+
+    def _resolve_step_source(source):
+        resolved.append(source)
+        return original(source)
+
+    monkeypatch.setattr(
+        debugger_impl_module, "_resolve_step_source", _resolve_step_source
+    )
+
+    target = debugger_api.get_dap_case_file("case4/case4.robot")
+    busy_wait = DummyBusyWait(debugger_impl)
+    debugger_impl.busy_wait = busy_wait
+
+    # Without breakpoints/step commands the sources are never resolved.
+    assert run_robot_cli(target) == 0
+    assert busy_wait.waited == 0
+    assert not resolved
+
+    line = debugger_api.get_line_index_with_content(
+        "My Equal Redefined   2   2", target
+    )
+    debugger_impl.set_breakpoints(target, RobotBreakpoint(line))
+    busy_wait.on_wait = [debugger_impl.step_continue]
+
+    assert run_robot_cli(target) == 0
+    assert busy_wait.waited == 1
+    assert resolved
+    assert [x.name for x in busy_wait.stack[0]] == [
+        "My Equal Redefined",
+        "TestCase: Can use resource keywords",
+        "TestSuite: Case4",
+    ]
+
+
+def test_debugger_core_breakpoints_compiled_per_source(
+    debugger_api, run_robot_cli, debugger_impl, monkeypatch
+) -> None:
+    from robotframework_debug_adapter import debugger_impl as debugger_impl_module
+    from robotframework_debug_adapter.debugger_impl import RobotBreakpoint
+
+    resolved = []
+    original = debugger_impl_module._resolve_step_source
+
+    def _resolve_step_source(source):
+        resolved.append(source)
+        return original(source)
+
+    monkeypatch.setattr(
+        debugger_impl_module, "_resolve_step_source", _resolve_step_source
+    )
+
+    compiles = []
+    original_compile = debugger_impl._compile_source_breakpoints
+
+    def _compile_source_breakpoints(source):
+        compiles.append(source)
+        return original_compile(source)
+
+    debugger_impl._compile_source_breakpoints = _compile_source_breakpoints
+
+    target = debugger_api.get_dap_case_file("case4/case4.robot")
+    line = debugger_api.get_line_index_with_content(
+        "My Equal Redefined   2   2", target
+    )
+    debugger_impl.set_breakpoints(target, RobotBreakpoint(line))
+
+    busy_wait = DummyBusyWait(debugger_impl)
+    debugger_impl.busy_wait = busy_wait
+    busy_wait.on_wait = [debugger_impl.step_continue]
+
+    assert run_robot_cli(target) == 0
+    assert busy_wait.waited == 1
+
+    # Each source is only compiled once (regardless of the number of steps).
+    compiled = set(debugger_impl._source_to_line_to_breakpoint)
+    assert compiled
+    assert sorted(compiled) == sorted(compiles)
+    assert set(resolved) == compiled
+
+    # Removing the breakpoints goes back to the fast path.
+    del resolved[:]
+    debugger_impl.set_breakpoints(target, [])
+    assert not debugger_impl._filename_to_line_to_breakpoint
+    assert not debugger_impl._source_to_line_to_breakpoint
+
+    assert run_robot_cli(target) == 0
+    assert busy_wait.waited == 1
+    assert not resolved
+
+
 def test_debugger_core_step_next(debugger_api, run_robot_cli, debugger_impl) -> None:
     from robotframework_debug_adapter.debugger_impl import RobotBreakpoint
 
@@ -155,3 +155,235 @@ def test_events_listener_ignore(debugger_api: _DebuggerAPI):
     assert debugger_api.read(EndSuiteEvent)
 
     debugger_api.read(TerminatedEvent)
+
+
+def test_events_listener_min_log_level(debugger_api: _DebuggerAPI):
+    from robocorp_ls_core.debug_adapter_core.dap.dap_schema import StartSuiteEvent
+    from robocorp_ls_core.debug_adapter_core.dap.dap_schema import StartTestEvent
+    from robocorp_ls_core.debug_adapter_core.dap.dap_schema import EndTestEvent
+    from robocorp_ls_core.debug_adapter_core.dap.dap_schema import EndSuiteEvent
+    from robocorp_ls_core.debug_adapter_core.dap.dap_schema import TerminatedEvent
+
+    target = debugger_api.get_dap_case_file("case_log_no_console.robot")
+    debugger_api.target = target
+
+    debugger_api.launch(
+        target,
+        debug=False,
+        args=[
+            "--listener=robotframework_debug_adapter.events_listener.EventsListenerV2"
+        ],
+        env={"RFLS_LOG_MESSAGE_MIN_LEVEL": "WARN"},
+    )
+
+    debugger_api.configuration_done()
+
+    assert debugger_api.read(StartSuiteEvent)
+    assert debugger_api.read(StartTestEvent)
+
+    # The INFO message is not sent (the EndTestEvent must be the next event).
+    end_test_body = debugger_api.read(EndTestEvent).body
+    assert end_test_body.status == "PASS"
+
+    assert debugger_api.read(EndSuiteEvent)
+
+    debugger_api.read(TerminatedEvent)
+
+
+def _log_message_event(message, level="INFO", source="a.robot", test_name="Test"):
+    from robocorp_ls_core.debug_adapter_core.dap.dap_schema import LogMessageEvent
+    from robocorp_ls_core.debug_adapter_core.dap.dap_schema import (
+        LogMessageEventBody,
+    )
+
+    return LogMessageEvent(
+        LogMessageEventBody(
+            message=message, source=source, lineno=1, level=level, testName=test_name
+        )
+    )
+
+
+def _serialize(queue):
+    import json
+
+    ret = []
+    for msg in queue:
+        as_json = msg.to_json()
+        if isinstance(as_json, bytes):
+            as_json = as_json.decode("utf-8")
+        ret.append(json.loads(as_json))
+    return ret
+
+
+def test_log_messages_batcher():
+    from robocorp_ls_core.debug_adapter_core.dap.dap_schema import TerminatedEvent
+    from robotframework_debug_adapter._log_messages_batcher import (
+        LogMessagesBatcher,
+    )
+
+    queue: list = []
+    batcher = LogMessagesBatcher(queue.append)
+    batcher.write_message(_log_message_event("m1"))
+    batcher.write_message(_log_message_event("m2"))
+    batcher.write_message(_log_message_event("m3", level="WARN"))
+    batcher.write_message(TerminatedEvent())
+    batcher.write_message(_log_message_event("m4", level="WARN"))
+
+    msgs = _serialize(queue)
+    assert [(m["event"], m["body"].get("message")) for m in msgs] == [
+        ("logMessage", "m1\nm2"),
+        ("logMessage", "m3"),
+        ("terminated", None),
+        ("logMessage", "m4"),
+    ]
+    assert msgs[0]["body"]["level"] == "INFO"
+    assert msgs[0]["body"]["source"] == "a.robot"
+    assert msgs[0]["body"]["testName"] == "Test"
+
+    # Once serialized, new messages go to a new batch.
+    del queue[:]
+    batcher.write_message(_log_message_event("m5", level="WARN"))
+    assert [m["body"]["message"] for m in _serialize(queue)] == ["m5"]
+    assert batcher._pending_chars == 0
+
+
+def test_log_messages_batcher_congested():
+    from robocorp_ls_core.debug_adapter_core.dap.dap_schema import TerminatedEvent
+    from robotframework_debug_adapter._log_messages_batcher import (
+        LogMessagesBatcher,
+    )
+
+    queue: list = []
+    batcher = LogMessagesBatcher(queue.append, max_batch_chars=4, max_pending_chars=8)
+    for i in range(10):
+        batcher.write_message(_log_message_event("msg%s" % (i,)))
+    batcher.write_message(_log_message_event("failed", level="FAIL"))
+    batcher.write_message(TerminatedEvent())
+
+    msgs = _serialize(queue)
+    assert [(m["event"], m["body"].get("message")) for m in msgs] == [
+        ("logMessage", "msg0"),
+        ("logMessage", "msg1"),
+        (
+            "logMessage",
+            "8 log message(s) not shown (the debug channel was congested).",
+        ),
+        ("logMessage", "failed"),
+        ("terminated", None),
+    ]
+    assert batcher._pending_chars == 0
+
+
+def test_events_listener_test_results_file(debugger_api: _DebuggerAPI, tmpdir):
+    import json
+    from robocorp_ls_core.debug_adapter_core.dap.dap_schema import StartSuiteEvent
+    from robocorp_ls_core.debug_adapter_core.dap.dap_schema import EndSuiteEvent
+    from robocorp_ls_core.debug_adapter_core.dap.dap_schema import TerminatedEvent
+    from robocorp_ls_core.debug_adapter_core.dap.dap_schema import LogMessageEvent
+    from robocorp_ls_core.debug_adapter_core.dap.dap_schema import (
+        TestProgressEvent,
+        TestFailureDetailsRequest,
+        TestFailureDetailsArguments,
+    )
+
+    target = debugger_api.get_dap_case_file("case_failure.robot")
+    debugger_api.target = target
+    results_file = str(tmpdir.join("results.ndjson"))
+
+    debugger_api.launch(
+        target,
+        debug=False,
+        args=[
+            "--listener=robotframework_debug_adapter.events_listener.EventsListenerV2"
+        ],
+        test_results_file=results_file,
+    )
+
+    debugger_api.configuration_done()
+
+    assert debugger_api.read(StartSuiteEvent)
+    assert debugger_api.read(LogMessageEvent).body.level == "FAIL"
+
+    # No startTest/endTest events: just the aggregated progress.
+    progress_body = debugger_api.read(TestProgressEvent).body
+    assert (progress_body.passed, progress_body.failed, progress_body.skipped) == (
+        0,
+        1,
+        0,
+    )
+    assert progress_body.resultsFile == results_file
+
+    assert debugger_api.read(EndSuiteEvent)
+    debugger_api.read(TerminatedEvent)
+
+    with open(results_file, "rb") as stream:
+        contents = stream.read(progress_body.resultsOffset)
+    records = [json.loads(line) for line in contents.splitlines()]
+    assert len(records) == 2
+    failure_record, test_record = records
+    assert test_record["name"] == "Check failure"
+    assert test_record["status"] == "FAIL"
+    assert test_record["source"].endswith("case_failure.robot")
+    assert test_record["failure"] == failure_record["failure"]
+    assert "No keyword with name" in failure_record["message"]
+
+    # The failure details are only provided on request.
+    request = debugger_api.write(
+        TestFailureDetailsRequest(
+            TestFailureDetailsArguments(failure=test_record["failure"])
+        )
+    )
+    response = debugger_api.wait_for_response(request)
+    assert response.success
+    assert "No keyword with name" in response.body.message
+    assert len(response.body.failed_keywords) == 1
+
+    request = debugger_api.write(
+        TestFailureDetailsRequest(TestFailureDetailsArguments(failure="unknown"))
+    )
+    response = debugger_api.wait_for_response(request)
+    assert not response.success
+
+
+def test_test_results_stream(tmpdir):
+    from robotframework_debug_adapter.test_results_stream import (
+        TestResultsWriter,
+        TestResultsReader,
+    )
+
+    filename = str(tmpdir.join("results.ndjson"))
+    writer = TestResultsWriter(filename)
+    reader = TestResultsReader(filename)
+
+    failed_keywords = [{"name": "Fail", "source": "a.robot", "lineno": 3}]
+    writer.add_test("t1", "a.robot", "FAIL", 10, "Failed!", failed_keywords)
+    writer.add_test("t2", "a.robot", "PASS", 10, "", None)
+    writer.add_test("t3", "a.robot", "FAIL", 10, "Failed!", failed_keywords)
+
+    progress_body = writer.create_progress_event().body
+    assert (progress_body.passed, progress_body.failed) == (1, 2)
+
+    # Nothing changed: no new progress.
+    assert writer.create_progress_event(force=True) is None
+
+    with open(filename, "r") as stream:
+        lines = stream.read().splitlines()
+    # The failure details are written only once.
+    assert len(lines) == 4
+
+    writer.add_test("t4", "a.robot", "FAIL", 10, "Other failure", None)
+    # Throttled (unless forced).
+    assert writer.create_progress_event() is None
+    assert writer.create_progress_event(force=True).body.failed == 3
+
+    import json
+
+    failure_ids = [json.loads(line).get("failure") for line in lines]
+    details = reader.get_failure_details(failure_ids[0])
+    assert details == {"message": "Failed!", "failed_keywords": failed_keywords}
+
+    with open(filename, "r") as stream:
+        last = json.loads(stream.read().splitlines()[-1])
+    assert reader.get_failure_details(last["failure"])["message"] == "Other failure"
+    assert reader.get_failure_details("unknown") is None
+    writer.close()
@@ -88,3 +88,25 @@ def test_filtering_with_prerun_modifier_tests_2(
 
     found = list(collect_suite_test_ids(suite, target))
     assert len(found) == 2
+
+
+def test_filtering_with_prerun_modifier_shard(dap_resources_dir):
+    from robot.api import TestSuite
+    from robotframework_debug_adapter.prerun_modifiers import FilteringTestsSuiteVisitor
+
+    target = os.path.join(dap_resources_dir, "check_sub_init2")
+    all_tests = list(collect_suite_test_ids(TestSuite.from_file_system(target), target))
+
+    found_in_shards = []
+    for index in range(2):
+        suite = TestSuite.from_file_system(target)
+        visitor = FilteringTestsSuiteVisitor(
+            {"include": [[target, "*"]], "exclude": [], "shard": [index, 2]}
+        )
+        visitor.visit_suite(suite)
+        found = list(collect_suite_test_ids(suite, target))
+        assert found
+        found_in_shards.extend(found)
+
+    # Each test is in exactly one shard (and the order is kept).
+    assert found_in_shards == all_tests
@@ -0,0 +1,142 @@
+import os
+
+from robotframework_debug_adapter_tests.fixtures import _DebuggerAPI
+
+
+def test_parallel_runner(debugger_api: _DebuggerAPI, tmpdir):
+    from robot.api import ExecutionResult  # type: ignore
+    from robotframework_debug_adapter_tests.test_filtering import collect_suite_tests
+    from robocorp_ls_core.debug_adapter_core.dap.dap_schema import (
+        StartSuiteEvent,
+        EndTestEvent,
+        TerminatedEvent,
+    )
+
+    target = debugger_api.get_dap_case_file("check_sub_init2")
+    debugger_api.target = target
+    outputdir = str(tmpdir.join("out"))
+
+    debugger_api.launch(
+        target,
+        debug=False,
+        args=[
+            "--listener=robotframework_debug_adapter.events_listener.EventsListenerV2",
+            "--outputdir",
+            outputdir,
+        ],
+        parallel_workers=2,
+    )
+    debugger_api.configuration_done()
+
+    # The events from both workers are received in the same session.
+    root_suites = []
+    ended_tests = []
+    while True:
+        msg = debugger_api.read()
+        if isinstance(msg, StartSuiteEvent) and msg.body.source == target:
+            root_suites.append(msg.body.tests)
+        elif isinstance(msg, EndTestEvent):
+            ended_tests.append(msg.body.name)
+        elif isinstance(msg, TerminatedEvent):
+            break
+
+    assert len(root_suites) == 2
+    assert sorted(ended_tests) == ["Test case 1", "Test case 1", "Test case 2"]
+
+    # The outputs of the workers are merged.
+    result = ExecutionResult(os.path.join(outputdir, "output.xml"))
+    found = sorted(t.name for t in collect_suite_tests(result.suite))
+    assert found == ["Test case 1", "Test case 1", "Test case 2"]
+    assert os.path.exists(os.path.join(outputdir, "log.html"))
+    assert os.path.exists(os.path.join(outputdir, "report.html"))
+
+
+def test_parallel_runner_test_results_file(debugger_api: _DebuggerAPI, tmpdir):
+    import json
+    from robocorp_ls_core.debug_adapter_core.dap.dap_schema import (
+        StartTestEvent,
+        EndTestEvent,
+        TestProgressEvent,
+        TerminatedEvent,
+    )
+
+    target = debugger_api.get_dap_case_file("check_sub_init2")
+    debugger_api.target = target
+    results_file = str(tmpdir.join("results.ndjson"))
+
+    debugger_api.launch(
+        target,
+        debug=False,
+        args=[
+            "--listener=robotframework_debug_adapter.events_listener.EventsListenerV2",
+            "--outputdir",
+            str(tmpdir.join("out")),
+        ],
+        env={"RFLS_TEST_RESULTS_FILE": results_file},
+        parallel_workers=2,
+    )
+    debugger_api.configuration_done()
+
+    # The results from all the workers are written to the same file.
+    progress_body = None
+    while True:
+        msg = debugger_api.read()
+        assert not isinstance(msg, (StartTestEvent, EndTestEvent))
+        if isinstance(msg, TestProgressEvent):
+            progress_body = msg.body
+        elif isinstance(msg, TerminatedEvent):
+            break
+
+    assert progress_body is not None
+    assert (progress_body.passed, progress_body.failed, progress_body.skipped) == (
+        1,
+        2,
+        0,
+    )
+    assert progress_body.resultsFile == results_file
+
+    with open(results_file, "rb") as stream:
+        contents = stream.read(progress_body.resultsOffset)
+    records = [json.loads(line) for line in contents.splitlines()]
+    assert len([r for r in records if "status" in r]) == 3
+
+
+def test_parallel_runner_failed_worker(dap_resources_dir, tmpdir, monkeypatch, capsys):
+    import io
+    import robot
+    from robot.api import ExecutionResult  # type: ignore
+    from robotframework_debug_adapter import parallel_runner
+    from robotframework_debug_adapter_tests.test_filtering import collect_suite_tests
+
+    target = os.path.join(dap_resources_dir, "check_sub_init2")
+    outputdir = str(tmpdir.join("out"))
+
+    def run_workers(
+        run_robot_py, options_args, datasources_args, output_files, forwarder
+    ):
+        # The first worker runs all the tests and the second one fails before
+        # creating its output.
+        returncode = robot.run(
+            *datasources_args,
+            output=output_files[0],
+            log="NONE",
+            report="NONE",
+            stdout=io.StringIO(),
+            stderr=io.StringIO(),
+        )
+        assert returncode == 2
+        return [returncode, 252]
+
+    monkeypatch.setattr(parallel_runner, "_run_workers", run_workers)
+    returncode = parallel_runner.run_parallel(
+        ["--outputdir", outputdir, target], 2, lambda msg: None
+    )
+    assert returncode == 252
+    assert "Robot worker 1 failed (exit code: 252, no output generated)." in (
+        capsys.readouterr().err
+    )
+
+    # The output of the worker which finished is still available.
+    result = ExecutionResult(os.path.join(outputdir, "output.xml"))
+    found = sorted(t.name for t in collect_suite_tests(result.suite))
+    assert found == ["Test case 1", "Test case 1", "Test case 2"]
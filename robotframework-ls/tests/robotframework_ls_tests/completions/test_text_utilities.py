@@ -48,6 +48,39 @@ def test_matches_robot_keyword():
     )
 
 
+def test_embedded_args_matcher():
+    from robotframework_ls.impl.embedded_args_matcher import EmbeddedArgsMatcher
+    from robotframework_ls.impl.text_utilities import normalize_robot_name
+
+    matcher = EmbeddedArgsMatcher()
+    for name in [
+        'I execute "${cmd:[^"]+}"',
+        "${user} logs in",
+        "${user} logs in with ${password}",
+        "The ${animal} eats",
+        "rar{a",
+    ]:
+        matcher.add(normalize_robot_name(name), name)
+
+    def check(call_text):
+        return list(matcher.iter_matches(normalize_robot_name(call_text)))
+
+    assert check('I execute "ls"') == ['I execute "${cmd:[^"]+}"']
+    assert check('I execute "ls" f') == []
+    assert check("John logs in") == ["${user} logs in"]
+    assert check("John logs in with 123") == ["${user} logs in with ${password}"]
+    assert check("The dog eats") == ["The ${animal} eats"]
+    assert check("rar{a") == ["rar{a"]
+    assert check("Unknown") == []
+
+    # Adding it again replaces the value but keeps the position.
+    matcher.add(normalize_robot_name("${user} logs in"), "replaced")
+    matcher.add(normalize_robot_name("${a} in"), "last")
+    assert check("John logs in") == ["replaced", "last"]
+    assert matcher.get_first_match(normalize_robot_name("John logs in")) == "replaced"
+    assert matcher.get_first_match(normalize_robot_name("Unknown")) is None
+
+
 def test_iter_dotted_names():
     from robotframework_ls.impl.text_utilities import iter_dotted_names
 
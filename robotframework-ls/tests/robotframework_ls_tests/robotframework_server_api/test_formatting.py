@@ -31,3 +31,109 @@ Check
     data_regression.check(
         [x.to_dict() for x in text_edits], basename="test_formatting_basic_text_edits"
     )
+
+
+@pytest.mark.parametrize(
+    "contents, new_contents",
+    [
+        ("", "a\nb"),
+        ("a\nb", ""),
+        ("a\nb\n", "a\nb"),
+        ("a\nb", "a\nb\n"),
+        ("a\r\nb\r\nc", "a\nb  \r\nc\r\nd\r\n"),
+        ("a\n\nb\n\nc\n", "\nc\n\nb\n\na\n"),
+    ],
+)
+def test_create_text_edit_from_diff(contents, new_contents):
+    from robotframework_ls.impl.formatting import create_text_edit_from_diff
+    from robocorp_ls_core.workspace import Document
+
+    text_edits = create_text_edit_from_diff(contents, new_contents)
+    doc = Document("", contents)
+    doc.apply_text_edits([x.to_dict() for x in text_edits])
+    assert doc.source == new_contents
+
+
+def test_create_text_edit_from_diff_big_suite():
+    from robotframework_ls.impl.formatting import create_text_edit_from_diff
+    from robocorp_ls_core.workspace import Document
+
+    contents = ["*** Test Cases ***\n"]
+    new_contents = ["*** Test Cases ***\n"]
+    for i in range(1000):
+        contents.append(
+            "Test %s\n    Log  Message %s\n    Should Be Equal  ${x}  %s\n\n"
+            % (i, i, i)
+        )
+        new_contents.append(
+            "Test %s\n    Log    Message %s\n    Should Be Equal    ${x}    %s\n\n"
+            % (i, i, i)
+        )
+    contents = "".join(contents)
+    new_contents = "".join(new_contents)
+
+    text_edits = create_text_edit_from_diff(contents, new_contents)
+    # Only the separators changed.
+    assert len(text_edits) == 3000
+    assert set(x.newText for x in text_edits) == {"  "}
+
+    doc = Document("", contents)
+    doc.apply_text_edits([x.to_dict() for x in text_edits])
+    assert doc.source == new_contents
+
+
+def test_create_range_text_edits():
+    try:
+        from robot.tidy import Tidy
+    except ImportError:
+        pytest.skip("robot.tidy is no longer available.")
+
+    from robotframework_ls.impl.formatting import (
+        robot_source_format,
+        create_range_text_edits,
+    )
+    from robocorp_ls_core.workspace import Document
+    from robot.api import get_model
+
+    contents = """***Settings***
+Library  Collections
+
+***Test Case***
+Test 1
+    Log  1
+
+Test 2
+    Log  2
+***Keywords***
+My Keyword
+    Log  3"""
+
+    def check(start_line, end_line, expected):
+        text_edits = create_range_text_edits(
+            get_model(contents),
+            contents.splitlines(True),
+            start_line,
+            end_line,
+            robot_source_format,
+        )
+        doc = Document("", contents)
+        doc.apply_text_edits([x.to_dict() for x in text_edits])
+        assert doc.source == expected
+
+    # Only "Test 1" is formatted.
+    check(5, 5, contents.replace("Log  1", "Log    1"))
+
+    # A section header (not in any block): nothing is formatted.
+    check(3, 3, contents)
+
+    # "Test 2" and "My Keyword" are formatted (the section headers are kept).
+    check(
+        7,
+        10,
+        contents.replace("Log  2", "Log    2").replace("Log  3", "Log    3"),
+    )
+
+    # The settings section.
+    check(
+        0, 1, contents.replace("Library  Collections", "Library           Collections")
+    )
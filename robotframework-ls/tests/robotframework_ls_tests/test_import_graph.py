@@ -0,0 +1,64 @@
+def test_import_graph_resolved_scope_invalidation(workspace, libspec_manager):
+    from robotframework_ls.impl.completion_context import CompletionContext
+    from robotframework_ls.impl.import_graph import get_resolved_scope
+    from robotframework_ls.impl.collect_keywords import (
+        collect_keyword_name_to_keyword_found,
+    )
+
+    workspace.set_root("case4", libspec_manager=libspec_manager)
+    doc = workspace.get_doc("case4.robot")
+    other_doc = workspace.put_doc(
+        "other.robot",
+        """*** Settings ***
+Resource    case4resource2.robot
+Resource    not_there.robot
+""",
+    )
+
+    def get_scope(doc):
+        return get_resolved_scope(CompletionContext(doc, workspace=workspace.ws))
+
+    scope = get_scope(doc)
+    other_scope = get_scope(other_doc)
+    assert "Yet Another Equal Redefined" in scope.keyword_name_to_keyword_found
+    assert "Should Be Equal" in scope.keyword_name_to_keyword_found
+
+    # Nothing changed: the same scope is reused.
+    assert get_scope(doc) is scope
+    assert collect_keyword_name_to_keyword_found(
+        CompletionContext(doc, workspace=workspace.ws)
+    ) is (scope.keyword_name_to_keyword_found)
+
+    # Changing a document in the import closure of case4.robot (but not in
+    # the one of other.robot) only invalidates the scope of case4.robot.
+    workspace.put_doc(
+        "case4resource3.robot",
+        """*** Keywords ***
+New Keyword In Resource 3
+    No Operation
+""",
+    )
+    new_scope = get_scope(doc)
+    assert new_scope is not scope
+    assert "New Keyword In Resource 3" in new_scope.keyword_name_to_keyword_found
+    assert "Yet Another Equal Redefined" not in new_scope.keyword_name_to_keyword_found
+    assert get_scope(other_doc) is other_scope
+
+    # The node of case4resource2.robot is shared (it was not changed).
+    assert [
+        node
+        for node in new_scope.nodes
+        if node.doc.uri.endswith("case4resource2.robot")
+    ] == [node for node in scope.nodes if node.doc.uri.endswith("case4resource2.robot")]
+
+    # Creating a file which was an unresolved resource invalidates the scope.
+    workspace.put_doc(
+        "not_there.robot",
+        """*** Keywords ***
+Now It Is There
+    No Operation
+""",
+    )
+    new_other_scope = get_scope(other_doc)
+    assert new_other_scope is not other_scope
+    assert "Now It Is There" in new_other_scope.keyword_name_to_keyword_found
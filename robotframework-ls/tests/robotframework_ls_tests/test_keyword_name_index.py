@@ -0,0 +1,22 @@
+import pytest
+
+
+@pytest.mark.parametrize("names_count", [10, 500])
+def test_keyword_name_index(names_count):
+    import random
+    from robotframework_ls.impl.keyword_name_index import KeywordNameIndex
+    from robotframework_ls.impl.string_matcher import RobotStringMatcher
+
+    rand = random.Random(0)
+    words = ["Should", "Be", "Equal", "Log", "Run", "Keyword", "If", "Get", "my_kw"]
+    names = [
+        " ".join(rand.choice(words) for _ in range(rand.randint(1, 4)))
+        for _ in range(names_count)
+    ]
+    index = KeywordNameIndex(names, lambda name: name)
+    assert len(index) == names_count
+
+    for filter_text in ["", "s", "SH", "be eq", "run_keyword", "kwlog", "xyz", "q"]:
+        matcher = RobotStringMatcher(filter_text)
+        expected = [name for name in names if matcher.accepts_keyword_name(name)]
+        assert list(index.iter_matches(matcher.filter_text)) == expected
@@ -214,22 +214,24 @@ def my_keyword():
     except ImportError:
         pass
     else:
-        original = libspec_manager._subprocess_check_output
+        original = libspec_manager._run_libdoc
         # If docutils is installed, mock it (otherwise, just execute as usual).
+        # Note: _run_libdoc is mocked (and not the subprocess call) so that
+        # it also applies when libdoc is run in the libdoc worker pool.
 
-        def raise_error(cmdline, *args, **kwargs):
+        def raise_error(libdoc_args, cwd):
             from subprocess import CalledProcessError
 
-            if "--docformat" not in cmdline:
+            if "--docformat" not in libdoc_args:
                 raise CalledProcessError(
                     1,
-                    cmdline,
+                    libdoc_args,
                     b"reST format requires 'docutils' module to be installed",
                     b"",
                 )
-            return original(cmdline, *args, **kwargs)
+            return original(libdoc_args, cwd)
 
-        libspec_manager._subprocess_check_output = raise_error
+        libspec_manager._run_libdoc = raise_error
 
     uri = uris.from_fs_path(os.path.join(workspace_dir, "case.robot"))
     library_info: Optional[LibraryDoc] = libspec_manager.get_library_doc_or_error(
@@ -380,3 +382,212 @@ def test_libspec_manager_basic(workspace, libspec_manager):
 
     assert get_library_doc_or_error("case1_library", create=False).library_doc is None
     assert get_library_doc_or_error("case1_library").library_doc is not None
+
+
+def test_libdoc_worker_pool(tmpdir):
+    from robotframework_ls.impl.libdoc_worker_pool import LibdocWorkerPool
+
+    lib_dir = str(tmpdir.join("lib_dir"))
+    os.makedirs(lib_dir)
+    lib_filename = os.path.join(lib_dir, "worker_pool_lib.py")
+    target_libspec = os.path.join(lib_dir, "worker_pool_lib.libspec")
+    libdoc_args = ["--format", "XML", "-P", lib_dir, "worker_pool_lib", target_libspec]
+
+    pool = LibdocWorkerPool(max_workers=1)
+    try:
+        with open(lib_filename, "w") as stream:
+            stream.write("def keyword_one():\n    print('output on import')\n")
+        returncode, _output = pool.run_libdoc(libdoc_args, lib_dir)
+        assert returncode == 0
+        with open(target_libspec, "r") as stream:
+            assert "Keyword One" in stream.read()
+
+        # The same worker is reused but the library must be imported again.
+        with open(lib_filename, "w") as stream:
+            stream.write("def keyword_two():\n    pass\n")
+        returncode, _output = pool.run_libdoc(libdoc_args, lib_dir)
+        assert returncode == 0
+        with open(target_libspec, "r") as stream:
+            contents = stream.read()
+        assert "Keyword Two" in contents
+        assert "Keyword One" not in contents
+
+        returncode, output = pool.run_libdoc(
+            ["--format", "XML", "worker_pool_lib_not_there", target_libspec], None
+        )
+        assert returncode != 0
+        assert "worker_pool_lib_not_there" in output
+    finally:
+        pool.dispose()
+
+
+def test_libdoc_worker_pool_installed_lib_changed(tmpdir):
+    from robotframework_ls.impl.libdoc_worker_pool import LibdocWorkerPool
+
+    # Modules from installed packages are kept loaded in the worker, but if
+    # those change (i.e.: the package was upgraded), a new worker is used.
+    lib_dir = str(tmpdir.join("site-packages"))
+    os.makedirs(lib_dir)
+    lib_filename = os.path.join(lib_dir, "installed_lib.py")
+    target_libspec = str(tmpdir.join("installed_lib.libspec"))
+    libdoc_args = ["--format", "XML", "-P", lib_dir, "installed_lib", target_libspec]
+
+    pool = LibdocWorkerPool(max_workers=1)
+    try:
+        with open(lib_filename, "w") as stream:
+            stream.write("def keyword_one():\n    pass\n")
+        returncode, _output = pool.run_libdoc(libdoc_args, lib_dir)
+        assert returncode == 0
+        with open(target_libspec, "r") as stream:
+            assert "Keyword One" in stream.read()
+
+        with open(lib_filename, "w") as stream:
+            stream.write("def keyword_two():\n    pass\n")
+        mtime = os.path.getmtime(lib_filename) + 10
+        os.utime(lib_filename, (mtime, mtime))
+
+        returncode, _output = pool.run_libdoc(libdoc_args, lib_dir)
+        assert returncode == 0
+        with open(target_libspec, "r") as stream:
+            contents = stream.read()
+        assert "Keyword Two" in contents
+        assert "Keyword One" not in contents
+        assert pool.count_workers() == 1
+    finally:
+        pool.dispose()
+
+
+def test_libdoc_worker_pool_idle_workers(tmpdir):
+    from robocorp_ls_core.basic import wait_for_condition
+    from robotframework_ls.impl.libdoc_worker_pool import LibdocWorkerPool
+
+    assert LibdocWorkerPool().max_workers <= 2
+
+    pool = LibdocWorkerPool(max_workers=1, idle_timeout=0.5)
+    try:
+        returncode, _output = pool.run_libdoc(
+            ["--format", "XML", "BuiltIn", str(tmpdir.join("BuiltIn.libspec"))], None
+        )
+        assert returncode == 0
+        assert pool.count_workers() == 1
+        wait_for_condition(lambda: pool.count_workers() == 0)
+    finally:
+        pool.dispose()
+
+
+def test_libdoc_worker_module_kept(tmpdir):
+    import importlib.machinery
+    import json
+    import sysconfig
+    import types
+    import pytest
+    from robotframework_ls.impl._libdoc_worker import _is_module_kept
+
+    kept_dirs = (os.path.normcase(os.path.abspath(sysconfig.get_paths()["stdlib"])),)
+
+    def create_module(name, filename):
+        module = types.ModuleType(name)
+        module.__file__ = str(tmpdir.join(filename))
+        return module
+
+    assert _is_module_kept("json", json, kept_dirs)
+    assert _is_module_kept("pytest", pytest, kept_dirs)
+    # Extension modules can't be imported again.
+    extension_filename = "my_ext" + importlib.machinery.EXTENSION_SUFFIXES[0]
+    assert _is_module_kept(
+        "my_ext", create_module("my_ext", extension_filename), kept_dirs
+    )
+
+    # Only the library modules are removed.
+    assert not _is_module_kept(
+        "my_lib", create_module("my_lib", "my_lib.py"), kept_dirs
+    )
+
+
+def test_libspec_pickle_cache(libspec_manager, tmpdir):
+    import shutil
+    from robotframework_ls.impl.libspec_manager import _load_library_doc_and_mtime
+    from robotframework_ls.impl.libspec_pickle_cache import get_pickle_cache_filename
+    from robotframework_ls.impl.robot_specbuilder import SpecDocBuilder
+
+    # Work on a copy (the mtime of the libspec is changed below).
+    spec_filename = str(tmpdir.join("BuiltIn.libspec"))
+    shutil.copyfile(
+        os.path.join(
+            libspec_manager.get_internal_builtins_libspec_dir(), "BuiltIn.libspec"
+        ),
+        spec_filename,
+    )
+    pickle_filename = get_pickle_cache_filename(libspec_manager, spec_filename)
+    if os.path.exists(pickle_filename):
+        os.remove(pickle_filename)
+
+    libdoc, mtime = _load_library_doc_and_mtime(libspec_manager, spec_filename)
+    assert os.path.exists(pickle_filename)
+
+    from_pickle, mtime2 = _load_library_doc_and_mtime(libspec_manager, spec_filename)
+    assert mtime == mtime2
+    assert from_pickle is not libdoc
+
+    # Big docs are only loaded when requested.
+    keyword = from_pickle.keywords[0]
+    assert len(libdoc.keywords[0].doc) > 80
+    assert not isinstance(keyword._doc, str)
+    assert keyword.doc == libdoc.keywords[0].doc
+    assert isinstance(keyword._doc, str)
+
+    assert from_pickle.to_dictionary() == libdoc.to_dictionary()
+    for keyword, original_keyword in zip(from_pickle.keywords, libdoc.keywords):
+        assert keyword.libdoc is from_pickle
+        assert keyword.source == original_keyword.source
+
+    # Changing the mtime of the libspec invalidates the pickled version.
+    with open(pickle_filename, "rb") as stream:
+        pickled_contents = stream.read()
+    os.utime(spec_filename, (mtime + 10, mtime + 10))
+    libdoc, _mtime = _load_library_doc_and_mtime(libspec_manager, spec_filename)
+    with open(pickle_filename, "rb") as stream:
+        assert stream.read() != pickled_contents
+
+    builder = SpecDocBuilder()
+    assert libdoc.to_dictionary()["keywords"] == (
+        builder.build(spec_filename).to_dictionary()["keywords"]
+    )
+
+
+def test_libspec_pickle_cache_rewritten(libspec_manager, tmpdir):
+    import shutil
+    from robotframework_ls.impl.libspec_manager import _load_library_doc_and_mtime
+    from robotframework_ls.impl.libspec_pickle_cache import dump_pickled_library_doc
+    from robotframework_ls.impl.robot_specbuilder import SpecDocBuilder
+
+    spec_filename = str(tmpdir.join("BuiltIn.libspec"))
+    shutil.copyfile(
+        os.path.join(
+            libspec_manager.get_internal_builtins_libspec_dir(), "BuiltIn.libspec"
+        ),
+        spec_filename,
+    )
+    libdoc, mtime = _load_library_doc_and_mtime(libspec_manager, spec_filename)
+    from_pickle, _mtime = _load_library_doc_and_mtime(libspec_manager, spec_filename)
+    keyword1, keyword2 = from_pickle.keywords[:2]
+    assert not isinstance(keyword1._doc, str)
+    assert not isinstance(keyword2._doc, str)
+
+    # Rewrite the pickle (with other docs and the keywords in another order)
+    # while the docs from the previous version weren't loaded yet.
+    new_libdoc = SpecDocBuilder().build(spec_filename)
+    new_libdoc.keywords.reverse()
+    for keyword in new_libdoc.keywords:
+        keyword.doc = f"New doc for {keyword.name}: {keyword.doc}"
+    new_libdoc.keywords = [
+        keyword for keyword in new_libdoc.keywords if keyword.name != keyword2.name
+    ]
+    dump_pickled_library_doc(libspec_manager, spec_filename, mtime + 10, new_libdoc)
+
+    assert keyword1.doc == f"New doc for {keyword1.name}: {libdoc.keywords[0].doc}"
+    # Not available in the new version.
+    assert keyword2.doc == ""
+    assert from_pickle.keywords[2].doc.startswith(
+        f"New doc for {from_pickle.keywords[2].name}: "
+    )
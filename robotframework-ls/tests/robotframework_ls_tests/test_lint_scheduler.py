@@ -0,0 +1,55 @@
+import threading
+
+
+def test_lint_scheduler_coalesce_and_priority():
+    from robotframework_ls.lint_scheduler import (
+        LintScheduler,
+        PRIORITY_ACTIVE,
+        PRIORITY_BACKGROUND,
+    )
+    from robocorp_ls_core.basic import wait_for_condition
+
+    ran = []
+    running = []
+    max_running = []
+    lock = threading.Lock()
+    release_event = threading.Event()
+
+    def get_priority(key):
+        return PRIORITY_ACTIVE if key == "active" else PRIORITY_BACKGROUND
+
+    def create_lint(key, value):
+        def lint():
+            with lock:
+                running.append(key)
+                max_running.append(len(running))
+            release_event.wait(5)
+            with lock:
+                running.remove(key)
+                ran.append((key, value))
+
+        return lint
+
+    scheduler = LintScheduler(max_workers=1, get_priority=get_priority)
+    try:
+        # The first one blocks the only worker available.
+        scheduler.schedule("blocker", create_lint("blocker", 0), 0)
+        wait_for_condition(lambda: running == ["blocker"])
+
+        # Scheduling for the same key replaces the previous one.
+        for i in range(5):
+            scheduler.schedule("background", create_lint("background", i), 0)
+        scheduler.schedule("active", create_lint("active", 0), 0)
+        assert scheduler.count_pending() == 2
+
+        release_event.set()
+        wait_for_condition(lambda: len(ran) == 3)
+        assert ran == [("blocker", 0), ("active", 0), ("background", 4)]
+        assert max(max_running) == 1
+
+        # A cancelled lint doesn't run.
+        scheduler.schedule("cancelled", create_lint("cancelled", 0), 0.3)
+        scheduler.cancel("cancelled")
+        assert scheduler.count_pending() == 0
+    finally:
+        scheduler.dispose()
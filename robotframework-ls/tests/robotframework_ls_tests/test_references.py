@@ -37,6 +37,38 @@ def test_references_basic(workspace, libspec_manager, data_regression):
     check_data_regression(result, data_regression)
 
 
+def test_references_index_updated_on_change(workspace, libspec_manager):
+    from robotframework_ls.impl.completion_context import CompletionContext
+    from robotframework_ls.impl.references import references
+
+    workspace.set_root(
+        "case_inner_keywords", libspec_manager=libspec_manager, index_workspace=True
+    )
+
+    def count_references_in_case_inner():
+        doc = workspace.get_doc("case_root.robot")
+        line = doc.find_line_with_contents(
+            "    Should Be Equal     ${arg1}     ${arg2}"
+        )
+        completion_context = CompletionContext(
+            doc, workspace=workspace.ws, line=line, col=6
+        )
+        result = references(completion_context, include_declaration=False)
+        return len([x for x in result if x["uri"].endswith("/case_inner.robot")])
+
+    assert count_references_in_case_inner() == 1
+
+    inner_doc = workspace.get_doc("inner/case_inner.robot")
+    doc = workspace.put_doc(
+        "inner/case_inner.robot",
+        inner_doc.source + "\n    Should Be Equal    1    1\n",
+    )
+    assert count_references_in_case_inner() == 2
+
+    workspace.ws.remove_document(doc.uri)
+    assert count_references_in_case_inner() == 1
+
+
 def test_references_from_keyword_definition(
     workspace, libspec_manager, data_regression
 ):
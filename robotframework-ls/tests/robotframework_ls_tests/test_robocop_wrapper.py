@@ -0,0 +1,51 @@
+def test_robocop_runner_cache(tmpdir):
+    import os
+    from pathlib import Path
+    from robot.api import get_model
+    from robocorp_ls_core.robocop_wrapper import (
+        collect_robocop_diagnostics_batch,
+        get_robocop_runner,
+        clear_robocop_runners_cache,
+    )
+
+    clear_robocop_runners_cache()
+    root = Path(str(tmpdir))
+    os.makedirs(str(root / ".git"))
+    robocop_config = root / ".robocop"
+    robocop_config.write_text("--exclude missing-doc-test-case\n")
+
+    source = """
+*** Test Cases ***
+Test
+    Fail
+
+"""
+    files = []
+    for name in ("a.robot", "b.robot"):
+        filename = str(root / name)
+        with open(filename, "w") as stream:
+            stream.write(source)
+        files.append((get_model(filename), filename, source))
+
+    def get_rule_ids(diagnostics):
+        return sorted(diagnostic["code"] for diagnostic in diagnostics)
+
+    missing_doc_test_case = "0202"
+    missing_doc_suite = "0203"
+
+    runner = get_robocop_runner(root, files[0][1])
+    assert get_robocop_runner(root, files[1][1]) is runner
+
+    diagnostics = collect_robocop_diagnostics_batch(root, files)
+    assert len(diagnostics) == 2
+    assert missing_doc_test_case not in get_rule_ids(diagnostics[0])
+    assert get_rule_ids(diagnostics[0]) == get_rule_ids(diagnostics[1])
+    assert get_robocop_runner(root, files[0][1]) is runner
+
+    # Changing the configuration creates a new runner.
+    robocop_config.write_text("--exclude missing-doc-suite\n")
+    new_runner = get_robocop_runner(root, files[0][1])
+    assert new_runner is not runner
+    diagnostics = collect_robocop_diagnostics_batch(root, files[:1])
+    assert missing_doc_test_case in get_rule_ids(diagnostics[0])
+    assert missing_doc_suite not in get_rule_ids(diagnostics[0])
@@ -67,3 +67,110 @@ def test_document_from_file(workspace, workspace_dir, cases):
 
     # The old one in memory doesn't change after the file is removed
     assert cached_doc3.source == "new contents"
+
+
+def test_get_ast_incremental():
+    from robotframework_ls.impl.robot_workspace import RobotDocument
+    from robotframework_ls.impl import ast_utils
+    from robot.api import get_model
+    import io
+
+    def ast_to_str(ast):
+        stream = io.StringIO()
+        ast_utils.print_ast(ast, stream=stream)
+        return stream.getvalue()
+
+    def apply_change(doc, line, col, endline, endcol, text):
+        new_doc = RobotDocument(doc.uri, "")
+        new_doc._set_contents_from(doc)
+        new_doc.apply_change(
+            {
+                "range": {
+                    "start": {"line": line, "character": col},
+                    "end": {"line": endline, "character": endcol},
+                },
+                "text": text,
+            }
+        )
+        return new_doc
+
+    d = RobotDocument(
+        uri="unkwown",
+        source="""*** Test Cases ***
+Test 1
+    Log    a
+
+Test 2
+    Log    b
+
+*** Keywords ***
+My Keyword
+    Log    c
+""",
+    )
+    ast = d.get_ast()
+
+    # Change inside a test case (adding lines).
+    d = apply_change(d, 2, 13, 2, 13, "\n    Log    a2")
+    new_ast = d.get_ast()
+    assert ast_to_str(new_ast) == ast_to_str(get_model(d.source))
+    assert new_ast.sections[0].header is ast.sections[0].header
+    # The previous AST must not be changed.
+    assert "a2" not in ast_to_str(ast)
+
+    # Change which adds a new test case (needs a full parse).
+    ast = new_ast
+    d = apply_change(d, 6, 13, 6, 13, "\nTest 3\n    Log    b2")
+    new_ast = d.get_ast()
+    assert ast_to_str(new_ast) == ast_to_str(get_model(d.source))
+    assert len(new_ast.sections[0].body) == 3
+
+    # Change in the keyword (the test cases are kept).
+    ast = new_ast
+    d = apply_change(d, 12, 4, 12, 7, "No Operation")
+    new_ast = d.get_ast()
+    assert ast_to_str(new_ast) == ast_to_str(get_model(d.source))
+    assert new_ast.sections[0] is ast.sections[0]
+
+
+def test_get_ast_incremental_test_template():
+    from robotframework_ls.impl.robot_workspace import RobotDocument
+    from robotframework_ls.impl import ast_utils
+    from robot.api import get_model
+    import io
+
+    def ast_to_str(ast):
+        stream = io.StringIO()
+        ast_utils.print_ast(ast, stream=stream)
+        return stream.getvalue()
+
+    d = RobotDocument(
+        uri="unkwown",
+        source="""*** Settings ***
+Test Template    Log Many
+
+*** Test Cases ***
+Test 1
+    a    b
+
+Test 2
+    c    d
+""",
+    )
+    d.get_ast()
+
+    new_doc = RobotDocument(d.uri, "")
+    new_doc._set_contents_from(d)
+    new_doc.apply_change(
+        {
+            "range": {
+                "start": {"line": 5, "character": 10},
+                "end": {"line": 5, "character": 10},
+            },
+            "text": "    b2",
+        }
+    )
+    new_ast = new_doc.get_ast()
+    # The rows are template arguments (not keyword calls).
+    assert ast_to_str(new_ast) == ast_to_str(get_model(new_doc.source))
+    assert "TemplateArguments" in ast_to_str(new_ast)
@@ -707,3 +707,62 @@ Some keyword
             ("END", "control"),
         ],
     )
+
+
+def test_semantic_highlighting_range(workspace):
+    from robotframework_ls.impl.completion_context import CompletionContext
+    from robotframework_ls.impl.semantic_tokens import semantic_tokens_range
+
+    workspace.set_root("case1")
+    doc = workspace.put_doc("case1.robot")
+    doc.source = """*** Settings ***
+Library   my.lib
+
+*** Keywords ***
+Some Keyword
+    Log    ${arg1}
+
+Another Keyword
+    Clear All Highlights
+"""
+    context = CompletionContext(doc, workspace=workspace.ws)
+    semantic_tokens = semantic_tokens_range(
+        context,
+        {"start": {"line": 5, "character": 0}, "end": {"line": 7, "character": 0}},
+    )
+    check(
+        (semantic_tokens, doc),
+        [
+            ("Log", "keywordNameCall"),
+            ("${", "variableOperator"),
+            ("arg1", "variable"),
+            ("}", "variableOperator"),
+            ("Another Keyword", "keywordNameDefinition"),
+        ],
+    )
+
+
+def test_semantic_highlighting_edits():
+    from robotframework_ls.impl.semantic_tokens import compute_semantic_tokens_edits
+
+    def apply_edits(data, edits):
+        data = data[:]
+        for edit in reversed(edits):
+            data[edit["start"] : edit["start"] + edit["deleteCount"]] = edit["data"]
+        return data
+
+    previous = [0, 0, 16, 2, 0, 1, 0, 7, 3, 0, 0, 10, 6, 4, 0, 2, 0, 16, 2, 0]
+    assert compute_semantic_tokens_edits(previous, previous) == []
+
+    for new in (
+        [0, 0, 16, 2, 0, 1, 0, 7, 3, 0, 0, 10, 8, 4, 0, 2, 0, 16, 2, 0],
+        [0, 0, 16, 2, 0, 1, 0, 7, 3, 0, 2, 0, 16, 2, 0],
+        [0, 0, 16, 2, 0, 1, 0, 7, 3, 0, 0, 10, 6, 4, 0, 0, 1, 1, 4, 0]
+        + [2, 0, 16, 2, 0],
+        [],
+    ):
+        edits = compute_semantic_tokens_edits(previous, new)
+        assert len(edits) == 1
+        assert edits[0]["start"] % 5 == 0
+        assert edits[0]["deleteCount"] % 5 == 0
+        assert apply_edits(previous, edits) == new
@@ -171,3 +171,91 @@ def test_server_manager_dont_forward_setting_unless_changed(
         "textDocument/didOpen": 1,
         "completeAll": 3,
     }
+
+
+class ResolveInterpreterFromDictInTest(object):
+    # doc uri -> (interpreter id, python exe)
+    doc_uri_to_interpreter: dict = {}
+
+    @implements(EPResolveInterpreter.get_interpreter_info_for_doc_uri)
+    def get_interpreter_info_for_doc_uri(self, doc_uri) -> Optional[IInterpreterInfo]:
+        found = self.doc_uri_to_interpreter.get(doc_uri)
+        if found is None:
+            return None
+        interpreter_id, python_exe = found
+        return DefaultInterpreterInfo(interpreter_id, python_exe, None, [])
+
+    def __typecheckself__(self) -> None:
+        from robocorp_ls_core.protocols import check_implements
+
+        _: EPResolveInterpreter = check_implements(self)
+
+
+def test_server_manager_share_and_limit_apis(pm, server_manager, config) -> None:
+    import subprocess
+
+    pm.unregister(EPResolveInterpreter)
+    pm.register(EPResolveInterpreter, ResolveInterpreterFromDictInTest)
+    doc_uri_to_interpreter = ResolveInterpreterFromDictInTest.doc_uri_to_interpreter
+    doc_uri_to_interpreter.clear()
+    doc_uri_to_interpreter.update(
+        {
+            "uri_a1": ("a1", "python_exe_a"),
+            "uri_a2": ("a2", "python_exe_a"),
+            "uri_b": ("b", "python_exe_b"),
+            "uri_c": ("c", "python_exe_c"),
+        }
+    )
+    config.update({"robot.maxApiProcesses": 6})
+    server_manager.set_config(config)
+
+    # Different interpreter ids with the same python executable share the apis.
+    apis_a = server_manager._get_apis_for_doc_uri("uri_a1")
+    assert server_manager._get_apis_for_doc_uri("uri_a2") is apis_a
+    assert apis_a.interpreter_ids == {"a1", "a2"}
+    apis_b = server_manager._get_apis_for_doc_uri("uri_b")
+    assert apis_b is not apis_a
+    assert len(server_manager._id_to_apis) == 2
+
+    processes = []
+
+    def fake_start(apis):
+        # Simulate that the processes were started.
+        for api in apis:
+            process = subprocess.Popen(
+                [sys.executable, "-c", "import time;time.sleep(30)"]
+            )
+            processes.append(process)
+            api._server_process = process
+
+    try:
+        fake_start(apis_a)
+        fake_start(apis_b)
+        assert server_manager._get_apis_for_doc_uri("uri_b") is apis_b
+
+        # The limit is reached: the least recently used apis are stopped.
+        apis_c = server_manager._get_apis_for_doc_uri("uri_c")
+        assert apis_a.stopped
+        assert apis_a.count_running() == 0
+        assert not apis_b.stopped
+        assert apis_b.count_running() == 3
+        assert len(server_manager._id_to_apis) == 3
+
+        # Using it again makes it available again.
+        assert server_manager._get_apis_for_doc_uri("uri_a1") is apis_a
+        assert not apis_a.stopped
+
+        # When no interpreter id references the apis they're removed.
+        doc_uri_to_interpreter["uri_b"] = ("b", "python_exe_c")
+        assert server_manager._get_apis_for_doc_uri("uri_b") is apis_c
+        assert not apis_b.interpreter_ids
+        fake_start(apis_c)
+        server_manager._get_apis_for_doc_uri("uri_a1")
+        assert apis_b.count_running() == 0
+        assert apis_b not in server_manager._id_to_apis.values()
+        assert apis_c.count_running() == 3
+    finally:
+        for process in processes:
+            if process.poll() is None:
+                process.kill()
+            process.wait()
@@ -617,6 +617,51 @@ def test_code_format_integrated(
     assert ret["result"] == []
 
 
+@pytest.mark.parametrize(
+    "formatter",
+    [OPTION_ROBOT_CODE_FORMATTER_ROBOTIDY, OPTION_ROBOT_CODE_FORMATTER_BUILTIN_TIDY],
+)
+def test_range_code_format_integrated(language_server, ws_root_path, formatter):
+    if formatter == OPTION_ROBOT_CODE_FORMATTER_BUILTIN_TIDY:
+        try:
+            from robot.tidy import Tidy
+        except ImportError:
+            pytest.skip("robot.tidy is no longer available.")
+
+    language_server.initialize(ws_root_path, process_id=os.getpid())
+    uri = "untitled:Untitled-1"
+    language_server.open_doc(uri, 1)
+    language_server.settings({"settings": {"robot.codeFormatter": formatter}})
+    language_server.change_doc(
+        uri,
+        2,
+        "*** Test Cases ***\nTest 1\n    Log  1\n\nTest 2\n    Log  2\n",
+    )
+    ret = language_server.request(
+        {
+            "jsonrpc": "2.0",
+            "id": language_server.next_id(),
+            "method": "textDocument/rangeFormatting",
+            "params": {
+                "textDocument": {"uri": uri},
+                "range": {
+                    "start": {"line": 4, "character": 0},
+                    "end": {"line": 5, "character": 5},
+                },
+            },
+        }
+    )
+    assert ret["result"] == [
+        {
+            "range": {
+                "start": {"line": 5, "character": 9},
+                "end": {"line": 5, "character": 9},
+            },
+            "newText": "  ",
+        }
+    ]
+
+
 def test_find_definition_integrated_library(
     language_server: ILanguageServerClient, cases, workspace_dir, data_regression
 ):
@@ -783,6 +828,65 @@ Log It2
     data_regression.check(result)
 
 
+def test_semantic_tokens_delta_integrated(
+    language_server_io: ILanguageServerClient, ws_root_path
+):
+    language_server = language_server_io
+
+    language_server.initialize(ws_root_path, process_id=os.getpid())
+    uri = "untitled:Untitled-1"
+    txt = """
+*** Test Cases ***
+Log It
+    Log    Something
+"""
+    language_server.open_doc(uri, 1, txt)
+
+    def request(method, **params):
+        params["textDocument"] = {"uri": uri}
+        return language_server.request(
+            {
+                "jsonrpc": "2.0",
+                "id": language_server.next_id(),
+                "method": method,
+                "params": params,
+            }
+        )["result"]
+
+    full = request("textDocument/semanticTokens/full")
+    assert full["resultId"]
+    assert full["data"]
+
+    language_server.change_doc(uri, 2, txt + "    Log    Another\n")
+    delta = request(
+        "textDocument/semanticTokens/full/delta", previousResultId=full["resultId"]
+    )
+    assert delta["resultId"] != full["resultId"]
+    edits = delta["edits"]
+    assert len(edits) == 1
+    data = full["data"][:]
+    data[edits[0]["start"] : edits[0]["start"] + edits[0]["deleteCount"]] = edits[0][
+        "data"
+    ]
+    assert data == request("textDocument/semanticTokens/full")["data"]
+
+    # Unknown previous result: the full result is provided.
+    full_again = request(
+        "textDocument/semanticTokens/full/delta", previousResultId="unknown"
+    )
+    assert full_again["data"] == data
+
+    in_range = request(
+        "textDocument/semanticTokens/range",
+        range={
+            "start": {"line": 4, "character": 0},
+            "end": {"line": 4, "character": 0},
+        },
+    )
+    # Only 'Log' and 'Another'
+    assert len(in_range["data"]) == 10
+
+
 def test_code_lens_integrated(
     language_server_io: ILanguageServerClient, ws_root_path, data_regression
 ):
@@ -839,6 +943,42 @@ Log It2
     check_code_lens_data_regression(data_regression, found)
 
 
+def test_lint_workspace_integrated(
+    language_server_io: ILanguageServerClient, ws_root_path
+):
+    from robocorp_ls_core import uris
+    from robocorp_ls_core.unittest_tools.fixtures import TIMEOUT
+
+    language_server = language_server_io
+
+    target_robot = os.path.join(ws_root_path, "my", "target.robot")
+    os.makedirs(os.path.dirname(target_robot))
+    with open(target_robot, "w") as stream:
+        stream.write(
+            """
+*** Test Cases ***
+Test
+    Undefined Keyword
+"""
+        )
+
+    language_server.initialize(ws_root_path, process_id=os.getpid())
+    message_matcher = language_server.obtain_pattern_message_matcher(
+        {"method": "textDocument/publishDiagnostics"}
+    )
+    ret = language_server.execute_command("robot.lintWorkspace", [])
+    stats = ret["result"]
+    assert stats["files"] == 1
+    assert stats["diagnostics"] == 1
+
+    assert message_matcher.event.wait(TIMEOUT)
+    params = message_matcher.msg["params"]
+    assert uris.to_fs_path(params["uri"]) == target_robot
+    assert [d["message"] for d in params["diagnostics"]] == [
+        "Undefined keyword: Undefined Keyword."
+    ]
+
+
 def test_list_tests_integrated(
     language_server_io: ILanguageServerClient, ws_root_path, data_regression
 ):
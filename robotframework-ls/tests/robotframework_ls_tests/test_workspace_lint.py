@@ -0,0 +1,124 @@
+def test_workspace_lint_create_shards():
+    from robotframework_ls.impl.workspace_lint import create_shards
+    from robotframework_ls.impl.workspace_lint import get_workers_count
+
+    assert create_shards([], 2) == []
+    assert create_shards(["b", "a"], 4) == [["a"], ["b"]]
+
+    doc_uris = ["uri%03d" % i for i in range(200)]
+    shards = create_shards(list(reversed(doc_uris)), 2)
+    assert len(shards) == 10
+    assert [uri for shard in shards for uri in shard] == doc_uris
+    assert get_workers_count(shards, 2) == 2
+    assert get_workers_count(shards[:1], 2) == 1
+
+
+def test_workspace_lint(tmpdir):
+    from robocorp_ls_core import uris
+    from robotframework_ls.impl.workspace_lint import lint_workspace
+
+    root = tmpdir.join("ws")
+    root.join("resource.resource").write_text(
+        """*** Keywords ***
+My Keyword
+    Log    ok
+""",
+        "utf-8",
+        ensure=True,
+    )
+    root.join("good.robot").write_text(
+        """*** Settings ***
+Resource    resource.resource
+
+*** Test Cases ***
+Test
+    My Keyword
+""",
+        "utf-8",
+    )
+    root.join("sub", "bad.robot").write_text(
+        """*** Test Cases ***
+Test
+    Undefined Keyword
+""",
+        "utf-8",
+        ensure=True,
+    )
+
+    root_uri = uris.from_fs_path(str(root))
+    doc_uris = [
+        uris.from_fs_path(str(root.join(*parts)))
+        for parts in (("resource.resource",), ("good.robot",), ("sub", "bad.robot"))
+    ]
+
+    found = {}
+
+    def on_file_linted(doc_uri, diagnostics):
+        assert doc_uri not in found
+        found[doc_uri] = diagnostics
+
+    stats = lint_workspace(
+        root_uri, [(root_uri, "ws")], doc_uris, {}, on_file_linted, max_workers=2
+    )
+    assert set(found) == set(doc_uris)
+    assert found[doc_uris[0]] == []
+    assert found[doc_uris[1]] == []
+    assert [d["message"] for d in found[doc_uris[2]]] == [
+        "Undefined keyword: Undefined Keyword."
+    ]
+    assert stats["files"] == 3
+    assert stats["filesWithDiagnostics"] == 1
+    assert stats["diagnostics"] == 1
+    assert stats["workers"] == 2
+
+
+def test_workspace_lint_open_docs(tmpdir):
+    from robocorp_ls_core import uris
+    from robotframework_ls.impl.workspace_lint import lint_workspace
+
+    root = tmpdir.join("ws")
+    root.join("resource.resource").write_text(
+        """*** Keywords ***
+My Keyword
+    Log    ok
+""",
+        "utf-8",
+        ensure=True,
+    )
+    root.join("case.robot").write_text(
+        """*** Settings ***
+Resource    resource.resource
+
+*** Test Cases ***
+Test
+    My Keyword
+""",
+        "utf-8",
+    )
+
+    root_uri = uris.from_fs_path(str(root))
+    resource_uri = uris.from_fs_path(str(root.join("resource.resource")))
+    case_uri = uris.from_fs_path(str(root.join("case.robot")))
+
+    found = {}
+
+    def on_file_linted(doc_uri, diagnostics):
+        found[doc_uri] = diagnostics
+
+    # The contents in memory (unsaved) are used for the open documents.
+    lint_workspace(
+        root_uri,
+        [(root_uri, "ws")],
+        [resource_uri, case_uri],
+        {},
+        on_file_linted,
+        max_workers=1,
+        doc_uri_to_source={
+            resource_uri: """*** Keywords ***
+My Renamed Keyword
+    Log    ok
+"""
+        },
+    )
+    assert found[resource_uri] == []
+    assert [d["message"] for d in found[case_uri]] == ["Undefined keyword: My Keyword."]
@@ -68,3 +68,51 @@ def test_workspace_symbols_same_basename(workspace, libspec_manager):
 
     check_symbol(symbols, "In Lib 1")
     check_symbol(symbols, "In Lib 2")
+
+
+def test_symbols_cache_persistence(workspace, workspace_dir, cases, tmpdir):
+    from robocorp_ls_core.cache import DirCache
+    from robotframework_ls.impl.completion_context import CompletionContext
+    from robotframework_ls.impl.robot_workspace import _compute_symbols_from_ast
+    from robotframework_ls.impl._symbols_cache_persistence import (
+        SymbolsCachePersistence,
+    )
+    import os
+    import time
+
+    cases.copy_to("case4", workspace_dir)
+    workspace.set_absolute_path_root(workspace_dir)
+
+    persistence = SymbolsCachePersistence(DirCache(str(tmpdir.join("index"))))
+    doc = workspace.get_doc("case4resource.txt")
+    assert persistence.load(doc) is None
+
+    symbols_cache = _compute_symbols_from_ast(CompletionContext(doc))
+    persistence.store(doc, symbols_cache)
+
+    loaded = persistence.load(doc)
+    assert loaded is not None
+    assert loaded.get_json_list() == symbols_cache.get_json_list()
+    assert loaded.get_test_info() == symbols_cache.get_test_info()
+    assert [x.name for x in loaded.iter_keyword_info()] == [
+        x.name for x in symbols_cache.iter_keyword_info()
+    ]
+    assert [x.get_documentation() for x in loaded.iter_keyword_info()] == [
+        x.get_documentation() for x in symbols_cache.iter_keyword_info()
+    ]
+    assert loaded.has_keyword_usage("verifymodel") == symbols_cache.has_keyword_usage(
+        "verifymodel"
+    )
+
+    # Documents opened in the editor are never persisted/loaded.
+    opened_doc = workspace.put_doc("case4resource.txt", doc.source)
+    assert persistence.load(opened_doc) is None
+
+    # Changing the file on disk invalidates the entry.
+    time.sleep(0.05)
+    with open(doc.path, "a") as stream:
+        stream.write("\n*** Keywords ***\nNew Keyword\n    No Operation\n")
+    mtime = os.path.getmtime(doc.path) + 10
+    os.utime(doc.path, (mtime, mtime))
+    workspace.ws.remove_document(opened_doc.uri)
+    assert persistence.load(workspace.get_doc("case4resource.txt")) is None
@@ -1,4 +1,6 @@
 import path = require("path");
+import * as fs from "fs";
+import * as os from "os";
 import * as vscode from "vscode";
 import { logError, OUTPUT_CHANNEL } from "./channel";
 import { readLaunchTemplate } from "./run";
@@ -79,6 +81,24 @@ function nextRunId(): string {
 const runIdToTestRun = new Map<string, vscode.TestRun>();
 const runIdToDebugSession = new Map<string, vscode.DebugSession>();
 
+// Information on the test results file (see: `testResultsFile` in the launch)
+// of a given run.
+interface ITestResultsInfo {
+    // The file created for the run (removed when the run finishes).
+    createdFile: string | undefined;
+
+    // Results file -> offset up to which it was already read.
+    fileToOffset: Map<string, number>;
+
+    // Failure id -> failure details (requested on demand from the debug adapter).
+    failureToDetails: Map<string, Promise<any>>;
+
+    // Tests marked as failed only after the failure details are available.
+    pending: Promise<void>[];
+}
+
+const runIdToTestResultsInfo = new Map<string, ITestResultsInfo>();
+
 // Note: a test item id is uri a string such as:
 // `${uri} [${testName}]`
 const testItemIdToTestItem = new WeakValueMap<string, vscode.TestItem>();
@@ -385,6 +405,24 @@ export async function setupTestExplorerSupport() {
             debugConfiguration.env["RFLS_PRERUN_FILTER_TESTS"] = envFiltering;
         }
 
+        // When running (not debugging), the test results are written to a file
+        // and just the aggregated progress is sent (so that runs with many tests
+        // don't flood the client with events).
+        let testResultsInfo: ITestResultsInfo = {
+            createdFile: undefined,
+            fileToOffset: new Map(),
+            failureToDetails: new Map(),
+            pending: [],
+        };
+        if (!shouldDebug && debugConfiguration.testResultsFile === undefined) {
+            testResultsInfo.createdFile = path.join(
+                os.tmpdir(),
+                `robotframework_ls_test_results_${process.pid}_${lastRunId}.ndjson`
+            );
+            debugConfiguration.testResultsFile = testResultsInfo.createdFile;
+        }
+        runIdToTestResultsInfo.set(runId, testResultsInfo);
+
         let debugSessionOptions: vscode.DebugSessionOptions = { "noDebug": !shouldDebug };
         let started = await vscode.debug.startDebugging(workspaceFolders[0], debugConfiguration, debugSessionOptions);
         return started;
@@ -398,10 +436,19 @@ export async function setupTestExplorerSupport() {
         runHandler(true, request, token);
     });
 
-    function handleTestRunFinished(runId: string) {
+    async function handleTestRunFinished(runId: string) {
         if (runIdToDebugSession.has(runId)) {
             runIdToDebugSession.delete(runId);
         }
+        const testResultsInfo = runIdToTestResultsInfo.get(runId);
+        if (testResultsInfo) {
+            runIdToTestResultsInfo.delete(runId);
+            // Wait for the failure details which were still being requested.
+            await Promise.all(testResultsInfo.pending);
+            if (testResultsInfo.createdFile) {
+                fs.unlink(testResultsInfo.createdFile, () => {});
+            }
+        }
         if (runIdToTestRun.has(runId)) {
             const testRun = runIdToTestRun.get(runId);
             runIdToTestRun.delete(runId);
@@ -447,6 +494,13 @@ export async function setupTestExplorerSupport() {
                     case "endTest":
                         handleTestEnd(testRun, event);
                         break;
+                    case "testProgress": {
+                        const testResultsInfo = runIdToTestResultsInfo.get(runId);
+                        if (testResultsInfo) {
+                            handleTestProgress(testRun, testResultsInfo, event);
+                        }
+                        break;
+                    }
                     case "logMessage":
                         handleLogMessage(testRun, event);
                         break;
@@ -535,13 +589,13 @@ function handleTestStart(testRun: vscode.TestRun, event: vscode.DebugSessionCust
     }
 }
 
-function failedKeywordsToTestMessage(event: vscode.DebugSessionCustomEvent): vscode.TestMessage[] {
+function failedKeywordsToTestMessage(body: any): vscode.TestMessage[] {
     let messages: vscode.TestMessage[] = [];
-    let msg = event.body.message;
+    let msg = body.message;
     if (!msg) {
         msg = "";
     }
-    let failedKeywords = event.body.failed_keywords;
+    let failedKeywords = body.failed_keywords;
     if (failedKeywords) {
         for (const failed of failedKeywords) {
             let errorMsg = "";
@@ -580,6 +634,99 @@ function handleSuiteEnd(testRun: vscode.TestRun, event: vscode.DebugSessionCusto
     markTestRun(testItem, uriStr, testRun, event);
 }
 
+function readTestResults(filename: string, start: number, end: number): any[] {
+    const ret = [];
+    if (end <= start) {
+        return ret;
+    }
+    const buffer = Buffer.alloc(end - start);
+    const fd = fs.openSync(filename, "r");
+    try {
+        fs.readSync(fd, buffer, 0, buffer.length, start);
+    } finally {
+        fs.closeSync(fd);
+    }
+    for (const line of buffer.toString("utf-8").split("\n")) {
+        if (line.length > 0) {
+            ret.push(JSON.parse(line));
+        }
+    }
+    return ret;
+}
+
+function handleTestProgress(
+    testRun: vscode.TestRun,
+    testResultsInfo: ITestResultsInfo,
+    event: vscode.DebugSessionCustomEvent
+) {
+    const resultsFile: string = event.body.resultsFile;
+    const resultsOffset: number = event.body.resultsOffset;
+    const offset = testResultsInfo.fileToOffset.get(resultsFile) || 0;
+
+    let records: any[];
+    try {
+        records = readTestResults(resultsFile, offset, resultsOffset);
+    } catch (err) {
+        logError("Error reading test results from: " + resultsFile, err, "TEST_RESULTS_READ");
+        return;
+    }
+    testResultsInfo.fileToOffset.set(resultsFile, resultsOffset);
+
+    for (const record of records) {
+        if (record.name === undefined) {
+            // Failure details: only loaded through `testFailureDetails` when needed.
+            continue;
+        }
+        const testId = computeTestId(vscode.Uri.file(record.source).toString(), record.name);
+        const testItem = testItemIdToTestItem.get(testId);
+        if (!testItem) {
+            OUTPUT_CHANNEL.appendLine("Did not find test item: " + testId);
+            continue;
+        }
+        switch (record.status) {
+            case "SKIP":
+                testRun.skipped(testItem);
+                break;
+            case "PASS":
+                testRun.passed(testItem, record.elapsed);
+                break;
+            default:
+                testResultsInfo.pending.push(markTestFailed(testRun, testResultsInfo, event.session, testItem, record));
+                break;
+        }
+    }
+}
+
+async function markTestFailed(
+    testRun: vscode.TestRun,
+    testResultsInfo: ITestResultsInfo,
+    session: vscode.DebugSession,
+    testItem: vscode.TestItem,
+    record: any
+) {
+    let details: any = { "message": "" };
+    if (record.failure) {
+        // The same failure may be shared by many tests: request it only once.
+        let promise = testResultsInfo.failureToDetails.get(record.failure);
+        if (promise === undefined) {
+            promise = Promise.resolve(session.customRequest("testFailureDetails", { "failure": record.failure }));
+            testResultsInfo.failureToDetails.set(record.failure, promise);
+        }
+        try {
+            details = await promise;
+        } catch (err) {
+            logError("Error getting failure details for: " + testItem.id, err, "TEST_FAILURE_DETAILS");
+        }
+    }
+
+    const messages = failedKeywordsToTestMessage(details);
+    if (record.status === "FAIL") {
+        testRun.failed(testItem, messages, record.elapsed);
+    } else {
+        testRun.errored(testItem, messages, record.elapsed);
+    }
+}
+
 function handleTestEnd(testRun: vscode.TestRun, event: vscode.DebugSessionCustomEvent) {
     const testUriStr = vscode.Uri.file(event.body.source).toString();
     const testName = event.body.name;
@@ -605,10 +752,10 @@ function markTestRun(
                 testRun.passed(testItem, event.body.elapsedtime);
                 break;
             case "FAIL":
-                testRun.failed(testItem, failedKeywordsToTestMessage(event), event.body.elapsedtime);
+                testRun.failed(testItem, failedKeywordsToTestMessage(event.body), event.body.elapsedtime);
                 break;
             default:
-                testRun.errored(testItem, failedKeywordsToTestMessage(event), event.body.elapsedtime);
+                testRun.errored(testItem, failedKeywordsToTestMessage(event.body), event.body.elapsedtime);
                 break;
         }
     }